@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import struct
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+# Asset manifest.
+# tools/build_asset_manifest.py walks the asset folders once and writes
+# data/asset_manifest.json (relative path, size, sha1, dimensions, top folder,
+# normalized name). At runtime the manifest is read in one go on first use and
+# every existence check / path resolution is a dict lookup: no filesystem
+# probing, and the Windows absolute paths baked into content tables
+# (C:\Users\...\Minefut\cards\...) resolve to the bundled file on any OS.
+# Without a manifest the folders are scanned once instead (no hashes).
+# The manifest is tracked and can lag behind the folders: a project-relative
+# path it doesn't list gets one is_file() probe, memoized, so an image added
+# since the last build still shows (and the next build picks it up).
+
+ROOT = Path(__file__).resolve().parents[1]
+MANIFEST_FILE = ROOT / 'data' / 'asset_manifest.json'
+ASSET_DIRS = ('cards', 'Fond', 'assets', 'data')
+IMAGE_EXTS = ('.png', '.jpg', '.jpeg')
+MANIFEST_VERSION = 1
+
+_loaded = False
+_by_path: Dict[str, Dict] = {}  # path_key(rel) -> entry
+_by_name: Dict[str, List[Dict]] = {}  # name_key(stem) -> entries
+_resolved: Dict[str, Optional[Path]] = {}
+_probed: Dict[str, Optional[Dict]] = {}  # path_key(rel) -> entry found on disk, or None
+
+
+def _fold(s: str) -> str:
+    try:
+        s = unicodedata.normalize('NFKD', s)
+        s = ''.join(c for c in s if not unicodedata.combining(c))
+    except Exception:
+        pass
+    return s.lower()
+
+
+def name_key(s: str) -> str:
+    """Accent/case/separator-insensitive key ('Jérôme Boateng' -> 'jeromeboateng')."""
+    return re.sub(r"[\s\-_.'\"#]+", '', _fold(s or ''))
+
+
+def path_key(rel: str) -> str:
+    # accents and doubled spaces vary between the tables and the files on disk
+    return re.sub(r'\s+', ' ', _fold(rel.replace('\\', '/')).strip('/'))
+
+
+# ---- building ---- #
+
+def _image_size(path: Path, head: bytes):
+    if head[:8] == b'\x89PNG\r\n\x1a\n' and len(head) >= 24:
+        return struct.unpack('>II', head[16:24])
+    try:
+        import pygame
+        img = pygame.image.load(str(path))
+        return img.get_size()
+    except Exception:
+        return (0, 0)
+
+
+def _entry(path: Path, rel: str, with_hash: bool) -> Dict:
+    parts = rel.split('/')
+    if parts[0] == 'data' and len(parts) > 2 and parts[1] == 'avatars':
+        folder = '/'.join(parts[2:-1])  # avatars/<rarity>/file
+    else:
+        folder = '/'.join(parts[:-1])
+    entry = {
+        'path': rel,
+        'size': path.stat().st_size,
+        'folder': folder.lower(),
+        'name': name_key(path.stem),
+    }
+    if with_hash:
+        data = path.read_bytes()
+        entry['sha1'] = hashlib.sha1(data).hexdigest()
+        entry['w'], entry['h'] = _image_size(path, data[:24])
+    return entry
+
+
+def scan(with_hash: bool = True) -> List[Dict]:
+    """Walk ASSET_DIRS and describe every image (sorted by path)."""
+    out: List[Dict] = []
+    for top in ASSET_DIRS:
+        base = ROOT / top
+        if not base.is_dir():
+            continue
+        for dirpath, dirnames, filenames in os.walk(base):
+            dirnames.sort()
+            for fn in sorted(filenames):
+                if os.path.splitext(fn)[1].lower() not in IMAGE_EXTS:
+                    continue
+                p = Path(dirpath) / fn
+                rel = unicodedata.normalize('NFC', p.relative_to(ROOT).as_posix())
+                try:
+                    out.append(_entry(p, rel, with_hash))
+                except Exception:
+                    continue
+    out.sort(key=lambda e: e['path'])
+    return out
+
+
+def write_manifest(entries: List[Dict]) -> Path:
+    MANIFEST_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with MANIFEST_FILE.open('w', encoding='utf-8') as f:
+        json.dump({'version': MANIFEST_VERSION, 'assets': entries}, f, indent=1, ensure_ascii=False)
+    return MANIFEST_FILE
+
+
+# ---- runtime ---- #
+
+def _ensure() -> None:
+    global _loaded
+    if _loaded:
+        return
+    _loaded = True
+    entries = None
+    try:
+        with MANIFEST_FILE.open('r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict) and data.get('version') == MANIFEST_VERSION:
+            entries = data.get('assets')
+    except Exception:
+        entries = None
+    if not isinstance(entries, list):
+        entries = scan(with_hash=False)
+    _index(entries)
+
+
+def _add(e: Dict) -> None:
+    _by_path[path_key(e['path'])] = e
+    _by_name.setdefault(e.get('name') or name_key(Path(e['path']).stem), []).append(e)
+
+
+def _index(entries: Iterable[Dict]) -> None:
+    _by_path.clear()
+    _by_name.clear()
+    _resolved.clear()
+    _probed.clear()
+    for e in entries:
+        try:
+            _add(e)
+        except Exception:
+            continue
+
+
+def _probe(rel: str) -> Optional[Dict]:
+    """Entry for an image the manifest doesn't list yet (one memoized probe)."""
+    key = path_key(rel)
+    if key in _probed:
+        return _probed[key]
+    e = None
+    rel = unicodedata.normalize('NFC', rel.replace('\\', '/').strip('/'))
+    parts = rel.split('/')
+    if parts[0] in ASSET_DIRS and '..' not in parts and os.path.splitext(rel)[1].lower() in IMAGE_EXTS:
+        p = ROOT / rel
+        try:
+            if p.is_file():
+                e = _entry(p, rel, with_hash=False)
+                _add(e)
+        except Exception:
+            e = None
+    _probed[key] = e
+    return e
+
+
+def reload() -> None:
+    """Re-read the manifest (after running the build tool mid-session)."""
+    global _loaded
+    _loaded = False
+    _ensure()
+
+
+def entry(rel: str) -> Optional[Dict]:
+    _ensure()
+    e = _by_path.get(path_key(rel))
+    return e if e is not None else _probe(rel)
+
+
+def exists(rel: str) -> bool:
+    return entry(rel) is not None
+
+
+def path(rel: str) -> Optional[Path]:
+    """Absolute path of a project-relative asset, or None if it isn't shipped."""
+    e = entry(rel)
+    return (ROOT / e['path']) if e is not None else None
+
+
+def size(rel: str):
+    """(w, h) from the manifest without decoding the image; None if unknown."""
+    e = entry(rel)
+    if e is None or not e.get('w'):
+        return None
+    return (int(e['w']), int(e['h']))
+
+
+def _relative(value: str) -> str:
+    v = value.replace('\\', '/')
+    low = v.lower()
+    # C:/Users/<someone>/Desktop/Minefut/cards/... -> cards/...
+    i = low.rfind('/minefut/')
+    if i >= 0:
+        return v[i + len('/minefut/'):]
+    try:
+        return Path(v).resolve().relative_to(ROOT).as_posix()
+    except Exception:
+        return v
+
+
+def resolve(value, prefixes=('', 'data/avatars/', 'data/')) -> Optional[Path]:
+    """Map a table value (relative, project-absolute or foreign absolute path)
+    to the shipped file, trying each prefix for relative values."""
+    if not value:
+        return None
+    raw = str(value)
+    hit = _resolved.get(raw, False)
+    if hit is not False:
+        return hit
+    _ensure()
+    rel = _relative(raw)
+    out = None
+    for pre in prefixes:
+        e = _by_path.get(path_key(pre + rel))
+        if e is None:
+            e = _probe(pre + rel)
+        if e is not None:
+            out = ROOT / e['path']
+            break
+    if out is None and os.path.isabs(rel):
+        # outside the project (user-provided file): one probe, memoized
+        try:
+            out = Path(rel) if Path(rel).is_file() else None
+        except Exception:
+            out = None
+    _resolved[raw] = out
+    return out
+
+
+def find(name: str, folders: Iterable[str] = (), under: str = '') -> Optional[Path]:
+    """First image whose normalized stem equals name's, restricted to entries
+    below `under` and, when given, to the listed folders (in that order)."""
+    _ensure()
+    cands = [e for e in _by_name.get(name_key(name), ()) if e['path'].startswith(under)]
+    if not cands:
+        return None
+    folders = [f.lower() for f in folders]
+    if not folders:
+        return ROOT / cands[0]['path']
+    for f in folders:
+        for e in cands:
+            if e['folder'] == f:
+                return ROOT / e['path']
+    return None
+
+
+def count() -> int:
+    _ensure()
+    return len(_by_path)
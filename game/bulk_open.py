@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from .cards import Card
+from .packs import generate_pack
+from . import db as game_db
+from . import wallet
+from . import xp
+from . import defi as defi_mod
+
+# Bulk pack opening.
+# N packs are generated in memory and committed together: one coin debit, one
+# collection write for all pulled cards, one XP write and one defi update
+# (debounced by defi itself). Opening one pack through the reveal screen
+# rewrites collection.json once per revealed card instead.
+
+BULK_COUNTS = (10, 50, 100)
+XP_PER_PACK = 10  # same reward as a single opening
+
+# summary order, best first; unknown rarities go last
+RARITY_ORDER = ('icon', 'otw', 'hero', 'world tour', 'or rare', 'or non rare')
+
+
+@dataclass
+class BulkResult:
+    pack: str
+    packs: int
+    coins: int
+    xp: int
+    cards: List[Card] = field(default_factory=list)
+    # [(card, copies)] one entry per distinct (name, rarity, rating), best first
+    summary: List[Tuple[Card, int]] = field(default_factory=list)
+
+
+def _rarity_rank(rarity: str) -> int:
+    try:
+        return RARITY_ORDER.index(rarity)
+    except ValueError:
+        return len(RARITY_ORDER)
+
+
+def summarize(cards: List[Card]) -> List[Tuple[Card, int]]:
+    """Group identical pulls and sort by rarity, then rating (desc), then name."""
+    groups: Dict[Tuple[str, str, int], List] = {}
+    for c in cards:
+        k = (c.name, c.rarity, int(c.rating))
+        g = groups.get(k)
+        if g is None:
+            groups[k] = [c, 1]
+        else:
+            g[1] += 1
+    out = [(c, n) for c, n in groups.values()]
+    out.sort(key=lambda t: (_rarity_rank(t[0].rarity), -int(t[0].rating), t[0].name))
+    return out
+
+
+def open_packs(pack: str, per_pack: int, price: int, n: int) -> Optional[BulkResult]:
+    """Open n packs of one type in a single commit; None if the wallet can't cover it."""
+    n = max(1, int(n))
+    total = int(price) * n
+    if not wallet.spend_coins(total):
+        return None
+    cards: List[Card] = []
+    for _ in range(n):
+        cards.extend(generate_pack(pack, per_pack))
+    try:
+        game_db.add_to_collection_by_names([c.name for c in cards])
+    except Exception:
+        pass
+    gained = XP_PER_PACK * n
+    try:
+        xp.add_xp(gained)
+    except Exception:
+        pass
+    try:
+        defi_mod.add_progress('coins_spent', total)
+        defi_mod.add_progress('pack_opened', n)
+    except Exception:
+        pass
+    return BulkResult(pack=pack, packs=n, coins=total, xp=gained, cards=cards, summary=summarize(cards))
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Hashable, Tuple
+
+import pygame
+
+# Card face compositor.
+# A card face (frame, rarity colors, texts, avatar, badges) is rendered once per
+# (style, card, size) into an SRCALPHA surface and then drawn with a single
+# blit. Keys carry everything the face depends on, so a changed card or size
+# simply misses the cache; old faces fall out of the LRU.
+
+_FACES_MAX = 768
+
+_FACES: 'OrderedDict[Hashable, pygame.Surface]' = OrderedDict()
+
+
+def card_key(card) -> Tuple:
+    """Identity of a Card for face caching (runtime position attrs excluded)."""
+    return (
+        getattr(card, 'name', ''),
+        getattr(card, 'rarity', ''),
+        getattr(card, 'rating', 0),
+        bool(getattr(card, 'otw', False)),
+        getattr(card, 'avatar_path', None),
+        tuple(getattr(card, 'bg_color', ()) or ()),
+    )
+
+
+def face(key: Hashable, size: Tuple[int, int], render: Callable[[pygame.Surface], None]) -> pygame.Surface:
+    """Return the cached face for (key, size), calling render(surf) on a miss."""
+    full = (key, int(size[0]), int(size[1]))
+    surf = _FACES.get(full)
+    if surf is not None:
+        _FACES.move_to_end(full)
+        return surf
+    surf = pygame.Surface((max(1, int(size[0])), max(1, int(size[1]))), pygame.SRCALPHA)
+    try:
+        render(surf)
+    except Exception:
+        pass  # keep whatever was drawn; a broken image shouldn't break the frame
+    _FACES[full] = surf
+    if len(_FACES) > _FACES_MAX:
+        _FACES.popitem(last=False)
+    return surf
+
+
+def invalidate(name: str = None) -> None:
+    """Drop cached faces (all, or those whose key mentions name)."""
+    if name is None:
+        _FACES.clear()
+        return
+    for k in [k for k in _FACES if name in _flatten(k[0])]:
+        del _FACES[k]
+
+
+def _flatten(key) -> tuple:
+    if isinstance(key, tuple):
+        out = ()
+        for part in key:
+            out += _flatten(part)
+        return out
+    return (key,)
+
+
+def count() -> int:
+    return len(_FACES)
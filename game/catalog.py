@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Compiled player catalog.
+# data/players.json is compiled (tools/build_catalog.py, or automatically when
+# db.save_players writes it) into data/players.cat: fixed-width little-endian
+# columns plus UTF-8 string tables, laid out as
+#   header | ids i32[n] | rating i16[n] | rarity u16[n] | by_id u32[n]
+#   | name/image/extra offsets u32[n+1] | rarity offsets u32[r+1]
+#   | name/image/extra/rarity strings
+# `by_id` is the row order sorted by player id (binary search for get()),
+# `extra` holds any fields beyond id/name/rating/rarity/image as JSON.
+# At runtime the file is mmap'ed read-only and wrapped in a CatalogView:
+# opening is constant time whatever the catalog size, rows are decoded on
+# access, and processes mapping the same file share its pages.
+# The header records the size and mtime of the players.json it was built
+# from; a stale or missing file is recompiled (or built in memory when data/
+# is read-only), so hand edits to players.json are still picked up.
+
+ROOT = Path(__file__).resolve().parents[1]
+SOURCE_FILE = ROOT / 'data' / 'players.json'
+CATALOG_FILE = ROOT / 'data' / 'players.cat'
+
+MAGIC = b'MFCAT\x00\x00\x01'
+FORMAT_VERSION = 1
+# magic, version, count, rarity count, source mtime_ns, source size,
+# then section offsets: ids, rating, rarity, by_id, the four offset arrays
+# (names, images, extras, rarity labels) and their four string tables
+_HEADER = struct.Struct('<8sIIIqq12I')
+_BASE_KEYS = ('id', 'name', 'rating', 'rarity', 'image')
+
+_view: Optional['CatalogView'] = None
+
+
+class CatalogError(ValueError):
+    pass
+
+
+# ---- compiling ---- #
+
+def _source_stamp(src: Path) -> Tuple[int, int]:
+    st = src.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _align(buf: bytearray) -> int:
+    buf.extend(b'\x00' * (-len(buf) % 8))
+    return len(buf)
+
+
+def pack(players: List[Dict], stamp: Tuple[int, int] = (0, 0)) -> bytes:
+    """Compile a players list (players.json rows) into catalog bytes."""
+    n = len(players)
+    ids: List[int] = []
+    ratings: List[int] = []
+    rar_codes: List[int] = []
+    rarities: List[str] = []
+    rar_index: Dict[str, int] = {}
+    names, images, extras, labels = bytearray(), bytearray(), bytearray(), bytearray()
+    name_offs, image_offs, extra_offs, rar_offs = [0], [0], [0], [0]
+
+    def put(s: str, offs: List[int], table: bytearray) -> None:
+        table.extend(s.encode('utf-8'))
+        offs.append(len(table))
+
+    for p in players:
+        try:
+            ids.append(int(p.get('id', 0)))
+        except Exception:
+            ids.append(0)
+        try:
+            ratings.append(max(-32768, min(32767, int(p.get('rating', 0)))))
+        except Exception:
+            ratings.append(0)
+        rar = str(p.get('rarity', '') or '')
+        code = rar_index.get(rar)
+        if code is None:
+            code = rar_index[rar] = len(rarities)
+            rarities.append(rar)
+        rar_codes.append(code)
+        put(str(p.get('name', '') or ''), name_offs, names)
+        put(str(p.get('image', '') or ''), image_offs, images)
+        extra = {k: v for k, v in p.items() if k not in _BASE_KEYS}
+        put(json.dumps(extra, ensure_ascii=False, separators=(',', ':')) if extra else '', extra_offs, extras)
+    for rar in rarities:
+        put(rar, rar_offs, labels)
+    by_id = sorted(range(n), key=lambda r: ids[r])
+
+    body = bytearray(b'\x00' * _HEADER.size)
+    sections = []
+    for fmt, values in (('<%di', ids), ('<%dh', ratings), ('<%dH', rar_codes), ('<%dI', by_id),
+                        ('<%dI', name_offs), ('<%dI', image_offs), ('<%dI', extra_offs), ('<%dI', rar_offs)):
+        sections.append(_align(body))
+        body += struct.pack(fmt % len(values), *values)
+    for table in (names, images, extras, labels):
+        sections.append(_align(body))
+        body += table
+    _HEADER.pack_into(body, 0, MAGIC, FORMAT_VERSION, n, len(rarities), stamp[0], stamp[1], *sections)
+    return bytes(body)
+
+
+def build(src: Path = SOURCE_FILE, dest: Path = CATALOG_FILE) -> int:
+    """Compile players.json into the catalog file. Returns the player count."""
+    with src.open('r', encoding='utf-8') as f:
+        players = json.load(f).get('players', [])
+    blob = pack(players, _source_stamp(src))
+    if dest == CATALOG_FILE:
+        invalidate()  # unmap before replacing the file (required on Windows)
+    tmp = dest.with_suffix('.tmp')
+    tmp.write_bytes(blob)
+    os.replace(tmp, dest)
+    return len(players)
+
+
+# ---- reading ---- #
+
+def _str(table, offs, i: int) -> str:
+    return bytes(table[offs[i]:offs[i + 1]]).decode('utf-8')
+
+
+class CatalogView:
+    """Read-only, index-addressed view over compiled catalog bytes.
+
+    view[i] is a fresh players.json-style dict; the columns (ids, ratings,
+    rarity_codes) are read-only memoryviews over the mapped file.
+    """
+
+    def __init__(self, buf, mm: Optional[mmap.mmap] = None):
+        self._mm = mm
+        self._buf = memoryview(buf)
+        if len(self._buf) < _HEADER.size:
+            raise CatalogError('truncated catalog')
+        (magic, version, n, nr, mtime, size,
+         o_ids, o_rat, o_rar, o_by, o_name, o_img, o_ext, o_rl,
+         s_name, s_img, s_ext, s_rl) = _HEADER.unpack_from(self._buf, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise CatalogError('not a catalog file (or an older format)')
+        self.stamp = (mtime, size)
+        self._n = n
+        b = self._buf
+        self.ids = b[o_ids:o_ids + 4 * n].cast('i')
+        self.ratings = b[o_rat:o_rat + 2 * n].cast('h')
+        self.rarity_codes = b[o_rar:o_rar + 2 * n].cast('H')
+        self._by_id = b[o_by:o_by + 4 * n].cast('I')
+        self._name_offs = b[o_name:o_name + 4 * (n + 1)].cast('I')
+        self._image_offs = b[o_img:o_img + 4 * (n + 1)].cast('I')
+        self._extra_offs = b[o_ext:o_ext + 4 * (n + 1)].cast('I')
+        self._names = b[s_name:s_name + self._name_offs[n]]
+        self._images = b[s_img:s_img + self._image_offs[n]]
+        self._extras = b[s_ext:s_ext + self._extra_offs[n]]
+        rl = b[o_rl:o_rl + 4 * (nr + 1)].cast('I')
+        self.rarities: Tuple[str, ...] = tuple(_str(b[s_rl:], rl, i) for i in range(nr))
+        rl.release()
+
+    def __len__(self) -> int:
+        return self._n
+
+    def name(self, i: int) -> str:
+        return _str(self._names, self._name_offs, i)
+
+    def image(self, i: int) -> str:
+        return _str(self._images, self._image_offs, i)
+
+    def rarity(self, i: int) -> str:
+        return self.rarities[self.rarity_codes[i]]
+
+    def __getitem__(self, i: int) -> Dict:
+        if i < 0:
+            i += self._n
+        if not 0 <= i < self._n:
+            raise IndexError(i)
+        row: Dict = {'id': self.ids[i], 'name': self.name(i), 'rating': self.ratings[i], 'rarity': self.rarity(i)}
+        img = self.image(i)
+        if img:
+            row['image'] = img
+        if self._extra_offs[i + 1] > self._extra_offs[i]:
+            row.update(json.loads(_str(self._extras, self._extra_offs, i)))
+        return row
+
+    def __iter__(self) -> Iterator[Dict]:
+        for i in range(self._n):
+            yield self[i]
+
+    def row_of(self, player_id: int) -> int:
+        """Row index of a player id, or -1 (binary search on the by_id column)."""
+        ids, by_id = self.ids, self._by_id
+        k = bisect_left(range(self._n), player_id, key=lambda j: ids[by_id[j]])
+        if k < self._n and ids[by_id[k]] == player_id:
+            return by_id[k]
+        return -1
+
+    def get(self, player_id: int) -> Optional[Dict]:
+        r = self.row_of(player_id)
+        return self[r] if r >= 0 else None
+
+    def close(self) -> None:
+        for attr in ('ids', 'ratings', 'rarity_codes', '_by_id', '_name_offs', '_image_offs', '_extra_offs', '_names', '_images', '_extras', '_buf'):
+            try:
+                getattr(self, attr).release()
+            except Exception:
+                pass
+        if self._mm is not None:
+            try:
+                self._mm.close()
+            except Exception:
+                pass  # a caller still holds a column; the map closes when it is dropped
+
+
+def _open(path: Path) -> Optional[CatalogView]:
+    try:
+        with path.open('rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    try:
+        return CatalogView(mm, mm)
+    except CatalogError:
+        mm.close()
+        return None
+
+
+def view() -> CatalogView:
+    """The shared catalog view, (re)compiling players.json when needed."""
+    global _view
+    if _view is not None:
+        return _view
+    try:
+        stamp = _source_stamp(SOURCE_FILE)
+    except OSError:
+        stamp = None
+    v = _open(CATALOG_FILE)
+    if v is not None and stamp is not None and v.stamp != stamp:
+        v.close()
+        v = None
+    if v is None and stamp is not None:
+        try:
+            build()
+            v = _open(CATALOG_FILE)
+        except Exception:
+            v = None
+        if v is None:
+            # read-only data dir: keep a compiled copy in memory instead
+            try:
+                with SOURCE_FILE.open('r', encoding='utf-8') as f:
+                    v = CatalogView(pack(json.load(f).get('players', []), stamp))
+            except Exception:
+                v = None
+    _view = v if v is not None else CatalogView(pack([]))
+    return _view
+
+
+def invalidate() -> None:
+    """Unmap the current view; the next view() reopens (and recompiles) the file."""
+    global _view
+    if _view is not None:
+        _view.close()
+        _view = None
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from . import db as game_db
+from . import ids
+
+# Multi-criteria queries over the interned catalog (game/ids.py) and the owned
+# collection. Static columns (rarity, rating, source) become bitmap indexes
+# (Python ints, bit i = card id i) once per catalog build; owned-count bitmaps
+# are rebuilt once per collection change. A query ANDs the bitmaps it needs,
+# sorts the survivors with the column arrays, and its result is cached until
+# the catalog or collection changes.
+
+SOURCES = ('packable', 'sbc_only', 'pass_only', 'defi_only', 'daily_only')
+SORTS = ('rating', 'name', 'count', 'recent')
+
+
+@dataclass(frozen=True)
+class Query:
+    rarities: FrozenSet[str] = frozenset()  # folded rarity labels; empty = any
+    min_rating: int = 0
+    max_rating: int = 999
+    min_owned: int = 0  # 1 = owned only
+    duplicates_only: bool = False  # owned >= 2
+    sources: FrozenSet[str] = frozenset()  # subset of SOURCES; empty = any
+    needle: str = ''
+    sort: str = 'rating'  # one of SORTS
+    descending: bool = True
+
+
+_static_gen = -1
+_all_bits = 0
+_rarity_bits: Dict[int, int] = {}
+_rating_bits: Dict[int, int] = {}
+_source_bits: Dict[str, int] = {}
+
+_owned_key: Optional[Tuple[int, int]] = None
+_owned_counts = array('i')
+_owned_bits: Dict[int, int] = {}
+_recent = array('i')
+
+_RESULTS_MAX = 32
+_results: Dict[Tuple, List[int]] = {}
+
+
+def _to_bits(cids) -> int:
+    buf = bytearray((ids.count() + 7) // 8)
+    for i in cids:
+        buf[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(buf, 'little')
+
+
+def _from_bits(bits: int) -> List[int]:
+    out: List[int] = []
+    if not bits:
+        return out
+    raw = bits.to_bytes((bits.bit_length() + 7) // 8, 'little')
+    for byte_idx, b in enumerate(raw):
+        if b:
+            base = byte_idx << 3
+            for k in range(8):
+                if b >> k & 1:
+                    out.append(base + k)
+    return out
+
+
+def _source_of(card: Dict) -> str:
+    for s in SOURCES[1:]:
+        if card.get(s):
+            return s
+    return 'packable'
+
+
+def _ensure_static() -> None:
+    global _static_gen, _all_bits
+    gen = ids.generation()
+    if gen == _static_gen:
+        return
+    n = ids.count()
+    by_rarity: Dict[int, List[int]] = {}
+    by_rating: Dict[int, List[int]] = {}
+    by_source: Dict[str, List[int]] = {}
+    for cid in range(n):
+        by_rarity.setdefault(ids.rarity_of(cid), []).append(cid)
+        by_rating.setdefault(ids.rating_of(cid), []).append(cid)
+        by_source.setdefault(_source_of(ids.card(cid)), []).append(cid)
+    _rarity_bits.clear()
+    _rating_bits.clear()
+    _source_bits.clear()
+    _rarity_bits.update({k: _to_bits(v) for k, v in by_rarity.items()})
+    _rating_bits.update({k: _to_bits(v) for k, v in by_rating.items()})
+    _source_bits.update({k: _to_bits(v) for k, v in by_source.items()})
+    _all_bits = (1 << n) - 1
+    _static_gen = gen
+    _results.clear()
+
+
+def _ensure_owned() -> None:
+    global _owned_key, _owned_counts, _recent
+    key = (ids.generation(), game_db.collection_version())
+    if key == _owned_key:
+        return
+    counts = ids.owned_by_base(game_db.load_collection())
+    obtained = game_db.load_obtained()
+    n = ids.count()
+    _owned_counts = array('i', (ids.owned_count(counts, cid) for cid in range(n)))
+    _recent = array('i', (obtained.get(ids.base_of(cid), 0) for cid in range(n)))
+    _owned_bits.clear()
+    _owned_key = key
+
+
+def _owned_at_least(k: int) -> int:
+    bits = _owned_bits.get(k)
+    if bits is None:
+        bits = _to_bits(cid for cid, c in enumerate(_owned_counts) if c >= k)
+        _owned_bits[k] = bits
+    return bits
+
+
+def owned_count(cid: int) -> int:
+    """Owned copies of a card id (by base name), as seen by the last query."""
+    _ensure_owned()
+    return _owned_counts[cid]
+
+
+def run(q: Query) -> List[int]:
+    """Card ids matching q, sorted. The list is cached; don't mutate it."""
+    _ensure_static()
+    _ensure_owned()
+    key = (q, _static_gen, _owned_key)
+    hit = _results.get(key)
+    if hit is not None:
+        return hit
+    bits = _all_bits
+    if q.rarities:
+        rb = 0
+        for r in q.rarities:
+            rb |= _rarity_bits.get(ids.rarity_id(r), 0)
+        bits &= rb
+    if q.min_rating > 0 or q.max_rating < 999:
+        rb = 0
+        for rating, b in _rating_bits.items():
+            if q.min_rating <= rating <= q.max_rating:
+                rb |= b
+        bits &= rb
+    if q.sources:
+        sb = 0
+        for s in q.sources:
+            sb |= _source_bits.get(s, 0)
+        bits &= sb
+    min_owned = max(q.min_owned, 2 if q.duplicates_only else 0)
+    if min_owned > 0:
+        bits &= _owned_at_least(min_owned)
+    if q.needle:
+        bits &= _to_bits(ids.search(q.needle))
+    out = _from_bits(bits)
+    # id order == catalog order (rating desc, name asc)
+    if q.sort == 'rating':
+        if not q.descending:
+            out.sort(key=lambda i: (ids.rating_of(i), ids.name_of(i)))
+    elif q.sort == 'name':
+        out.sort(key=ids.folded_name, reverse=q.descending)
+    elif q.sort == 'count':
+        out.sort(key=lambda i: _owned_counts[i], reverse=q.descending)
+    elif q.sort == 'recent':
+        out.sort(key=lambda i: _recent[i], reverse=q.descending)
+    if len(_results) >= _RESULTS_MAX:
+        _results.pop(next(iter(_results)))
+    _results[key] = out
+    return out
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+# Static content registry.
+# The content tables (SBC challenges, défis, season pass rewards, the 28-day
+# daily cycle and the reward-only special players) are authored as plain lists
+# and dicts in their modules. registry() freezes them once, at startup, into
+# tuples and read-only mappings indexed by id and by group, with the derived
+# data (pass card ratings, special-player catalog entries, unlock sources)
+# computed up front, so every lookup is a dict or tuple access.
+# Content is code, not save data: nothing here changes while the game runs.
+
+
+@dataclass(frozen=True)
+class Registry:
+    challenges: Tuple[Any, ...]  # sbc.SBCChallenge, authoring order
+    challenge_by_id: Mapping[str, Any]
+    challenge_index: Mapping[str, int]
+    challenge_series: Mapping[str, Tuple[str, ...]]  # 'busquets_eoe' -> its step ids
+    challenge_prev: Mapping[str, str]  # series step id -> the step that must be done first
+    defis: Tuple[Any, ...]  # defi.Defi, authoring order
+    defi_by_id: Mapping[str, Any]
+    defis_by_group: Mapping[str, Tuple[Any, ...]]
+    defi_groups: Tuple[str, ...]
+    passes: Mapping[str, Mapping[int, Any]]  # pass id -> level -> PassReward
+    pass_levels: Mapping[str, Tuple[int, ...]]  # pass id -> sorted reward levels
+    pass_unlocked_by: Mapping[str, Tuple[str, int]]  # pass id -> (source pass, level)
+    daily_rewards: Tuple[Mapping[str, Any], ...]  # day 1..28 at index 0..27
+    daily_cycle: Tuple[Mapping[str, Any], ...]  # same rewards with their 'day'
+    sbc_only: Tuple[Mapping[str, Any], ...]
+    defi_only: Tuple[Mapping[str, Any], ...]
+    pass_only: Tuple[Mapping[str, Any], ...]
+    daily_only: Tuple[Mapping[str, Any], ...]
+
+
+_registry: Optional[Registry] = None
+_STEP_RE = re.compile(r'^(.+)_\d+$')  # multi-step SBC ids end in _<step>
+
+
+def _frozen(d: Mapping) -> Mapping:
+    return MappingProxyType(dict(d))
+
+
+def _rows(items: Iterable[Mapping]) -> Tuple[Mapping[str, Any], ...]:
+    return tuple(_frozen(d) for d in items)
+
+
+def _build() -> Registry:
+    from . import daily_rewards, defi, sbc, season_pass
+
+    challenges = tuple(sbc.CHALLENGES)
+    series: Dict[str, list] = {}
+    for c in challenges:
+        m = _STEP_RE.match(c.id)
+        if m:
+            series.setdefault(m.group(1), []).append(c.id)
+    defis = tuple(defi.DEFI_LIST)
+    by_group: Dict[str, list] = {}
+    for d in defis:
+        by_group.setdefault(d.group, []).append(d)
+    passes = {pid: _frozen(rewards) for pid, rewards in season_pass.PASSES.items()}
+    unlocked_by: Dict[str, Tuple[str, int]] = {}
+    for pid, rewards in season_pass.PASSES.items():
+        for lvl, r in rewards.items():
+            if r.kind == 'unlock' and r.unlock_pass_id:
+                unlocked_by.setdefault(r.unlock_pass_id, (pid, lvl))
+    daily = _rows(daily_rewards._rewards_28())
+    return Registry(
+        challenges=challenges,
+        challenge_by_id=_frozen({c.id: c for c in challenges}),
+        challenge_index=_frozen({c.id: i for i, c in enumerate(challenges)}),
+        challenge_series=_frozen({k: tuple(v) for k, v in series.items()}),
+        challenge_prev=_frozen({b: a for ids in series.values() for a, b in zip(ids, ids[1:])}),
+        defis=defis,
+        defi_by_id=_frozen({d.id: d for d in defis}),
+        defis_by_group=_frozen({g: tuple(ds) for g, ds in by_group.items()}),
+        defi_groups=tuple(sorted(by_group)),
+        passes=_frozen(passes),
+        pass_levels=_frozen({pid: tuple(sorted(r)) for pid, r in passes.items()}),
+        pass_unlocked_by=_frozen(unlocked_by),
+        daily_rewards=daily,
+        daily_cycle=tuple(_frozen({**r, 'day': i}) for i, r in enumerate(daily, start=1)),
+        sbc_only=_rows(sbc._sbc_only_players()),
+        defi_only=_rows(defi._defi_only_players()),
+        pass_only=_rows(season_pass._pass_only_players()),
+        daily_only=_rows(daily_rewards._daily_only_players(daily)),
+    )
+
+
+def registry() -> Registry:
+    """The frozen content tables, built on first use (App builds them at startup)."""
+    global _registry
+    if _registry is None:
+        _registry = _build()
+    return _registry
@@ -1,18 +1,36 @@
 from __future__ import annotations
 
-import json
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Dict, Tuple, Optional, List
+from typing import Dict, Iterable, Mapping, Tuple, Optional, List
 
+from . import content
 from . import xp as xp_mod
 from . import db as game_db
 from . import wallet as wallet_mod
+from . import savefile
+from . import state_bus
 from . import timeutil as tz
 
 
-# Persistence file
-_STATE_PATH = Path(__file__).resolve().parents[1] / 'data' / 'daily_rewards.json'
+# Persistence (per-profile 'daily_rewards' save file)
+_DEFAULT_STATE = {
+    'last_claim_date': None,   # YYYY-MM-DD
+    'day_index': 0,            # 0 means not started; 1..28 active day
+    'cycles_completed': 0,
+}
+
+
+def _migrate_v1(data) -> Dict:
+    # legacy daily_rewards.json: fill missing keys
+    if not isinstance(data, dict):
+        return dict(_DEFAULT_STATE)
+    for k, v in _DEFAULT_STATE.items():
+        data.setdefault(k, v)
+    return data
+
+
+savefile.register('daily_rewards', _DEFAULT_STATE, [_migrate_v1])
 
 
 def _today_str() -> str:
@@ -21,35 +39,12 @@ def _today_str() -> str:
 
 
 def _read_state() -> Dict:
-    if not _STATE_PATH.exists():
-        return {
-            'last_claim_date': None,   # YYYY-MM-DD
-            'day_index': 0,            # 0 means not started; 1..28 active day
-            'cycles_completed': 0,
-        }
-    try:
-        with _STATE_PATH.open('r', encoding='utf-8') as f:
-            data = json.load(f)
-            if not isinstance(data, dict):
-                raise ValueError('invalid state')
-            # defaults
-            data.setdefault('last_claim_date', None)
-            data.setdefault('day_index', 0)
-            data.setdefault('cycles_completed', 0)
-            return data
-    except Exception:
-        return {
-            'last_claim_date': None,
-            'day_index': 0,
-            'cycles_completed': 0,
-        }
+    return savefile.load('daily_rewards')
 
 
 def _write_state(data: Dict) -> None:
     try:
-        _STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with _STATE_PATH.open('w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        savefile.save('daily_rewards', data)
     except Exception:
         pass
 
@@ -71,6 +66,7 @@ def _player_reward(name: str, image_abs_path: str, rating: int = 84) -> Dict:
 
 
 def _rewards_28() -> List[Dict]:
+    # Authoring table; read it through content.registry().daily_rewards
     # Default for unspecified days: +10 XP
     rewards: List[Dict] = [{'type': 'xp', 'amount': 10} for _ in range(28)]
     # Day 1: +25 XP
@@ -112,24 +108,22 @@ def _rewards_28() -> List[Dict]:
     return rewards
 
 
-def list_cycle_rewards() -> List[Dict]:
+def list_cycle_rewards() -> Tuple[Mapping, ...]:
     """Expose the 28-day cycle rewards with day numbers for UI.
 
-    Returns a list of 28 dicts: {'day': i, ...reward...}
+    Returns 28 read-only mappings: {'day': i, ...reward...}
     """
-    out: List[Dict] = []
-    for i, r in enumerate(_rewards_28(), start=1):
-        it = dict(r)
-        it['day'] = i
-        out.append(it)
-    return out
+    return content.registry().daily_cycle
 
 
-def get_daily_only_players() -> List[Dict]:
+def get_daily_only_players() -> Tuple[Mapping, ...]:
     """Return daily-only special players so they appear in the catalog if missing."""
-    rw = _rewards_28()
+    return content.registry().daily_only
+
+
+def _daily_only_players(rewards: Iterable[Mapping]) -> List[Dict]:
     out: List[Dict] = []
-    for r in rw:
+    for r in rewards:
         if r.get('type') == 'player':
             out.append({
                 'name': r['name'],
@@ -176,7 +170,7 @@ def claim_today() -> Tuple[bool, Optional[Dict]]:
         return False, None
     # determine which day to claim
     day_to_claim = _advance_day(int(state.get('day_index', 0)), state.get('last_claim_date'))
-    rewards = _rewards_28()
+    rewards = content.registry().daily_rewards
     idx = max(1, min(28, day_to_claim)) - 1
     rew = rewards[idx]
     # apply reward
@@ -205,6 +199,7 @@ def claim_today() -> Tuple[bool, Optional[Dict]]:
             state['day_index'] = new_day_index
         state['last_claim_date'] = today
         _write_state(state)
+        state_bus.emit(state_bus.DAILY)
         info = dict(rew)
         info['day'] = day_to_claim
         return True, info
@@ -212,6 +207,11 @@ def claim_today() -> Tuple[bool, Optional[Dict]]:
         return False, None
 
 
+def can_claim_today() -> bool:
+    """True while today's reward is still unclaimed (the main menu badge)."""
+    return _read_state().get('last_claim_date') != _today_str()
+
+
 def get_status() -> Dict:
     """Return a summary of the daily reward status for UI/debug."""
     s = _read_state()
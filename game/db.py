@@ -2,30 +2,73 @@ import json
 from pathlib import Path
 from typing import List, Optional, Dict
 
-DATA_FILE = Path(__file__).resolve().parents[1] / 'data' / 'players.json'
-COLLECTION_FILE = Path(__file__).resolve().parents[1] / 'data' / 'collection.json'
+from . import catalog
+from . import savefile
+from . import state_bus
+
+DATA_FILE = Path(__file__).resolve().parents[1] / 'data' / 'players.json'  # shared catalog
+
+# Bumped on every write so derived values (defi predicates, caches) can be memoized
+_players_version = 0
+_collection_version = 0
+# base name -> acquisition sequence number (higher = obtained more recently)
+_obtained: Optional[Dict[str, int]] = None
+
+
+def players_version() -> int:
+    return _players_version
+
+
+def collection_version() -> int:
+    return _collection_version
+
+
+def mark_collection_changed(changes: Optional[Dict[str, int]] = None) -> None:
+    """Signal a collection write. changes maps base name -> new count when the
+    writer knows exactly what changed (None means "anything may have changed")."""
+    global _collection_version
+    _collection_version += 1
+    state_bus.emit(state_bus.COLLECTION, changes)
+
+
+def reload() -> None:
+    """Forget cached collection metadata (after a reset) and signal a change."""
+    global _obtained
+    _obtained = None
+    mark_collection_changed()
+
+
+def players_view() -> catalog.CatalogView:
+    """Read-only view of the compiled catalog (no JSON parsing, rows decoded on access)."""
+    return catalog.view()
 
 
 def load_players() -> List[Dict]:
-    if not DATA_FILE.exists():
-        return []
-    with DATA_FILE.open('r', encoding='utf-8') as f:
-        data = json.load(f)
-    return data.get('players', [])
+    """Mutable copy of every players.json row (for editors; readers use players_view)."""
+    return list(catalog.view())
 
 
 def save_players(players: List[Dict]):
+    global _players_version
     DATA_FILE.parent.mkdir(parents=True, exist_ok=True)
     with DATA_FILE.open('w', encoding='utf-8') as f:
         json.dump({'players': players}, f, indent=2, ensure_ascii=False)
+    try:
+        catalog.build()
+    except Exception:
+        catalog.invalidate()
+    _players_version += 1
+    state_bus.emit(state_bus.PLAYERS)
+    # catalog changed: drop interned card ids
+    try:
+        from . import ids as _ids
+        _ids.invalidate()
+    except Exception:
+        pass
 
 
 def get_player(player_id: int) -> Optional[Dict]:
-    players = load_players()
-    for p in players:
-        if p.get('id') == player_id:
-            return p
-    return None
+    return catalog.view().get(player_id)
 
 
 def add_player(name: str, rating: int, rarity: str, image: Optional[str] = None) -> Dict:
@@ -64,6 +107,9 @@ def update_players_images_from_mapping(name_to_file: Dict[str, str]) -> int:
     Base name is the player's name without any trailing ' #number' suffix.
     Returns the number of updated players.
     """
+    view = catalog.view()
+    if not any(not view.image(i) and _base_name(view.name(i)) in name_to_file for i in range(len(view))):
+        return 0
     players = load_players()
     updated = 0
     for p in players:
@@ -86,41 +132,61 @@ def _base_name(name: str) -> str:
     return (name or '').split('#')[0].strip()
 
 
+def _migrate_collection_v1(data) -> Dict:
+    # legacy collection.json: normalize keys to strings, counts to ints
+    if not isinstance(data, dict):
+        data = {}
+    owned = data.get('owned') or {}
+    obtained = data.get('obtained') or {}
+    return {
+        'owned': {str(k): int(v) for k, v in owned.items() if v is not None},
+        'obtained': {str(k): int(v) for k, v in obtained.items()},
+    }
+
+
+savefile.register('collection', {'owned': {}, 'obtained': {}}, [_migrate_collection_v1])
+
+
 def load_collection() -> Dict[str, int]:
     """Return a dict mapping base player name -> count owned (>=0)."""
-    if not COLLECTION_FILE.exists():
-        return {}
-    try:
-        with COLLECTION_FILE.open('r', encoding='utf-8') as f:
-            data = json.load(f)
-        owned = data.get('owned', {})
-        # normalize keys to strings
-        return {str(k): int(v) for k, v in owned.items() if v is not None}
-    except Exception:
-        return {}
+    return savefile.load('collection')['owned']
+
+
+def load_obtained() -> Dict[str, int]:
+    """Return base name -> acquisition sequence (cached; higher = more recent)."""
+    global _obtained
+    if _obtained is None:
+        _obtained = savefile.load('collection')['obtained']
+    return _obtained
 
 
-def save_collection(owned: Dict[str, int]):
-    COLLECTION_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with COLLECTION_FILE.open('w', encoding='utf-8') as f:
-        json.dump({'owned': owned}, f, indent=2, ensure_ascii=False)
+def save_collection(owned: Dict[str, int], changes: Optional[Dict[str, int]] = None):
+    savefile.save('collection', {'owned': owned, 'obtained': load_obtained()})
+    mark_collection_changed(changes)
 
 
 def add_to_collection_by_names(names: List[str]) -> Dict[str, int]:
     """Increment ownership counts for provided player names (base names)."""
     owned = load_collection()
+    obtained = load_obtained()
+    seq = max(obtained.values(), default=0)
+    changes: Dict[str, int] = {}
     for n in names:
         b = _base_name(n)
         if not b:
             continue
         owned[b] = int(owned.get(b, 0)) + 1
-    save_collection(owned)
+        changes[b] = owned[b]
+        seq += 1
+        obtained[b] = seq
+    save_collection(owned, changes)
     return owned
 
 
 def remove_from_collection_by_names(names: List[str]) -> Dict[str, int]:
     """Decrement ownership counts for provided player base names. Counts won't go below zero."""
     owned = load_collection()
+    changes: Dict[str, int] = {}
     for n in names:
         b = _base_name(n)
         if not b:
@@ -128,29 +194,59 @@ def remove_from_collection_by_names(names: List[str]) -> Dict[str, int]:
         current = int(owned.get(b, 0))
         if current > 0:
             owned[b] = current - 1
-    save_collection(owned)
+            changes[b] = owned[b]
+    save_collection(owned, changes)
     return owned
 
+
+def update_collection(add: List[str] = (), remove: List[str] = ()) -> Dict[str, int]:
+    """Apply removals then additions in a single collection write."""
+    owned = load_collection()
+    obtained = load_obtained()
+    seq = max(obtained.values(), default=0)
+    changes: Dict[str, int] = {}
+    for n in remove:
+        b = _base_name(n)
+        if not b:
+            continue
+        current = int(owned.get(b, 0))
+        if current > 0:
+            owned[b] = current - 1
+            changes[b] = owned[b]
+    for n in add:
+        b = _base_name(n)
+        if not b:
+            continue
+        owned[b] = int(owned.get(b, 0)) + 1
+        changes[b] = owned[b]
+        seq += 1
+        obtained[b] = seq
+    save_collection(owned, changes)
+    return owned
+
+
 def get_unique_catalog() -> List[Dict]:
     """Return a unique catalog (by base name) choosing the highest rating entry for display.
 
     This provides one entry per base name with fields: name, rating, rarity, image(optional)
     """
-    players = load_players()
+    view = catalog.view()
+    ratings = view.ratings
     best: Dict[str, Dict] = {}
-    for p in players:
-        base = _base_name(p.get('name', ''))
+    for i in range(len(view)):
+        base = _base_name(view.name(i))
         if not base:
             continue
         cur = best.get(base)
-        if cur is None or int(p.get('rating', 0)) > int(cur.get('rating', 0)):
+        if cur is None or ratings[i] > int(cur.get('rating', 0)):
             sel = {
                 'name': base,
-                'rating': p.get('rating', 0),
-                'rarity': p.get('rarity', ''),
+                'rating': ratings[i],
+                'rarity': view.rarity(i),
             }
-            if 'image' in p:
-                sel['image'] = p['image']
+            img = view.image(i)
+            if img:
+                sel['image'] = img
             best[base] = sel
     # Merge SBC-only special players (not packable) into the catalog, allow variants
     try:
@@ -1,19 +1,22 @@
 from __future__ import annotations
 
-import json
+import atexit
+import time
 import unicodedata
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
 
 from . import wallet
 from . import xp
 from . import db as game_db
 from . import season_pass as sp_mod
-from . import timeutil as tz
+from . import content
+from . import savefile
+from . import scheduler
+from . import state_bus
 
 ROOT = Path(__file__).resolve().parents[1]
-DATA_FILE = ROOT / 'data' / 'defi_progress.json'
 
 
 @dataclass(frozen=True)
@@ -240,42 +243,108 @@ DEFI_LIST: List[Defi] = [
 ]
 
 
-def _ensure_file():
-    if not DATA_FILE.exists():
-        DATA_FILE.parent.mkdir(parents=True, exist_ok=True)
-        DATA_FILE.write_text(json.dumps({'events': {}, 'claimed': {}, 'daily': {}}, ensure_ascii=False, indent=2), encoding='utf-8')
+def _migrate_v1(d) -> Dict:
+    # legacy defi_progress.json: the three sections must be dicts
+    if not isinstance(d, dict):
+        d = {}
+    for k in ('events', 'claimed', 'daily'):
+        if not isinstance(d.get(k), dict):
+            d[k] = {}
+    return d
+
+
+savefile.register('defi_progress', {'events': {}, 'claimed': {}, 'daily': {}}, [_migrate_v1])
 
 
 def _load() -> Dict:
-    _ensure_file()
-    try:
-        with DATA_FILE.open('r', encoding='utf-8') as f:
-            return json.load(f)
-    except Exception:
-        return {'events': {}, 'claimed': {}, 'daily': {}}
+    return savefile.load('defi_progress')
 
 
 def _save(d: Dict):
     try:
-        DATA_FILE.write_text(json.dumps(d, ensure_ascii=False, indent=2), encoding='utf-8')
+        savefile.save('defi_progress', d)
     except Exception:
         pass
 
 
+# --- In-memory progress engine ---
+# The file is read once; add_progress/claim mutate the in-memory state and a
+# debounced writer persists it. Progress queries never touch the disk.
+_WRITE_DELAY = 2.0  # seconds between two writes of defi_progress.json
+
+_state: Optional[Dict] = None
+_dirty = False
+_last_write = 0.0
+
+
+def _get_state() -> Dict:
+    global _state
+    if _state is None:
+        _state = _load()
+    _roll_daily_cycle(_state)
+    return _state
+
+
+def _mark_dirty(immediate: bool = False) -> None:
+    global _dirty
+    _dirty = True
+    state_bus.emit(state_bus.DEFI)
+    if immediate or (time.time() - _last_write) >= _WRITE_DELAY:
+        flush()
+
+
+def flush() -> None:
+    """Write pending progress to disk now."""
+    global _dirty, _last_write
+    if _state is None or not _dirty:
+        return
+    _save(_state)
+    _dirty = False
+    _last_write = time.time()
+
+
+def flush_pending() -> None:
+    """Debounced write: call once per frame, writes at most every _WRITE_DELAY seconds."""
+    if _dirty and (time.time() - _last_write) >= _WRITE_DELAY:
+        flush()
+
+
+def reload() -> None:
+    """Drop the in-memory state (e.g. after the save files were reset)."""
+    global _state, _dirty
+    _state = None
+    _dirty = False
+    state_bus.emit(state_bus.DEFI)
+
+
+atexit.register(flush)
+
+
 # --- Daily cycle helpers (reset 19:00 Europe/Paris) ---
-def _ensure_daily_cycle(d: Dict):
-    try:
-        cur_key = tz.current_cycle_key(19)
-    except Exception:
-        # fallback to plain today
-        cur_key = tz.today_str()
+def _roll_daily_cycle(d: Dict):
+    """Start a new daily cycle when the 19:00 boundary is crossed.
+
+    The cycle key comes from the scheduler (recomputed once per boundary); at a
+    roll every counter is snapshotted as the baseline, so daily progress is a
+    plain subtraction.
+    """
+    cur_key = scheduler.cycle_key()
     daily = d.setdefault('daily', {})
     if daily.get('cycle_key') != cur_key:
         # reset daily state for new cycle
         daily['cycle_key'] = cur_key
-        daily['baseline'] = {}
+        daily['baseline'] = {k: int(v) for k, v in d.setdefault('events', {}).items()}
         daily['claimed_ids'] = {}
-        _save(d)
+        _mark_dirty()
+
+
+def _on_daily_reset(_key: str, _at: float) -> None:
+    # roll at 19:00 even if no défi accessor runs, so open screens refresh
+    if _state is not None:
+        _roll_daily_cycle(_state)
+
+
+scheduler.subscribe(scheduler.DAILY_RESET, _on_daily_reset)
 
 
 def _is_daily_event_key(event_key: str) -> bool:
@@ -293,114 +362,164 @@ def _base_event_key(event_key: str) -> str:
 
 def _get_daily_progress_for(base_key: str) -> int:
     """Return daily progress for a base event key using baseline snapshots."""
-    d = _load()
-    _ensure_daily_cycle(d)
-    ev = d.setdefault('events', {})
-    cur = int(ev.get(base_key, 0))
-    daily = d.setdefault('daily', {})
-    bl = daily.setdefault('baseline', {})
+    d = _get_state()
+    cur = int(d['events'].get(base_key, 0))
+    bl = d['daily'].setdefault('baseline', {})
     if base_key not in bl:
-        # snapshot current as starting point for this cycle
+        # older saves snapshot lazily: current value is the starting point for this cycle
         bl[base_key] = cur
-        _save(d)
-    base = int(bl.get(base_key, 0))
-    return max(0, cur - base)
+        _mark_dirty()
+    return max(0, cur - int(bl.get(base_key, 0)))
 
 
 def _is_daily_claimed(defi_id: str) -> bool:
-    d = _load()
-    _ensure_daily_cycle(d)
-    daily = d.setdefault('daily', {})
-    claimed = daily.setdefault('claimed_ids', {})
-    return bool(claimed.get(defi_id))
+    d = _get_state()
+    return bool(d['daily'].get('claimed_ids', {}).get(defi_id))
 
 
 def _mark_daily_claimed(defi_id: str):
-    d = _load()
-    _ensure_daily_cycle(d)
-    daily = d.setdefault('daily', {})
-    claimed = daily.setdefault('claimed_ids', {})
-    claimed[defi_id] = True
-    _save(d)
+    d = _get_state()
+    d['daily'].setdefault('claimed_ids', {})[defi_id] = True
+    _mark_dirty(immediate=True)
 
 
-def get_progress(event_key: str) -> int:
-    d = _load()
-    # Dynamic events resolved on the fly
-    if event_key == 'pogba79_owned':
-        try:
-            owned = game_db.load_collection()
-            return 1 if int(owned.get('Paul Pogba', 0)) >= 1 else 0
-        except Exception:
-            return 0
-    if event_key == 'tomori81_gold_owned':
-        try:
-            owned = game_db.load_collection()
-            has = int(owned.get('Tomori', 0)) >= 1
-            if not has:
-                return 0
-            # verify there exists a Tomori entry with or rare and rating >=81 in players data
-            players = game_db.load_players()
-            def _norm(s: str) -> str:
-                try:
-                    return ''.join(c for c in unicodedata.normalize('NFKD', s) if not unicodedata.combining(c)).lower().strip()
-                except Exception:
-                    return (s or '').lower().strip()
-            ok = any((_norm(p.get('name','')) == _norm('Tomori') and str(p.get('rarity','')).strip().lower() in ('or rare', 'or_rare', 'gold rare', 'rare') and int(p.get('rating',0)) >= 81) for p in players)
-            return 1 if ok else 0
-        except Exception:
-            return 0
-    # Dynamic: foundation ownership checks for Garcia series
+# --- Dynamic progress predicates ---
+# Event keys whose progress is derived from other saves (collection, players, pass XP).
+# Each predicate declares its dependencies as version counters; the value is computed
+# once and only recomputed when one of those versions changes.
+
+def _norm(s: str) -> str:
     try:
-        if str(event_key).startswith('owned_foundation:'):
-            target = str(event_key).split(':', 1)[1]
-            def _norm(s: str) -> str:
-                try:
-                    return ''.join(c for c in unicodedata.normalize('NFKD', s) if not unicodedata.combining(c)).lower().strip()
-                except Exception:
-                    return (s or '').lower().strip()
-            owned = game_db.load_collection()
-            base_names = set(owned.keys())
-            # accept both with/without diacritics variants
-            n_target = _norm(target)
-            for nm in base_names:
-                if _norm(nm) == n_target and int(owned.get(nm, 0)) >= 1:
-                    return 1
-            return 0
+        return ''.join(c for c in unicodedata.normalize('NFKD', s) if not unicodedata.combining(c)).lower().strip()
     except Exception:
+        return (s or '').lower().strip()
+
+
+def _dep_collection() -> Tuple:
+    return (game_db.collection_version(),)
+
+
+def _dep_collection_players() -> Tuple:
+    return (game_db.collection_version(), game_db.players_version())
+
+
+def _dep_pass_xp() -> Tuple:
+    return (xp.version(), sp_mod.version())
+
+
+def _pred_pogba79_owned(_arg: str) -> int:
+    owned = game_db.load_collection()
+    return 1 if int(owned.get('Paul Pogba', 0)) >= 1 else 0
+
+
+def _pred_tomori81_gold_owned(_arg: str) -> int:
+    owned = game_db.load_collection()
+    if int(owned.get('Tomori', 0)) < 1:
         return 0
-    # Dynamic: pass level progress for a specific pass id, returns current level
+    # verify there exists a Tomori entry with or rare and rating >=81 in players data
+    view = game_db.players_view()
+    gold = ('or rare', 'or_rare', 'gold rare', 'rare')
+    ok = any(view.ratings[i] >= 81 and view.rarity(i).strip().lower() in gold and _norm(view.name(i)) == 'tomori' for i in range(len(view)))
+    return 1 if ok else 0
+
+
+def _pred_owned_foundation(target: str) -> int:
+    # foundation ownership checks for Garcia series; accept with/without diacritics
+    owned = game_db.load_collection()
+    n_target = _norm(target)
+    for nm, cnt in owned.items():
+        if _norm(nm) == n_target and int(cnt) >= 1:
+            return 1
+    return 0
+
+
+def _pred_pass_level(pass_id: str) -> int:
+    # current relative level for this pass id
+    lvl, _cur, _need = sp_mod.get_relative_level_progress(pass_id or 'launch')
+    return int(lvl)
+
+
+# event key (or 'prefix:' for parametrized keys) -> (compute(arg), dependencies())
+_PREDICATES: Dict[str, Tuple[Callable[[str], int], Callable[[], Tuple]]] = {
+    'pogba79_owned': (_pred_pogba79_owned, _dep_collection),
+    'tomori81_gold_owned': (_pred_tomori81_gold_owned, _dep_collection_players),
+    'owned_foundation:': (_pred_owned_foundation, _dep_collection),
+    'pass_level:': (_pred_pass_level, _dep_pass_xp),
+}
+
+# event key -> (dependency versions, value)
+_predicate_memo: Dict[str, Tuple[Tuple, int]] = {}
+
+
+def _lookup_predicate(event_key: str) -> Optional[Tuple[Callable[[str], int], Callable[[], Tuple], str]]:
+    entry = _PREDICATES.get(event_key)
+    if entry is not None:
+        return entry[0], entry[1], ''
+    if ':' in event_key:
+        prefix, arg = event_key.split(':', 1)
+        entry = _PREDICATES.get(prefix + ':')
+        if entry is not None:
+            return entry[0], entry[1], arg
+    return None
+
+
+def _dynamic_progress(event_key: str) -> Optional[int]:
+    """Memoized value of a dynamic event key, or None if the key is a plain counter."""
+    pred = _lookup_predicate(event_key)
+    if pred is None:
+        return None
+    compute, deps, arg = pred
     try:
-        if str(event_key).startswith('pass_level:'):
-            parts = str(event_key).split(':', 1)
-            pass_id = parts[1] if len(parts) > 1 else 'launch'
-            # get relative level for this pass id
-            lvl, _cur, _need = sp_mod.get_relative_level_progress(pass_id)
-            return int(lvl)
+        key = deps()
     except Exception:
-        pass
+        key = None
+    hit = _predicate_memo.get(event_key)
+    if hit is not None and key is not None and hit[0] == key:
+        return hit[1]
+    try:
+        val = int(compute(arg))
+    except Exception:
+        val = 0
+    if key is not None:
+        # dependencies may have moved while computing (e.g. a pass baseline was saved)
+        try:
+            key = deps()
+        except Exception:
+            pass
+        _predicate_memo[event_key] = (key, val)
+    return val
+
+
+def get_progress(event_key: str) -> int:
+    d = _get_state()
+    # Dynamic events derived from other saves (memoized)
+    dyn = _dynamic_progress(str(event_key))
+    if dyn is not None:
+        return dyn
     # Daily events use delta from baseline since last 19h reset
     if _is_daily_event_key(event_key):
         base_key = _base_event_key(event_key)
         return _get_daily_progress_for(base_key)
-    return int(d.get('events', {}).get(event_key, 0))
+    return int(d['events'].get(event_key, 0))
 
 
 def add_progress(event_key: str, amount: int = 1):
     if amount <= 0:
         return
-    d = _load()
-    ev = d.setdefault('events', {})
-    ev[event_key] = int(ev.get(event_key, 0)) + amount
-    _save(d)
+    d = _get_state()
+    ev = d['events']
+    cur = int(ev.get(event_key, 0))
+    # first occurrence in this cycle: baseline is the value before this event
+    d['daily'].setdefault('baseline', {}).setdefault(event_key, cur)
+    ev[event_key] = cur + amount
+    _mark_dirty()
 
 
 def is_claimed(defi_id: str) -> bool:
     # daily defis are claimed per-cycle
     if str(defi_id).startswith('daily_'):
         return _is_daily_claimed(defi_id)
-    d = _load()
-    return bool(d.get('claimed', {}).get(defi_id))
+    return bool(_get_state()['claimed'].get(defi_id))
 
 
 def can_claim(defi: Defi) -> bool:
@@ -457,14 +576,17 @@ def claim(defi: Defi) -> bool:
     if _is_daily_event_key(defi.event_key) or str(defi.id).startswith('daily_') or defi.group == 'Quotidien':
         _mark_daily_claimed(defi.id)
     else:
-        d = _load()
-        d.setdefault('claimed', {})[defi.id] = True
-        _save(d)
+        _get_state()['claimed'][defi.id] = True
+        _mark_dirty(immediate=True)
     return True
 
 
-def get_defi_only_players() -> List[Dict]:
+def get_defi_only_players() -> Tuple[Mapping, ...]:
     """Special players obtainable only via Défis (not packable)."""
+    return content.registry().defi_only
+
+
+def _defi_only_players() -> List[Dict]:
     specials = [
         {"name": "Jérôme Boateng", "rating": 90, "rarity": "fin d'une ère"},
         {"name": "Juninho", "rating": 91, "rarity": "hero"},
@@ -480,10 +602,15 @@ def get_defi_only_players() -> List[Dict]:
 
 
 def groups() -> List[str]:
-    return sorted(list({d.group for d in DEFI_LIST}))
+    return list(content.registry().defi_groups)
 
 
-def list_defis(group: Optional[str] = None) -> List[Defi]:
+def list_defis(group: Optional[str] = None) -> Tuple[Defi, ...]:
+    reg = content.registry()
     if group is None:
-        return DEFI_LIST
-    return [d for d in DEFI_LIST if d.group == group]
+        return reg.defis
+    return reg.defis_by_group.get(group, ())
+
+
+def get_defi(defi_id: str) -> Optional[Defi]:
+    return content.registry().defi_by_id.get(defi_id)
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from . import ids
+from . import wallet
+
+# Draft mode (unlocked by the 'draft' season pass feature).
+# A run fills the 11 slots of FORMATION one at a time, each time choosing one
+# of OFFER_SIZE catalog cards; OPPONENTS AI managers draft their own squads the
+# same way and the user then plays them one after another. Entering a run
+# (start()) costs ENTRY_COST Minecoins up front, so abandoning a draft whose
+# odds look bad is not free; WIN_COINS pays back less than that on average.
+# Squads are scored from the ids.ratings() int array. Team rating only grows
+# with a card's rating and the later picks don't depend on this one, so the
+# "best pick" hint is the top-rated card of the offer (offers are sorted),
+# shown with the exact team rating each candidate gives the squad so far.
+# The catalog has no positions: when an entry carries a 'position' it is only
+# offered for matching slots, otherwise any card fits any slot.
+
+FORMATION = ('GB', 'DG', 'DC', 'DC', 'DD', 'MC', 'MC', 'MC', 'AG', 'BU', 'AD')
+SQUAD_SIZE = len(FORMATION)
+OFFER_SIZE = 5
+OPPONENTS = 3
+TOP_SHARE = 0.15  # one offered card per pick comes from the top of the catalog
+AI_SKILL = 0.7  # chance an AI manager takes the best card of its offer
+ENTRY_COST = 300  # Minecoins, paid when a run starts
+WIN_COINS = (0, 150, 400, 1000)  # reward by number of wins (about 270 on average)
+
+
+def team_rating(ratings: Sequence[int]) -> int:
+    """FUT-style team rating: average plus the above-average surplus, rounded down."""
+    n = len(ratings)
+    if not n:
+        return 0
+    total = sum(ratings)
+    # integer form of total/n + sum(max(0, r - total/n))/n
+    surplus = sum(r * n - total for r in ratings if r * n > total)
+    return (total * n + surplus) // (n * n)
+
+
+def _position_of(cid: int) -> str:
+    return str(ids.card(cid).get('position', '') or '').upper()
+
+
+def _eligible(slot: str, cid: int) -> bool:
+    pos = _position_of(cid)
+    return not pos or pos == slot
+
+
+@dataclass
+class DraftSquad:
+    name: str
+    picks: List[int] = field(default_factory=list)  # card ids, FORMATION order
+
+    def rating(self) -> int:
+        r = ids.ratings()
+        return team_rating([r[c] for c in self.picks])
+
+
+@dataclass
+class DraftResult:
+    wins: int
+    matches: List[Tuple[str, int, int, bool]]  # (opponent, our rating, theirs, won)
+    coins: int
+
+
+class DraftRun:
+    """One draft: offers, picks, hints, AI opponents and the final matches."""
+
+    def __init__(self, seed: Optional[int] = None, player: str = 'Joueur'):
+        self.seed = random.randrange(1 << 30) if seed is None else int(seed)
+        self.rng = random.Random(self.seed)
+        n = ids.count()
+        rating = ids.ratings()
+        self._by_rating = sorted(range(n), key=lambda c: -rating[c])
+        self._top = self._by_rating[:max(OFFER_SIZE, int(n * TOP_SHARE))]
+        self.squad = DraftSquad(player)
+        self.offer: List[int] = []
+        self.opponents: List[DraftSquad] = []
+        self.result: Optional[DraftResult] = None
+        self._hint: Optional[Tuple[int, List[float]]] = None
+        self._deal()
+
+    # ---- offers ---- #
+
+    @property
+    def slot(self) -> int:
+        return len(self.squad.picks)
+
+    @property
+    def done(self) -> bool:
+        return self.slot >= SQUAD_SIZE
+
+    def _offer_for(self, rng: random.Random, slot: str, taken: set) -> List[int]:
+        out: List[int] = []
+        seen = set(taken)
+        pools = [self._top] + [self._by_rating] * (OFFER_SIZE - 1)
+        for pool in pools:
+            for _ in range(40):
+                cid = pool[rng.randrange(len(pool))]
+                base = ids.base_of(cid)
+                if base not in seen and _eligible(slot, cid):
+                    seen.add(base)
+                    out.append(cid)
+                    break
+        out.sort(key=lambda c: -ids.rating_of(c))
+        return out
+
+    def _deal(self) -> None:
+        self._hint = None
+        if self.done:
+            self.offer = []
+            return
+        taken = {ids.base_of(c) for c in self.squad.picks}
+        self.offer = self._offer_for(self.rng, FORMATION[self.slot], taken)
+
+    def pick(self, i: int) -> bool:
+        if self.done or not (0 <= i < len(self.offer)):
+            return False
+        self.squad.picks.append(self.offer[i])
+        self._deal()
+        if self.done:
+            self._draft_opponents()
+        return True
+
+    # ---- hints ---- #
+
+    def hint(self) -> Tuple[int, List[float]]:
+        """(index of the best pick in the offer, team rating with each candidate)."""
+        if self._hint is not None:
+            return self._hint
+        if not self.offer:
+            return (-1, [])
+        r = ids.ratings()
+        head = [r[c] for c in self.squad.picks]
+        expected = [float(team_rating(head + [r[cid]])) for cid in self.offer]
+        self._hint = (0, expected)  # offers are sorted by rating, best first
+        return self._hint
+
+    # ---- opponents and matches ---- #
+
+    def _draft_opponents(self) -> None:
+        rng = random.Random(self.seed ^ 0x5EED)
+        self.opponents = []
+        for k in range(OPPONENTS):
+            sq = DraftSquad(f'IA {k + 1}')
+            for slot in FORMATION:
+                taken = {ids.base_of(c) for c in sq.picks}
+                offer = self._offer_for(rng, slot, taken)
+                if not offer:
+                    break
+                sq.picks.append(offer[0] if rng.random() < AI_SKILL else offer[rng.randrange(len(offer))])
+            self.opponents.append(sq)
+        # weakest first, the last match is the final
+        self.opponents.sort(key=lambda s: s.rating())
+
+    @staticmethod
+    def win_chance(ours: int, theirs: int) -> float:
+        return 1.0 / (1.0 + 10 ** ((theirs - ours) / 8.0))
+
+    def play(self) -> Optional[DraftResult]:
+        """Play the opponents in order until the first loss, then pay the reward once."""
+        if not self.done or self.result is not None:
+            return self.result
+        rng = random.Random(self.seed ^ 0xF00D)
+        ours = self.squad.rating()
+        matches = []
+        wins = 0
+        for opp in self.opponents:
+            theirs = opp.rating()
+            won = rng.random() < self.win_chance(ours, theirs)
+            matches.append((opp.name, ours, theirs, won))
+            if not won:
+                break
+            wins += 1
+        coins = WIN_COINS[min(wins, len(WIN_COINS) - 1)]
+        try:
+            wallet.add_coins(coins)
+        except Exception:
+            pass
+        self.result = DraftResult(wins=wins, matches=matches, coins=coins)
+        return self.result
+
+    def summary(self) -> Dict:
+        return {
+            'seed': self.seed,
+            'rating': self.squad.rating(),
+            'picks': [ids.name_of(c) for c in self.squad.picks],
+            'opponents': [(o.name, o.rating()) for o in self.opponents],
+        }
+
+
+def start(seed: Optional[int] = None, player: str = 'Joueur') -> Optional[DraftRun]:
+    """Pay ENTRY_COST and deal a new run. None when the entry can't be paid."""
+    try:
+        if not wallet.spend_coins(ENTRY_COST):
+            return None
+    except Exception:
+        return None
+    return DraftRun(seed=seed, player=player)
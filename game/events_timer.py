@@ -3,13 +3,25 @@ from __future__ import annotations
 import json
 from datetime import timedelta, datetime
 from pathlib import Path
-from typing import Tuple
+from typing import Callable, Dict, Optional, Tuple
 
+from . import scheduler
 from . import timeutil as tz
 
 ROOT = Path(__file__).resolve().parents[1]
 DATA_FILE = ROOT / 'data' / 'timers.json'
 
+# timers.json is read once; every timer's end is parsed then and handed to the
+# scheduler as 'timer:<key>', so remaining_seconds() is a subtraction against
+# the frame's snapshot of now. The file is only written when a timer is created.
+
+_data: Optional[dict] = None
+_ends: Dict[str, datetime] = {}
+
+
+def _sched_key(key: str) -> str:
+    return 'timer:' + key
+
 
 def _load() -> dict:
     try:
@@ -51,25 +63,54 @@ def ensure_timer(key: str, days: int) -> datetime:
     Returns the end datetime for this timer. If the timer already exists, it's
     not modified; if not, it is created with end = now + days.
     """
-    d = _load()
+    d = _state()
+    end = _ends.get(key)
+    if end is not None:
+        return end
     ev = d.setdefault('events', {})
     rec = ev.get(key)
     if not rec:
         end = tz.now() + timedelta(days=max(0, int(days)))
         ev[key] = {"end": _dt_to_iso(end), "days": int(days)}
         _save(d)
-        return end
+    else:
+        try:
+            end = _iso_to_dt(rec.get('end', tz.now().isoformat()))
+        except Exception:
+            end = tz.now()
+    _track(key, end)
+    return end
+
+
+def _track(key: str, end: datetime) -> None:
+    _ends[key] = end
     try:
-        return _iso_to_dt(rec.get('end', tz.now().isoformat()))
+        scheduler.schedule(_sched_key(key), end.timestamp())
     except Exception:
-        return tz.now()
+        pass
+
+
+def _state() -> dict:
+    global _data
+    if _data is None:
+        _data = _load()
+        for k, rec in list(_data.get('events', {}).items()):
+            try:
+                _track(k, _iso_to_dt(rec['end']))
+            except Exception:
+                pass
+    return _data
 
 
 def remaining_seconds(key: str, days: int) -> int:
-    end = ensure_timer(key, days)
-    now = tz.now()
-    delta = (end - now).total_seconds()
-    return int(delta) if delta > 0 else 0
+    if key not in _ends:
+        ensure_timer(key, days)
+    return scheduler.remaining(_sched_key(key))
+
+
+def on_expire(key: str, fn: Callable[[str, float], None]) -> None:
+    """Call fn(scheduler key, end timestamp) when the timer runs out (checked once per frame)."""
+    scheduler.subscribe(_sched_key(key), fn)
 
 
 def is_expired(key: str, days: int) -> bool:
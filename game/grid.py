@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import math
+from typing import Callable, Iterator, Optional, Tuple
+
+import pygame
+
+# Virtualized scrolling grid.
+# Only the layout (columns, cell size, row pitch, content height) is cached, and
+# only when the area or item count changes. Screens ask for the visible index
+# window and cell rects, hit-test a point in O(1), and feed wheel events for
+# kinetic scrolling. on_prefetch(range) fires when the window moves so images
+# for the rows just past the viewport can be warmed before they are drawn.
+
+
+class VirtualGrid:
+    """Fixed-size cell grid over `count` items, drawn inside `area`.
+
+    col_w: target column width (columns = (area.w - inset) // col_w).
+    gap: spacing around cells. aspect: cell_h = cell_w * aspect.
+    label_h: extra row height under each cell that is not part of its hit rect.
+    """
+
+    def __init__(self, col_w: int, gap: int, aspect: float, label_h: int = 0, inset: int = 0,
+                 wheel_step: float = 40.0, friction: float = 10.0, prefetch_rows: int = 2,
+                 on_prefetch: Optional[Callable[[range], None]] = None):
+        self.col_w = col_w
+        self.gap = gap
+        self.aspect = aspect
+        self.label_h = label_h
+        self.inset = inset
+        self.wheel_step = wheel_step
+        self.friction = friction
+        self.prefetch_rows = prefetch_rows
+        self.on_prefetch = on_prefetch
+        self.scroll = 0.0
+        self.velocity = 0.0
+        self.area = pygame.Rect(0, 0, 0, 0)
+        self.count = 0
+        self._layout_key = None
+        self.cols = 1
+        self.cell_w = 1
+        self.cell_h = 1
+        self.pitch = 1  # row height including label and gap
+        self.max_scroll = 0
+        self._window: Tuple[int, int] = (0, 0)
+
+    # ---- layout ---- #
+
+    def layout(self, area: pygame.Rect, count: int) -> None:
+        """Update area and item count; recomputes metrics only when they change."""
+        key = (area.x, area.y, area.w, area.h, count)
+        if key == self._layout_key:
+            return
+        self._layout_key = key
+        self.area = pygame.Rect(area)
+        self.count = count
+        gap = self.gap
+        self.cols = max(1, (area.w - self.inset) // self.col_w)
+        self.cell_w = max(1, (area.w - (self.cols + 1) * gap) // self.cols)
+        self.cell_h = int(self.cell_w * self.aspect)
+        self.pitch = self.cell_h + self.label_h + gap
+        rows = math.ceil(count / self.cols) if count else 0
+        content_h = gap + rows * self.pitch
+        self.max_scroll = max(0, content_h - area.h)
+        self.scroll = min(self.scroll, self.max_scroll)
+
+    def reset(self) -> None:
+        self.scroll = 0.0
+        self.velocity = 0.0
+
+    # ---- scrolling ---- #
+
+    def wheel(self, dy: int) -> None:
+        """Mouse wheel notch: adds momentum instead of jumping."""
+        self.velocity -= dy * self.wheel_step * self.friction
+
+    def scroll_by(self, dy: float) -> None:
+        self.scroll = max(0.0, min(float(self.max_scroll), self.scroll + dy))
+
+    def update(self, dt: float) -> None:
+        if self.velocity:
+            # each wheel notch travels ~wheel_step px, decaying exponentially
+            self.scroll_by(self.velocity * dt)
+            self.velocity *= math.exp(-self.friction * dt)
+            at_edge = (self.velocity < 0 and self.scroll <= 0) or (self.velocity > 0 and self.scroll >= self.max_scroll)
+            if abs(self.velocity) < 5.0 or at_edge:
+                self.velocity = 0.0
+        self._check_window()
+
+    # ---- visibility / geometry ---- #
+
+    def visible_range(self) -> Tuple[int, int]:
+        """[start, end) indices of cells intersecting the viewport."""
+        if not self.count:
+            return (0, 0)
+        top = int(self.scroll)
+        first_row = max(0, (top - self.gap) // self.pitch)
+        last_row = (top + self.area.h) // self.pitch
+        start = first_row * self.cols
+        end = min(self.count, (last_row + 1) * self.cols)
+        return (start, end)
+
+    def cell_rect(self, idx: int) -> pygame.Rect:
+        row, col = divmod(idx, self.cols)
+        x = self.area.x + self.gap + col * (self.cell_w + self.gap)
+        y = self.area.y + self.gap + row * self.pitch - int(self.scroll)
+        return pygame.Rect(x, y, self.cell_w, self.cell_h)
+
+    def visible_cells(self) -> Iterator[Tuple[int, pygame.Rect]]:
+        start, end = self.visible_range()
+        for idx in range(start, end):
+            yield idx, self.cell_rect(idx)
+
+    def index_at(self, pos: Tuple[int, int]) -> Optional[int]:
+        """Item index under pos, or None (gaps and labels don't count)."""
+        x, y = pos
+        if not self.area.collidepoint((x, y)):
+            return None
+        lx = x - self.area.x - self.gap
+        ly = y - self.area.y - self.gap + int(self.scroll)
+        if lx < 0 or ly < 0:
+            return None
+        col, cx = divmod(lx, self.cell_w + self.gap)
+        row, cy = divmod(ly, self.pitch)
+        if col >= self.cols or cx >= self.cell_w or cy >= self.cell_h:
+            return None
+        idx = row * self.cols + col
+        return idx if idx < self.count else None
+
+    # ---- prefetch ---- #
+
+    def _check_window(self) -> None:
+        window = self.visible_range()
+        if window == self._window:
+            return
+        moving_up = window[0] < self._window[0]
+        self._window = window
+        if self.on_prefetch is None or not self.count:
+            return
+        ahead = self.prefetch_rows * self.cols
+        if moving_up:
+            self.on_prefetch(range(max(0, window[0] - ahead), window[0]))
+        else:
+            self.on_prefetch(range(window[1], min(self.count, window[1] + ahead)))
@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import unicodedata
+from array import array
+from typing import Dict, Iterable, List, Optional
+
+from . import db as game_db
+
+# Interning layer for catalog cards and rarities.
+# Every unique catalog entry (see db.get_unique_catalog) gets a small int id in
+# catalog order (rating desc, name asc), and every rarity label gets its own id.
+# Names, base names and rarities are normalized once here so screens can filter
+# on int arrays instead of re-normalizing strings every frame.
+
+_built = False
+_generation = 0  # bumped on every build so derived caches can key on it
+_cards: List[Dict] = []
+_names: List[str] = []
+_name_to_id: Dict[str, int] = {}
+_folded_names: List[str] = []
+_index: Dict[str, Dict] = {}
+
+_bases: List[str] = []
+_base_to_id: Dict[str, int] = {}
+_card_base = array('i')
+
+_rarities: List[str] = []
+_rarity_to_id: Dict[str, int] = {}
+_card_rarity = array('i')
+_card_canonical = array('i')
+_card_rating = array('i')
+
+# search index: folded-name trigram -> card ids (ascending), built on first search
+_NGRAM = 3
+_grams: Dict[str, array] = {}
+_grams_built = False
+# recent query -> matching ids, used to refine a query that extends a previous one
+_SEARCH_MEMO_MAX = 64
+_search_memo: Dict[str, List[int]] = {}
+
+
+def fold(s: str) -> str:
+    """Lowercase and strip accents (same rules as the UI search)."""
+    try:
+        s = (s or '').strip().lower()
+        return ''.join(c for c in unicodedata.normalize('NFKD', s) if not unicodedata.combining(c))
+    except Exception:
+        return (s or '').lower()
+
+
+def rarity_id(label: str) -> int:
+    """Return the id of a rarity label, interning it on first use."""
+    key = fold(label)
+    rid = _rarity_to_id.get(key)
+    if rid is None:
+        rid = len(_rarities)
+        _rarities.append(key)
+        _rarity_to_id[key] = rid
+    return rid
+
+
+def rarity_label(rid: int) -> str:
+    return _rarities[rid] if 0 <= rid < len(_rarities) else ''
+
+
+def _base_id(base: str) -> int:
+    bid = _base_to_id.get(base)
+    if bid is None:
+        bid = len(_bases)
+        _bases.append(base)
+        _base_to_id[base] = bid
+    return bid
+
+
+def build(force: bool = False) -> None:
+    """Intern the unique catalog. Cheap no-op once built unless forced."""
+    global _built, _cards, _generation
+    if _built and not force:
+        return
+    try:
+        from .sbc import canonical_rarity
+    except Exception:
+        canonical_rarity = lambda r: (r or '').strip().lower()  # noqa: E731
+    try:
+        cards = game_db.get_unique_catalog()
+    except Exception:
+        cards = []
+    _cards = cards
+    _names.clear()
+    _name_to_id.clear()
+    _folded_names.clear()
+    _index.clear()
+    _bases.clear()
+    _base_to_id.clear()
+    del _card_base[:]
+    del _card_rarity[:]
+    del _card_canonical[:]
+    del _card_rating[:]
+    _drop_search_index()
+    for cid, c in enumerate(cards):
+        name = str(c.get('name', '') or '')
+        _names.append(name)
+        _name_to_id.setdefault(name, cid)
+        _folded_names.append(fold(name))
+        _index[name] = c
+        _card_base.append(_base_id(game_db._base_name(name)))
+        rar = str(c.get('rarity', '') or '')
+        _card_rarity.append(rarity_id(rar))
+        _card_canonical.append(rarity_id(canonical_rarity(rar)))
+        try:
+            _card_rating.append(int(c.get('rating', 0)))
+        except Exception:
+            _card_rating.append(0)
+    _generation += 1
+    _built = True
+
+
+def invalidate() -> None:
+    """Drop interned ids; the next lookup rebuilds from disk."""
+    global _built
+    _built = False
+
+
+# ---- lookups ---- #
+
+def generation() -> int:
+    build()
+    return _generation
+
+
+def count() -> int:
+    build()
+    return len(_cards)
+
+
+def catalog() -> List[Dict]:
+    """The interned catalog; list position == card id."""
+    build()
+    return _cards
+
+
+def catalog_index() -> Dict[str, Dict]:
+    """Cached name -> catalog entry map (same shape as sbc.get_catalog_index)."""
+    build()
+    return _index
+
+
+def card_id(name: str) -> Optional[int]:
+    build()
+    return _name_to_id.get(name)
+
+
+def card(cid: int) -> Dict:
+    return _cards[cid]
+
+
+def name_of(cid: int) -> str:
+    return _names[cid]
+
+
+def folded_name(cid: int) -> str:
+    return _folded_names[cid]
+
+
+def base_of(cid: int) -> str:
+    return _bases[_card_base[cid]]
+
+
+def base_id(name: str) -> Optional[int]:
+    build()
+    return _base_to_id.get(game_db._base_name(name))
+
+
+def rating_of(cid: int) -> int:
+    return _card_rating[cid]
+
+
+def ratings() -> array:
+    """Ratings of every card, indexed by card id (shared, don't mutate)."""
+    build()
+    return _card_rating
+
+
+def rarity_of(cid: int) -> int:
+    return _card_rarity[cid]
+
+
+def canonical_rarity_of(cid: int) -> int:
+    return _card_canonical[cid]
+
+
+def owned_by_base(owned: Dict[str, int]) -> array:
+    """Project an owned {base name: count} dict onto an int array indexed by base id."""
+    build()
+    counts = array('i', bytes(4 * len(_bases)))
+    for base, n in owned.items():
+        bid = _base_to_id.get(base)
+        if bid is not None:
+            try:
+                counts[bid] = int(n)
+            except Exception:
+                pass
+    return counts
+
+
+def owned_count(counts: array, cid: int) -> int:
+    return counts[_card_base[cid]]
+
+
+# ---- search ---- #
+
+def _drop_search_index() -> None:
+    global _grams_built
+    _grams.clear()
+    _search_memo.clear()
+    _grams_built = False
+
+
+def _build_search_index() -> None:
+    global _grams_built
+    build()
+    if _grams_built:
+        return
+    for cid, name in enumerate(_folded_names):
+        seen = set()
+        for k in range(len(name) - _NGRAM + 1):
+            g = name[k:k + _NGRAM]
+            if g not in seen:
+                seen.add(g)
+                post = _grams.get(g)
+                if post is None:
+                    post = _grams[g] = array('i')
+                post.append(cid)
+    _grams_built = True
+
+
+def search(needle: str) -> List[int]:
+    """Catalog ids (catalog order) whose folded name contains the folded needle.
+
+    A query that extends a recent one (e.g. one more typed character) is refined
+    from that query's results; otherwise the rarest trigram's posting list is
+    the candidate set, so nothing rescans the whole catalog.
+    """
+    _build_search_index()
+    n = fold(needle)
+    if not n:
+        return list(range(len(_cards)))
+    hit = _search_memo.get(n)
+    if hit is not None:
+        return hit
+    # longest remembered query contained in this one
+    base = None
+    for prev, res in _search_memo.items():
+        if prev in n and (base is None or len(prev) > len(base[0])):
+            base = (prev, res)
+    if base is not None:
+        cands: Iterable[int] = base[1]
+    elif len(n) >= _NGRAM:
+        posts = []
+        for k in range(len(n) - _NGRAM + 1):
+            post = _grams.get(n[k:k + _NGRAM])
+            if post is None:
+                posts = [array('i')]
+                break
+            posts.append(post)
+        cands = min(posts, key=len)
+    else:
+        cands = range(len(_cards))
+    out = [i for i in cands if n in _folded_names[i]]
+    if len(_search_memo) >= _SEARCH_MEMO_MAX:
+        _search_memo.pop(next(iter(_search_memo)))
+    _search_memo[n] = out
+    return out
+
+
+def filter_ids(ids: Optional[Iterable[int]] = None, rarity: Optional[int] = None, needle: str = '',
+               owned: Optional[array] = None, min_owned: int = 1) -> List[int]:
+    """Filter card ids by rarity id, folded-name substring and owned count.
+
+    `ids` defaults to the whole catalog (in catalog order). `needle` is folded here;
+    over the whole catalog it goes through the search index.
+    """
+    build()
+    if ids is None:
+        out = search(needle) if needle else list(range(len(_cards)))
+        needle = ''
+    else:
+        out = list(ids)
+    if rarity is not None:
+        out = [i for i in out if _card_rarity[i] == rarity]
+    if needle:
+        n = fold(needle)
+        out = [i for i in out if n in _folded_names[i]]
+    if owned is not None:
+        out = [i for i in out if owned[_card_base[i]] >= min_owned]
+    return out
@@ -47,6 +47,13 @@ PACK_DEFS = {
 }
 
 
+# shop offer: (pack, cards per pack, price in Minecoins)
+PACK_SHOP = [
+    ('Pack Classique', 5, 100),
+    ('Pack Premium', 5, 300),
+    ('Pack Icône', 3, 800),
+]
+
 def _weighted_pick(weights):
     total = sum(w for _, w in weights)
     r = random.uniform(0, total)
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import random
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+# Structure-of-arrays particle pools.
+# Each pool keeps positions, velocities, alpha, size, color and rotation in flat
+# typed arrays, integrates them in one loop, compacts dead particles in the same
+# pass and renders every live particle from a small cache of pre-built sprites
+# with a single Surface.blits call. No per-particle objects or surfaces.
+
+_ALPHA_STEP = 16  # alpha quantization for sprite reuse
+_ANGLE_STEP = 15  # degrees per rotation bucket
+_SPRITE_CACHE_MAX = 4096
+
+_SPRITES: Dict[Tuple, pygame.Surface] = {}
+
+
+def _sprite(kind: str, size: int, color: Tuple[int, int, int], alpha: int, angle: int) -> pygame.Surface:
+    key = (kind, size, color, alpha, angle)
+    s = _SPRITES.get(key)
+    if s is None:
+        if len(_SPRITES) >= _SPRITE_CACHE_MAX:
+            _SPRITES.clear()
+        if kind == 'rect':
+            # confetti strip, rotated
+            s = pygame.Surface((max(1, size), max(1, size * 2)), pygame.SRCALPHA)
+            s.fill((*color, alpha))
+            if angle:
+                s = pygame.transform.rotate(s, angle)
+        else:
+            # round light dot
+            d = max(1, size * 2)
+            s = pygame.Surface((d, d), pygame.SRCALPHA)
+            pygame.draw.circle(s, (*color, alpha), (size, size), size)
+        _SPRITES[key] = s
+    return s
+
+
+def clear_sprite_cache() -> None:
+    _SPRITES.clear()
+
+
+class ParticlePool:
+    """Flat-array particle buffer.
+
+    kind: 'dot' (circle) or 'rect' (rotating confetti strip).
+    gravity: added to vy every second. fade: alpha lost per second.
+    blend: special_flags used when blitting the sprites.
+    centered: dots are positioned by their center instead of their top-left corner.
+    """
+
+    def __init__(self, kind: str = 'dot', gravity: float = 0.0, fade: float = 0.0, blend: int = 0,
+                 centered: bool = False):
+        self.kind = kind
+        self.gravity = float(gravity)
+        self.fade = float(fade)
+        self.blend = blend
+        self.centered = centered and kind == 'dot'
+        self.x = array('f')
+        self.y = array('f')
+        self.vx = array('f')
+        self.vy = array('f')
+        self.alpha = array('f')
+        self.angle = array('f')
+        self.spin = array('f')
+        self.size = array('H')
+        self.color = array('H')  # index into self.palette
+        self.palette: List[Tuple[int, int, int]] = []
+        self._color_ids: Dict[Tuple[int, int, int], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def _color_id(self, color: Tuple[int, int, int]) -> int:
+        cid = self._color_ids.get(color)
+        if cid is None:
+            cid = len(self.palette)
+            self.palette.append(color)
+            self._color_ids[color] = cid
+        return cid
+
+    def spawn(self, x: float, y: float, vx: float, vy: float, alpha: float = 255.0, size: int = 3,
+              color: Tuple[int, int, int] = (255, 255, 255), angle: float = 0.0, spin: float = 0.0) -> None:
+        self.x.append(x)
+        self.y.append(y)
+        self.vx.append(vx)
+        self.vy.append(vy)
+        self.alpha.append(alpha)
+        self.angle.append(angle)
+        self.spin.append(spin)
+        self.size.append(max(1, int(size)))
+        self.color.append(self._color_id(tuple(int(c) for c in color)))
+
+    def clear(self) -> None:
+        for buf in (self.x, self.y, self.vx, self.vy, self.alpha, self.angle, self.spin, self.size, self.color):
+            del buf[:]
+
+    def update(self, dt: float, min_alpha: float = 0.0, top: Optional[float] = None, bottom: Optional[float] = None,
+               wrap: Optional[Tuple[int, int]] = None) -> None:
+        """Integrate all particles and drop the dead ones in bulk.
+
+        A particle dies when alpha <= min_alpha, y <= top or y >= bottom. With
+        wrap=(w, h), particles falling past bottom are recycled above the screen
+        at a random x in [0, w] instead.
+        """
+        x, y, vx, vy = self.x, self.y, self.vx, self.vy
+        alpha, angle, spin = self.alpha, self.angle, self.spin
+        g = self.gravity * dt
+        fade = self.fade * dt
+        rotate = self.kind == 'rect'
+        w = 0
+        for i in range(len(x)):
+            ny = y[i] + vy[i] * dt
+            nx = x[i] + vx[i] * dt
+            na = alpha[i] - fade if fade else alpha[i]
+            if wrap is not None and bottom is not None and ny > bottom:
+                ny = random.randint(-wrap[1] // 2, -10)
+                nx = random.randint(0, wrap[0])
+            elif na <= min_alpha or (top is not None and ny <= top) or (bottom is not None and ny >= bottom):
+                continue
+            if w != i:
+                vx[w] = vx[i]
+                spin[w] = spin[i]
+                self.size[w] = self.size[i]
+                self.color[w] = self.color[i]
+            x[w] = nx
+            y[w] = ny
+            vy[w] = vy[i] + g
+            alpha[w] = na
+            angle[w] = (angle[i] + spin[w] * dt) if rotate else angle[i]
+            w += 1
+        if w < len(x):
+            for buf in (x, y, vx, vy, alpha, angle, spin, self.size, self.color):
+                del buf[w:]
+
+    def draw(self, surf: pygame.Surface, offset: Tuple[int, int] = (0, 0), scale: float = 1.0) -> None:
+        """Blit every live particle; scale maps logical positions and sizes onto a
+        reduced-resolution layer (see render_scale)."""
+        n = len(self.x)
+        if n == 0:
+            return
+        ox, oy = offset
+        k = float(scale)
+        kind, blend, palette = self.kind, self.blend, self.palette
+        rotate = kind == 'rect'
+        seq = []
+        for i in range(n):
+            a = int(self.alpha[i])
+            if a <= 0:
+                continue
+            a = min(255, (a // _ALPHA_STEP) * _ALPHA_STEP + _ALPHA_STEP - 1)
+            ang = (int(self.angle[i]) // _ANGLE_STEP * _ANGLE_STEP) % 360 if rotate else 0
+            s = self.size[i] if k == 1.0 else max(1, round(self.size[i] * k))
+            spr = _sprite(kind, s, palette[self.color[i]], a, ang)
+            if self.centered:
+                seq.append((spr, (int(self.x[i] * k) - s + ox, int(self.y[i] * k) - s + oy), None, blend))
+            else:
+                seq.append((spr, (int(self.x[i] * k) + ox, int(self.y[i] * k) + oy), None, blend))
+        if seq:
+            surf.blits(seq, doreturn=False)
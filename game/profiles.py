@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import shutil
+import time
+import zipfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Save profiles.
+# Each profile's progress lives in its own shard directory,
+# data/profiles/<id>/, holding the SHARD_FILES below; the 'default' profile is
+# the legacy single save directly under data/. Static content (players.json,
+# images, settings.json, timers.json) stays shared. Save files are resolved
+# against shard_dir() on every read/write (see savefile), so only the active
+# shard is ever read, and switch() drops every in-memory copy of the previous one.
+# Shards idle for IDLE_DAYS are packed into data/profiles/<id>.zip and
+# unpacked again the next time the profile is activated.
+# MINEFUT_PROFILE=<id> picks the profile at launch without changing the
+# remembered one.
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA_DIR = ROOT / 'data'
+PROFILES_DIR = DATA_DIR / 'profiles'
+INDEX_FILE = PROFILES_DIR / 'index.json'
+DEFAULT_ID = 'default'
+IDLE_DAYS = 30
+
+SHARD_STEMS = (
+    'collection',
+    'profile',
+    'wallet',
+    'sbc_progress',
+    'defi_progress',
+    'season_pass_progress',
+    'daily_rewards',
+)
+# binary saves (see savefile) plus the legacy JSON they were migrated from
+SHARD_FILES = tuple(s + ext for s in SHARD_STEMS for ext in ('.sav', '.json'))
+
+_active: Optional[str] = None
+_index: Optional[Dict] = None
+
+
+def _load_index() -> Dict:
+    global _index
+    if _index is None:
+        data = None
+        try:
+            with INDEX_FILE.open('r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception:
+            data = None
+        if not isinstance(data, dict) or not isinstance(data.get('profiles'), dict):
+            data = {'active': DEFAULT_ID, 'profiles': {}}
+        data['profiles'].setdefault(DEFAULT_ID, {'name': 'Joueur', 'last_used': 0})
+        _index = data
+    return _index
+
+
+def _save_index() -> None:
+    try:
+        PROFILES_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = INDEX_FILE.with_suffix('.tmp')
+        tmp.write_text(json.dumps(_load_index(), ensure_ascii=False, indent=2), encoding='utf-8')
+        os.replace(tmp, INDEX_FILE)
+    except Exception:
+        pass
+
+
+def active() -> str:
+    global _active
+    if _active is None:
+        idx = _load_index()
+        env = os.environ.get('MINEFUT_PROFILE', '').strip()
+        pid = env if env in idx['profiles'] else idx.get('active', DEFAULT_ID)
+        _active = pid if pid in idx['profiles'] else DEFAULT_ID
+        _unpack(_active)
+    return _active
+
+
+def shard_dir(pid: Optional[str] = None) -> Path:
+    pid = pid or active()
+    return DATA_DIR if pid == DEFAULT_ID else PROFILES_DIR / pid
+
+
+def path(name: str) -> Path:
+    """Save file `name` of the active profile."""
+    return shard_dir() / name
+
+
+def list_profiles() -> List[Dict]:
+    """[{id, name, last_used, active, archived}] most recently used first."""
+    idx = _load_index()
+    cur = active()
+    out = []
+    for pid, meta in idx['profiles'].items():
+        out.append({
+            'id': pid,
+            'name': meta.get('name', pid),
+            'last_used': float(meta.get('last_used', 0)),
+            'active': pid == cur,
+            'archived': (PROFILES_DIR / f'{pid}.zip').exists(),
+        })
+    out.sort(key=lambda p: (not p['active'], -p['last_used'], p['id']))
+    return out
+
+
+def _new_id(name: str) -> str:
+    base = re.sub(r'[^a-z0-9]+', '_', name.lower()).strip('_')[:24] or 'profil'
+    idx = _load_index()
+    pid, n = base, 2
+    while pid in idx['profiles'] or pid == DEFAULT_ID:
+        pid, n = f'{base}_{n}', n + 1
+    return pid
+
+
+def create(name: str) -> str:
+    """Register an empty profile; its files are created on first write."""
+    name = (name or '').strip()[:24] or 'Joueur'
+    pid = _new_id(name)
+    _load_index()['profiles'][pid] = {'name': name, 'last_used': 0}
+    shard_dir(pid).mkdir(parents=True, exist_ok=True)
+    _save_index()
+    return pid
+
+
+def rename(pid: str, name: str) -> bool:
+    meta = _load_index()['profiles'].get(pid)
+    name = (name or '').strip()[:24]
+    if meta is None or not name:
+        return False
+    meta['name'] = name
+    _save_index()
+    return True
+
+
+def delete(pid: str) -> bool:
+    """Remove a profile and its shard (not the active one, never 'default')."""
+    idx = _load_index()
+    if pid == DEFAULT_ID or pid == active() or pid not in idx['profiles']:
+        return False
+    try:
+        shutil.rmtree(shard_dir(pid), ignore_errors=True)
+        (PROFILES_DIR / f'{pid}.zip').unlink(missing_ok=True)
+    except Exception:
+        pass
+    del idx['profiles'][pid]
+    _save_index()
+    return True
+
+
+def reload_state() -> None:
+    """Drop every in-memory copy of save data and notify listeners."""
+    try:
+        from . import db as _db
+        from . import defi as _defi
+        from . import season_pass as _sp
+        from . import state_bus
+        from . import stats as _stats
+        from . import wallet as _wallet
+        from . import xp as _xp
+        _defi.reload()
+        _db.reload()
+        _sp.reload()
+        _xp.reload()
+        _stats.invalidate()
+        state_bus.emit(state_bus.WALLET, _wallet.get_balance())
+        state_bus.emit(state_bus.DAILY)
+    except Exception:
+        pass
+
+
+def switch(pid: str) -> bool:
+    """Make pid the active profile; the previous shard is flushed and evicted."""
+    global _active
+    idx = _load_index()
+    if pid not in idx['profiles']:
+        return False
+    prev = active()
+    if pid == prev:
+        return True
+    try:
+        from . import defi as _defi
+        _defi.flush()  # pending writes belong to the previous shard
+    except Exception:
+        pass
+    _unpack(pid)
+    _active = pid
+    idx['active'] = pid
+    now = time.time()
+    idx['profiles'][prev]['last_used'] = now
+    idx['profiles'][pid]['last_used'] = now
+    _save_index()
+    reload_state()
+    archive_idle()
+    return True
+
+
+# ---- idle shards ---- #
+
+def _unpack(pid: str) -> None:
+    z = PROFILES_DIR / f'{pid}.zip'
+    if pid == DEFAULT_ID or not z.exists():
+        return
+    try:
+        d = shard_dir(pid)
+        d.mkdir(parents=True, exist_ok=True)
+        with zipfile.ZipFile(z) as zf:
+            for name in zf.namelist():
+                if name in SHARD_FILES:
+                    (d / name).write_bytes(zf.read(name))
+        z.unlink()
+    except Exception:
+        pass
+
+
+def archive_idle(days: float = IDLE_DAYS, now: Optional[float] = None) -> List[str]:
+    """Pack the shards of profiles unused for `days` into one zip each."""
+    now = time.time() if now is None else now
+    cur = active()
+    packed = []
+    for pid, meta in _load_index()['profiles'].items():
+        if pid in (DEFAULT_ID, cur):
+            continue
+        last = float(meta.get('last_used', 0))
+        d = shard_dir(pid)
+        if not last or now - last < days * 86400 or not d.is_dir():
+            continue
+        files = [d / n for n in SHARD_FILES if (d / n).exists()]
+        try:
+            if files:
+                with zipfile.ZipFile(PROFILES_DIR / f'{pid}.zip', 'w', zipfile.ZIP_DEFLATED) as zf:
+                    for f in files:
+                        zf.write(f, f.name)
+            shutil.rmtree(d, ignore_errors=True)
+            packed.append(pid)
+        except Exception:
+            continue
+    return packed
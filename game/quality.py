@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+# Adaptive effects quality.
+# The governor is fed the measured work time of each animated frame and steps
+# the effects level (particle rate, beams, glow passes, smooth scaling) down as
+# soon as a window runs over budget, and back up only after several windows
+# with clear headroom. The chosen level is written back to settings.json
+# ('effects_quality') so the next launch on the same device starts there.
+
+LEVELS = ('low', 'medium', 'high')
+
+PRESETS: Dict[str, Dict] = {
+    'low': {'factor': 0.6, 'beams': 4, 'glow_passes': 2, 'smooth': False},
+    'medium': {'factor': 1.0, 'beams': 6, 'glow_passes': 4, 'smooth': True},
+    'high': {'factor': 1.5, 'beams': 10, 'glow_passes': 6, 'smooth': True},
+}
+
+
+def normalize(level: str) -> str:
+    return level if level in LEVELS else 'medium'
+
+
+def preset(level: str) -> Dict:
+    return PRESETS[normalize(level)]
+
+
+class QualityGovernor:
+    """Frame-time driven effects level with hysteresis.
+
+    target_ms: frame budget. A window of `window` samples averaging above
+    target_ms * down_ratio steps down one level; `up_windows` consecutive
+    windows under target_ms * up_ratio step up one level. A level we had to
+    leave needs twice as many good windows before it is tried again.
+    """
+
+    def __init__(self, level: str = 'medium', target_ms: float = 1000 / 60, window: int = 45,
+                 down_ratio: float = 1.15, up_ratio: float = 0.6, up_windows: int = 4,
+                 hitch_ms: float = 250.0):
+        self.level = normalize(level)
+        self.target_ms = float(target_ms)
+        self.window = max(1, int(window))
+        self.down_ratio = down_ratio
+        self.up_ratio = up_ratio
+        self.up_windows = max(1, int(up_windows))
+        self.hitch_ms = hitch_ms
+        self._samples: List[float] = []
+        self._good = 0
+        self._skip = 0
+        self._dropped_from: Optional[str] = None
+
+    def reset_window(self) -> None:
+        """Forget partial measurements (e.g. when an animation starts)."""
+        self._samples.clear()
+
+    def sample(self, frame_ms: float) -> Optional[str]:
+        """Record one frame; return the new level if it changed."""
+        if frame_ms <= 0 or frame_ms >= self.hitch_ms:
+            return None  # loading hitches say nothing about effects cost
+        self._samples.append(frame_ms)
+        if len(self._samples) < self.window:
+            return None
+        avg = sum(self._samples) / len(self._samples)
+        self._samples.clear()
+        if self._skip:
+            # first window after a change still carries the old level's cost
+            self._skip -= 1
+            return None
+        idx = LEVELS.index(self.level)
+        if avg > self.target_ms * self.down_ratio:
+            self._good = 0
+            if idx > 0:
+                self._dropped_from = self.level
+                return self._set(LEVELS[idx - 1])
+            return None
+        if avg < self.target_ms * self.up_ratio and idx < len(LEVELS) - 1:
+            self._good += 1
+            need = self.up_windows * (2 if self._dropped_from == LEVELS[idx + 1] else 1)
+            if self._good >= need:
+                return self._set(LEVELS[idx + 1])
+        else:
+            self._good = 0
+        return None
+
+    def _set(self, level: str) -> str:
+        self.level = level
+        self._good = 0
+        self._skip = 1
+        return level
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, Tuple, Union
+
+import pygame
+
+from . import quality as quality_mod
+
+# Render scale for fill-rate-bound screens.
+# Screens lay out in logical pixels (App.size) and keep drawing text, panels
+# and cards at native resolution. Their full-screen passes (dims, particles)
+# go through the RenderTarget instead: layer() hands out an offscreen surface
+# at `scale` x the logical size, present() upscales it onto the screen in one
+# nearest-neighbour pass (smoothscale costs more than it saves), and the
+# native UI is drawn on top. Only the exact half scale is offered: a
+# non-integer nearest upscale costs more than drawing at full size.
+# Static backdrops (background cover + dim) gain nothing from a lower
+# resolution: backdrop() composes them once at native size and caches the
+# result, so they cost one opaque blit per frame.
+# settings 'render_scale' is 1.0 / 0.5, or 'auto': a QualityGovernor fed
+# with the frame times of `scaled` screens switches between the two (its
+# 'medium' level is full scale, 'low' is half).
+
+SCALES = (1.0, 0.5)
+_BY_LEVEL = {'medium': 1.0, 'low': 0.5}
+_BACKDROPS_MAX = 8
+
+Mode = Union[str, float]
+
+
+def normalize(mode: Mode) -> Mode:
+    if mode == 'auto':
+        return 'auto'
+    try:
+        m = float(mode)
+    except (TypeError, ValueError):
+        return 'auto'
+    return m if m in SCALES else 'auto'
+
+
+def label(mode: Mode) -> str:
+    mode = normalize(mode)
+    return 'Auto' if mode == 'auto' else f'{int(mode * 100)}%'
+
+
+def next_mode(mode: Mode) -> Mode:
+    """Settings cycle: auto -> 100% -> 50% -> auto."""
+    order = ('auto',) + SCALES
+    return order[(order.index(normalize(mode)) + 1) % len(order)]
+
+
+class RenderTarget:
+    """Offscreen layer at a fixed or adaptive fraction of the logical size."""
+
+    def __init__(self, size: Tuple[int, int], mode: Mode = 'auto', target_ms: float = 1000 / 60):
+        self.size = size
+        self.governor = quality_mod.QualityGovernor('medium', target_ms=target_ms)
+        self._layer = None
+        self._dims: Dict[Tuple, pygame.Surface] = {}
+        self._backdrops: Dict[Tuple, pygame.Surface] = {}
+        self.set_mode(mode)
+
+    def set_mode(self, mode: Mode) -> None:
+        self.mode = normalize(mode)
+        if self.mode == 'auto':
+            self.governor.level = 'medium'
+            self.governor.reset_window()
+            self.scale = 1.0
+        else:
+            self.scale = float(self.mode)
+
+    def sample(self, frame_ms: float) -> bool:
+        """Feed one frame time (auto mode); True when the scale changed."""
+        if self.mode != 'auto':
+            return False
+        lvl = self.governor.sample(frame_ms)
+        if lvl is None:
+            return False
+        if lvl not in _BY_LEVEL:
+            self.governor.level = 'medium'  # nothing above full scale
+            return False
+        self.scale = _BY_LEVEL[lvl]
+        return True
+
+    def layer_size(self) -> Tuple[int, int]:
+        w, h = self.size
+        return max(1, int(w * self.scale)), max(1, int(h * self.scale))
+
+    def layer(self, screen: pygame.Surface) -> pygame.Surface:
+        """Surface for this frame's full-screen passes (the screen itself at 100%)."""
+        if self.scale >= 1.0:
+            return screen
+        size = self.layer_size()
+        if self._layer is None or self._layer.get_size() != size:
+            self._layer = pygame.Surface(size, 0, screen)
+        return self._layer
+
+    def present(self, screen: pygame.Surface, layer: pygame.Surface) -> None:
+        if layer is not screen:
+            pygame.transform.scale(layer, screen.get_size(), screen)
+
+    def dim(self, alpha: int, size: Tuple[int, int]) -> pygame.Surface:
+        """Cached opaque black surface blended at `alpha` (cheaper than a per-frame SRCALPHA fill)."""
+        key = (alpha, size)
+        s = self._dims.get(key)
+        if s is None:
+            s = pygame.Surface(size)
+            s.fill((0, 0, 0))
+            s.set_alpha(alpha)
+            self._dims[key] = s
+        return s
+
+    def backdrop(self, key, compose: Callable[[pygame.Surface], None]) -> pygame.Surface:
+        """Native-size static backdrop drawn once by compose(surface), cached per key."""
+        k = (key, self.size)
+        s = self._backdrops.get(k)
+        if s is None:
+            if len(self._backdrops) >= _BACKDROPS_MAX:
+                self._backdrops.clear()
+            s = pygame.Surface(self.size)
+            compose(s)
+            self._backdrops[k] = s
+        return s
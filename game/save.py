@@ -1,39 +1,48 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+from . import profiles
 
 
 ROOT = Path(__file__).resolve().parents[1]
 DATA_DIR = ROOT / 'data'
 
 
-RESET_FILES: List[str] = [
-    'collection.json',
-    'profile.json',
-    'wallet.json',
-    'sbc_progress.json',
-    'defi_progress.json',
-    'season_pass_progress.json',
-    'daily_rewards.json',
-]
+RESET_FILES: List[str] = list(profiles.SHARD_FILES)
 
 
-def reset_all_progress() -> Dict[str, bool]:
-    """Delete all progress/save files so the game restarts from a fresh state.
+def reset_all_progress(pid: Optional[str] = None) -> Dict[str, bool]:
+    """Delete all progress/save files of a profile (the active one by default)
+    so it restarts from a fresh state.
 
     We intentionally do not touch static content like players.json, players images,
     or settings.json. Modules will recreate missing files with their defaults.
 
     Returns a dict mapping filename -> success flag for deletion.
     """
+    target = pid or profiles.active()
+    shard = profiles.shard_dir(target)
     results: Dict[str, bool] = {}
     for name in RESET_FILES:
         try:
-            p = DATA_DIR / name
+            p = shard / name
             if p.exists():
                 p.unlink()
             results[name] = True
         except Exception:
             results[name] = False
+    # an idle profile's shard lives in its archive (see profiles.archive_idle);
+    # a leftover zip would be unpacked over the fresh state on the next switch
+    archive = profiles.PROFILES_DIR / f'{target}.zip'
+    if archive.exists():
+        try:
+            archive.unlink()
+            results[archive.name] = True
+        except Exception:
+            results[archive.name] = False
+    # drop in-memory copies so modules re-read their (now missing) files
+    if target == profiles.active():
+        profiles.reload_state()
     return results
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import copy
+import importlib
+import json
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from . import profiles
+
+# Binary save files.
+# Every save shard file is <stem>.sav: MAGIC, the schema version (u16) and the
+# payload in a compact msgpack-style encoding (subset below, no dependency).
+# Each save module registers its schema: a default value and a list of
+# migrations, migration i taking a version-i value to version i + 1; version 0
+# is whatever the legacy pretty-printed <stem>.json held. A .sav already at the
+# current version is decoded as-is, so the back-compat normalization loaders
+# used to re-run on every access now runs once: the first load of a legacy
+# .json migrates it and writes the .sav, which wins from then on. The .json is
+# left in place (the defaults under data/ are tracked; *.sav is gitignored).
+# export_json() (or `python -m game.savefile [dir] [profile]`) dumps the active
+# shard as readable JSON for debugging.
+
+MAGIC = b'MFS\x01'
+SAV_EXT = '.sav'
+LEGACY_EXT = '.json'
+
+Migration = Callable[[Any], Any]
+
+
+class SaveFormatError(ValueError):
+    pass
+
+
+# ---- encoding ---- #
+# None c0, False c2, True c3, fixint 00-7f / e0-ff, int32 d2, int64 d3,
+# float64 cb, fixstr a0-bf, str32 db, fixarray 90-9f, array32 dd,
+# fixmap 80-8f, map32 df. Strings are UTF-8.
+
+_I32 = struct.Struct('>i')
+_I64 = struct.Struct('>q')
+_F64 = struct.Struct('>d')
+_U32 = struct.Struct('>I')
+
+
+def _enc(obj: Any, out: bytearray) -> None:
+    if obj is None:
+        out.append(0xC0)
+    elif obj is True:
+        out.append(0xC3)
+    elif obj is False:
+        out.append(0xC2)
+    elif isinstance(obj, int):
+        if 0 <= obj < 0x80:
+            out.append(obj)
+        elif -32 <= obj < 0:
+            out.append(obj & 0xFF)
+        elif -0x80000000 <= obj < 0x80000000:
+            out.append(0xD2)
+            out += _I32.pack(obj)
+        elif -(1 << 63) <= obj < (1 << 63):
+            out.append(0xD3)
+            out += _I64.pack(obj)
+        else:
+            raise SaveFormatError(f'int out of range: {obj}')
+    elif isinstance(obj, float):
+        out.append(0xCB)
+        out += _F64.pack(obj)
+    elif isinstance(obj, str):
+        b = obj.encode('utf-8')
+        if len(b) < 32:
+            out.append(0xA0 | len(b))
+        else:
+            out.append(0xDB)
+            out += _U32.pack(len(b))
+        out += b
+    elif isinstance(obj, (list, tuple)):
+        n = len(obj)
+        if n < 16:
+            out.append(0x90 | n)
+        else:
+            out.append(0xDD)
+            out += _U32.pack(n)
+        for v in obj:
+            _enc(v, out)
+    elif isinstance(obj, dict):
+        n = len(obj)
+        if n < 16:
+            out.append(0x80 | n)
+        else:
+            out.append(0xDF)
+            out += _U32.pack(n)
+        for k, v in obj.items():
+            _enc(k, out)
+            _enc(v, out)
+    else:
+        raise SaveFormatError(f'cannot encode {type(obj).__name__}')
+
+
+def encode(obj: Any) -> bytes:
+    out = bytearray()
+    _enc(obj, out)
+    return bytes(out)
+
+
+def _dec(buf: bytes, i: int) -> Tuple[Any, int]:
+    t = buf[i]
+    i += 1
+    if t < 0x80:
+        return t, i
+    if t >= 0xE0:
+        return t - 0x100, i
+    if 0xA0 <= t < 0xC0:
+        n = t & 0x1F
+        return buf[i:i + n].decode('utf-8'), i + n
+    if 0x80 <= t < 0x90:
+        return _dec_map(buf, i, t & 0x0F)
+    if 0x90 <= t < 0xA0:
+        n = t & 0x0F
+        lst = []
+        for _ in range(n):
+            v, i = _dec(buf, i)
+            lst.append(v)
+        return lst, i
+    if t == 0xC0:
+        return None, i
+    if t == 0xC2:
+        return False, i
+    if t == 0xC3:
+        return True, i
+    if t == 0xD2:
+        return _I32.unpack_from(buf, i)[0], i + 4
+    if t == 0xD3:
+        return _I64.unpack_from(buf, i)[0], i + 8
+    if t == 0xCB:
+        return _F64.unpack_from(buf, i)[0], i + 8
+    if t in (0xDB, 0xDD, 0xDF):
+        n = _U32.unpack_from(buf, i)[0]
+        i += 4
+        if t == 0xDB:
+            return buf[i:i + n].decode('utf-8'), i + n
+        if t == 0xDD:
+            lst = []
+            for _ in range(n):
+                v, i = _dec(buf, i)
+                lst.append(v)
+            return lst, i
+        return _dec_map(buf, i, n)
+    raise SaveFormatError(f'bad tag 0x{t:02x} at {i - 1}')
+
+
+def _dec_map(buf: bytes, i: int, n: int) -> Tuple[Dict, int]:
+    d = {}
+    for _ in range(n):
+        k, i = _dec(buf, i)
+        d[k], i = _dec(buf, i)
+    return d, i
+
+
+def decode(buf: bytes) -> Any:
+    try:
+        obj, i = _dec(buf, 0)
+    except (IndexError, struct.error, UnicodeDecodeError) as e:
+        raise SaveFormatError(f'truncated save data: {e}') from None
+    if i != len(buf):
+        raise SaveFormatError('trailing bytes')
+    return obj
+
+
+# ---- schemas ---- #
+
+_schemas: Dict[str, Tuple[Any, List[Migration]]] = {}
+
+
+def register(stem: str, default: Any, migrations: List[Migration]) -> None:
+    """Declare the save file `stem`: its default value and its migrations."""
+    _schemas[stem] = (default, list(migrations))
+
+
+def version(stem: str) -> int:
+    return len(_schemas[stem][1])
+
+
+def _default(stem: str) -> Any:
+    return copy.deepcopy(_schemas[stem][0])
+
+
+def _migrate(stem: str, data: Any, from_version: int) -> Any:
+    for fn in _schemas[stem][1][from_version:]:
+        data = fn(data)
+    return data
+
+
+def sav_path(stem: str, pid: Optional[str] = None) -> Path:
+    return profiles.shard_dir(pid) / (stem + SAV_EXT)
+
+
+def legacy_path(stem: str, pid: Optional[str] = None) -> Path:
+    return profiles.shard_dir(pid) / (stem + LEGACY_EXT)
+
+
+def exists(stem: str) -> bool:
+    return sav_path(stem).exists() or legacy_path(stem).exists()
+
+
+def _read_sav(path: Path) -> Tuple[int, Any]:
+    buf = path.read_bytes()
+    if buf[:4] != MAGIC or len(buf) < 6:
+        raise SaveFormatError(f'{path.name}: not a save file')
+    ver = struct.unpack_from('>H', buf, 4)[0]
+    return ver, decode(buf[6:])
+
+
+def _write_sav(path: Path, stem: str, data: Any) -> None:
+    blob = MAGIC + struct.pack('>H', version(stem)) + encode(data)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix('.tmp')
+    tmp.write_bytes(blob)
+    os.replace(tmp, path)
+
+
+def load(stem: str) -> Any:
+    """Current-version value of save file `stem` in the active profile (a fresh
+    object the caller may mutate). Falls back to the default on any error."""
+    sav = sav_path(stem)
+    try:
+        if sav.exists():
+            ver, data = _read_sav(sav)
+            if ver < version(stem):
+                data = _migrate(stem, data, ver)
+                _write_sav(sav, stem, data)
+            return data
+        legacy = legacy_path(stem)
+        if legacy.exists():
+            with legacy.open('r', encoding='utf-8') as f:
+                data = _migrate(stem, json.load(f), 0)
+            _write_sav(sav, stem, data)
+            return data
+    except Exception:
+        pass
+    return _default(stem)
+
+
+def save(stem: str, data: Any) -> None:
+    """Write save file `stem` of the active profile at the current version."""
+    _write_sav(sav_path(stem), stem, data)
+
+
+# ---- debugging ---- #
+
+_SAVE_MODULES = ('wallet', 'xp', 'db', 'sbc', 'defi', 'season_pass', 'daily_rewards')
+
+
+def _register_all() -> None:
+    # schemas are registered by the save modules on import
+    for mod in _SAVE_MODULES:
+        importlib.import_module('game.' + mod)
+
+
+def export_json(dest: Optional[Path] = None, pid: Optional[str] = None) -> List[Path]:
+    """Write every save file of a profile as pretty-printed <stem>.json into dest
+    (default: <shard>/export/). Returns the written paths."""
+    _register_all()
+    dest = Path(dest) if dest is not None else profiles.shard_dir(pid) / 'export'
+    dest.mkdir(parents=True, exist_ok=True)
+    written = []
+    for stem in sorted(_schemas):
+        sav = sav_path(stem, pid)
+        try:
+            if sav.exists():
+                ver, data = _read_sav(sav)
+            elif legacy_path(stem, pid).exists():
+                ver, data = 0, json.loads(legacy_path(stem, pid).read_text(encoding='utf-8'))
+            else:
+                continue
+        except Exception:
+            continue
+        out = dest / (stem + '.json')
+        out.write_text(json.dumps({'schema': ver, 'data': data}, ensure_ascii=False, indent=2), encoding='utf-8')
+        written.append(out)
+    return written
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    dest = Path(argv[0]) if argv else None
+    pid = argv[1] if len(argv) > 1 else None
+    for p in export_json(dest, pid):
+        print(p)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Tuple
-from pathlib import Path
-import json
+from typing import List, Dict, Mapping, Optional, Tuple
 
 from . import db as game_db
+from . import content
+from . import savefile
 from .cards import Card
 
 
@@ -25,12 +25,14 @@ class SBCChallenge:
     reward_pack: Tuple[str, int]  # (pack_name, count)
 
 
+SQUAD_SIZE = 11  # every squad is submitted as a full 4-3-3 (SBCSquad's slots)
+
 # Minimal set of SBCs tailored to available data (name, rating, rarity only)
 CHALLENGES: List[SBCChallenge] = [
     SBCChallenge(
         id='bronze_basic',
         name='Défi Basique',
-        description='Soumets 3 joueurs, note moyenne ≥ 70. Rareté libre.',
+        description='11 joueurs, note moyenne ≥ 70. Rareté libre.',
         requirement=SBCRequirement(min_count=3, min_avg_rating=70, allowed_rarities=None),
         reward_pack=('Pack Classique', 3),
     ),
@@ -53,14 +55,14 @@ CHALLENGES: List[SBCChallenge] = [
     SBCChallenge(
         id='gold_rare',
         name='Or Rare',
-        description='Soumets 5 joueurs or rare, note moyenne ≥ 80.',
+        description='11 joueurs or rare, note moyenne ≥ 80.',
         requirement=SBCRequirement(min_count=5, min_avg_rating=80, allowed_rarities=['or rare']),
         reward_pack=('Pack Premium', 5),
     ),
     SBCChallenge(
         id='elite_heroes',
         name='Héros & Icônes',
-        description='Soumets 3 joueurs héro/icon, note moyenne ≥ 85.',
+        description='11 joueurs héro/icon, note moyenne ≥ 85.',
         requirement=SBCRequirement(min_count=3, min_avg_rating=85, allowed_rarities=['hero', 'icon']),
         reward_pack=('Pack Icône', 3),
     ),
@@ -236,6 +238,10 @@ CHALLENGES: List[SBCChallenge] = [
 ]
 
 
+def get_challenge(ch_id: str) -> Optional[SBCChallenge]:
+    return content.registry().challenge_by_id.get(ch_id)
+
+
 def canonical_rarity(r: str) -> str:
     rl = (r or '').strip().lower()
     if rl in ('or rare', 'or_rare', 'gold rare', 'gold_rare', 'rare', 'rare gold', 'rare_gold'):
@@ -258,8 +264,14 @@ def get_owned_pool() -> Dict[str, int]:
 
 def get_catalog_index() -> Dict[str, Dict]:
     """Map base name -> best player entry (name, rating, rarity, image)."""
-    catalog = game_db.get_unique_catalog()
-    return {c['name']: c for c in catalog}
+    from . import ids as card_ids
+    return dict(card_ids.catalog_index())
+
+
+def squad_size(challenge: SBCChallenge) -> int:
+    """Players a squad must hold: the full 4-3-3 of the squad builder
+    (min_count only matters if it ever asks for more)."""
+    return max(SQUAD_SIZE, int(challenge.requirement.min_count))
 
 
 def validate_selection(selection: List[str], challenge: SBCChallenge) -> Tuple[bool, str]:
@@ -267,8 +279,11 @@ def validate_selection(selection: List[str], challenge: SBCChallenge) -> Tuple[b
     selection: list of base player names.
     """
     req = challenge.requirement
-    if len(selection) < req.min_count:
-        return False, f"Sélection incomplète ({len(selection)}/{req.min_count})."
+    n = squad_size(challenge)
+    if len(selection) < n:
+        return False, f"Sélection incomplète ({len(selection)}/{n})."
+    if len(selection) > n:
+        return False, f"Trop de joueurs ({len(selection)}/{n})."
 
     index = get_catalog_index()
     ratings = []
@@ -311,7 +326,6 @@ def consume(selection: List[str]) -> Dict[str, int]:
 
 # ----------------- Progress & Special Reward (Busquets EOE) ----------------- #
 
-_PROGRESS_PATH = Path(__file__).resolve().parents[1] / 'data' / 'sbc_progress.json'
 _BUSQUETS_IDS = ['busquets_eoe_1', 'busquets_eoe_2', 'busquets_eoe_3', 'busquets_eoe_4']
 _BUSQUETS_NAME = 'Sergio Busquets'
 _BUSQUETS_RARITY = "fin d'une ère"
@@ -371,21 +385,25 @@ _DOLAN_RARITY = 'world tour'
 _DOLAN_RATING = 84
 
 
+def _migrate_progress_v1(data) -> Dict:
+    # legacy sbc_progress.json: completed must be a list of challenge ids
+    if not isinstance(data, dict):
+        data = {}
+    if not isinstance(data.get('completed'), list):
+        data['completed'] = []
+    return data
+
+
+savefile.register('sbc_progress', {"completed": []}, [_migrate_progress_v1])
+
+
 def _load_progress() -> Dict:
-    try:
-        if _PROGRESS_PATH.exists():
-            with _PROGRESS_PATH.open('r', encoding='utf-8') as f:
-                return json.load(f)
-    except Exception:
-        pass
-    return {"completed": []}
+    return savefile.load('sbc_progress')
 
 
 def _save_progress(data: Dict) -> None:
     try:
-        _PROGRESS_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with _PROGRESS_PATH.open('w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        savefile.save('sbc_progress', data)
     except Exception:
         pass
 
@@ -399,6 +417,21 @@ def mark_completed(ch_id: str) -> None:
         _save_progress(data)
 
 
+def mark_completed_many(ch_ids: List[str]) -> None:
+    """mark_completed for several challenges with a single progress write."""
+    data = _load_progress()
+    comp = set(data.get('completed', []))
+    if not set(ch_ids) - comp:
+        return
+    comp.update(ch_ids)
+    data['completed'] = sorted(list(comp))
+    _save_progress(data)
+
+
+def completed_ids() -> set:
+    return set(_load_progress().get('completed', []))
+
+
 def is_completed(ch_id: str) -> bool:
     data = _load_progress()
     return ch_id in set(data.get('completed', []))
@@ -550,14 +583,46 @@ def check_and_grant_dolan_bundle() -> Optional[Card]:
     return Card(name=_DOLAN_NAME, rarity=_DOLAN_RARITY, bg_color=(60, 200, 220), rating=_DOLAN_RATING)
 
 
+# bundle series -> (special card, grant check), in the order the squad screen runs them
+BUNDLES = [
+    (_BUSQUETS_IDS, _BUSQUETS_NAME, check_and_grant_busquets_bundle),
+    (_ALBA_IDS, _ALBA_NAME, check_and_grant_alba_bundle),
+    (_GORETZKA_IDS, _GORETZKA_NAME, check_and_grant_goretzka_bundle),
+    (_DZEKO_IDS, _DZEKO_NAME, check_and_grant_dzeko_bundle),
+    (_SHAQIRI_IDS, _SHAQIRI_NAME, check_and_grant_shaqiri_bundle),
+    (_VANBUYTEN_IDS, _VANBUYTEN_NAME, check_and_grant_vanbuyten_bundle),
+    (_PAYET_IDS, _PAYET_NAME, check_and_grant_payet_bundle),
+    (_ZLATAN_IDS, _ZLATAN_NAME, check_and_grant_zlatan_bundle),
+    (_POGBA_IDS, _POGBA_NAME, check_and_grant_pogba_bundle),
+    (_DOLAN_IDS, _DOLAN_NAME, check_and_grant_dolan_bundle),
+]
+
+
+def check_and_grant_all() -> List[Card]:
+    """Run every bundle check; returns the special cards granted now."""
+    out: List[Card] = []
+    for _ids, _name, check in BUNDLES:
+        try:
+            c = check()
+        except Exception:
+            c = None
+        if c is not None:
+            out.append(c)
+    return out
+
+
 # ----------------- Catalog helpers: SBC-only special players ----------------- #
 
-def get_sbc_only_players() -> List[Dict]:
-    """Return a list of special players that are only unlockable via SBCs (not packable).
+def get_sbc_only_players() -> Tuple[Mapping, ...]:
+    """Return the special players that are only unlockable via SBCs (not packable).
 
     Each item contains at least: name, rating, rarity, and flags sbc_only=True, packable=False.
     Images are resolved at render-time via avatar mapping; we do not set image paths here.
     """
+    return content.registry().sbc_only
+
+
+def _sbc_only_players() -> List[Dict]:
     specials = [
         {"name": _BUSQUETS_NAME, "rating": _BUSQUETS_RATING, "rarity": _BUSQUETS_RARITY},
         {"name": _ALBA_NAME, "rating": _ALBA_RATING, "rarity": _ALBA_RARITY},
@@ -0,0 +1,349 @@
+from __future__ import annotations
+
+import bisect
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .cards import Card
+from .packs import generate_pack
+from . import db as game_db
+from . import sbc as sbc_mod
+from . import defi as defi_mod
+
+# Global SBC planner.
+# Looks at every open challenge at once and decides which duplicates go where,
+# instead of filling squads one by one. Only spare copies are used (one copy
+# of each card is always kept) and a series step is only planned once the
+# previous step is completed or planned before it.
+# plan() runs an adaptive greedy (best value per "card cost" first, each
+# squad filled with the cheapest cards that reach the average) then a local
+# search that bans or forces one challenge at a time and keeps any plan that
+# scores better, until the time budget runs out. The search runs once per
+# objective and the better plan for the requested one wins. Every squad holds
+# sbc.squad_size() cards, like the squad builder. apply() commits the whole
+# plan in one go: one collection write, one progress write, one defi update.
+
+TIME_BUDGET = 0.6  # seconds for plan(), local search included
+OBJECTIVES = ('count', 'value')
+
+# per-card value of a reward pack (shop price / cards, see the Packs screen)
+PACK_CARD_VALUE = {
+    'Pack Classique': 20,
+    'Pack Premium': 60,
+    'Pack Icône': 267,
+}
+BUNDLE_VALUE = 1000  # completing a bundle series grants an SBC-only card
+
+
+def _card_cost(rating: int) -> float:
+    # high-rated fodder is much scarcer than low-rated fodder
+    return 1.25 ** (int(rating) - 75)
+
+
+def _min_sum(count: int, target: int) -> int:
+    """Smallest rating total whose rounded average reaches target (as validate_selection)."""
+    s = max(0, int((target - 0.5) * count) - 1)
+    while int(round(s / count)) < target:
+        s += 1
+    return s
+
+
+def challenge_value(ch: sbc_mod.SBCChallenge) -> int:
+    pack, count = ch.reward_pack
+    return PACK_CARD_VALUE.get(pack, 20) * int(count)
+
+
+def series_from_groups(groups: Sequence[Sequence[str]]) -> List[List[str]]:
+    """Challenge series in tile order; an id only counts in its first group."""
+    seen = set()
+    out: List[List[str]] = []
+    for ids in groups:
+        s = [cid for cid in ids if cid not in seen]
+        seen.update(s)
+        if s:
+            out.append(s)
+    for ch in sbc_mod.CHALLENGES:
+        if ch.id not in seen:
+            out.append([ch.id])
+    return out
+
+
+def default_series() -> List[List[str]]:
+    """Series by id prefix ('busquets_eoe_1' -> 'busquets_eoe'), CHALLENGES order."""
+    groups: Dict[str, List[str]] = {}
+    for ch in sbc_mod.CHALLENGES:
+        head, _, tail = ch.id.rpartition('_')
+        key = head if (head and tail.isdigit()) else ch.id
+        groups.setdefault(key, []).append(ch.id)
+    return list(groups.values())
+
+
+@dataclass
+class Plan:
+    # [(challenge id, base names used)] in the order they must be submitted
+    assignments: List[Tuple[str, List[str]]] = field(default_factory=list)
+    completed: int = 0
+    value: int = 0
+    cost: float = 0.0
+    bundles: int = 0  # bundle series this plan finishes
+    cards_used: int = 0
+    elapsed_ms: float = 0.0
+
+    def challenge_ids(self) -> List[str]:
+        return [cid for cid, _ in self.assignments]
+
+
+@dataclass
+class ApplyResult:
+    completed: List[str] = field(default_factory=list)
+    rewards: List[Card] = field(default_factory=list)
+    specials: List[Card] = field(default_factory=list)
+    error: str = ''
+
+
+# ---- planning ---- #
+
+class _Ctx:
+    """Static data for one planning run."""
+
+    def __init__(self, owned: Dict[str, int], series: List[List[str]], done: set, objective: str):
+        index = sbc_mod.get_catalog_index()
+        self.objective = objective if objective in OBJECTIVES else 'count'
+        self.rating: Dict[str, int] = {}
+        self.spare: Dict[str, int] = {}
+        rarity: Dict[str, str] = {}
+        for base, n in owned.items():
+            item = index.get(base)
+            if not item or int(n) < 2:
+                continue
+            self.spare[base] = int(n) - 1
+            self.rating[base] = int(item.get('rating', 0))
+            rarity[base] = sbc_mod.canonical_rarity(item.get('rarity', ''))
+        by_id = {ch.id: ch for ch in sbc_mod.CHALLENGES}
+        bundle_of = {}
+        for ids, _name, _check in sbc_mod.BUNDLES:
+            if ids:
+                bundle_of[ids[-1]] = ids
+        self.series: List[List[str]] = []
+        self.prev: Dict[str, Optional[str]] = {}
+        self.need: Dict[str, Tuple[int, int]] = {}  # id -> (count, min rating total)
+        self.bases: Dict[str, List[str]] = {}  # id -> allowed bases, rating ascending
+        self.value: Dict[str, int] = {}
+        self.is_bundle_end: Dict[str, bool] = {}
+        ordered = sorted(self.spare, key=lambda b: (self.rating[b], b))
+        for ids in series:
+            open_ids = [cid for cid in ids if cid in by_id and cid not in done]
+            if not open_ids:
+                continue
+            self.series.append(open_ids)
+            prev = None
+            for cid in open_ids:
+                ch = by_id[cid]
+                req = ch.requirement
+                k = sbc_mod.squad_size(ch)
+                self.prev[cid] = prev
+                prev = cid
+                self.need[cid] = (k, _min_sum(k, int(req.min_avg_rating)))
+                allowed = set(req.allowed_rarities) if req.allowed_rarities else None
+                self.bases[cid] = [b for b in ordered if allowed is None or rarity[b] in allowed]
+                end = cid in bundle_of and all(x == cid or x in done or x in open_ids for x in bundle_of[cid])
+                self.is_bundle_end[cid] = end
+                self.value[cid] = challenge_value(ch) + (BUNDLE_VALUE if end else 0)
+
+    def key(self, plan: Plan) -> Tuple:
+        return _key(self.objective, plan)
+
+
+def _key(objective: str, plan: Plan) -> Tuple:
+    if objective == 'value':
+        return (plan.value, plan.completed, -plan.cost)
+    return (plan.completed, plan.value, -plan.cost)
+
+
+def _fill(ctx: _Ctx, cid: str, left: Dict[str, int]) -> Optional[Tuple[List[str], float]]:
+    """Cheapest squad for one challenge from the remaining copies, or None."""
+    k, need = ctx.need[cid]
+    units: List[int] = []
+    names: List[str] = []
+    for b in ctx.bases[cid]:
+        n = left.get(b, 0)
+        if n > 0:
+            r = ctx.rating[b]
+            units.extend([r] * n)
+            names.extend([b] * n)
+    if len(units) < k or sum(units[-k:]) < need:
+        return None
+    chosen = list(range(k))  # indices into units (ascending ratings)
+    total = sum(units[:k])
+    free = list(range(k, len(units)))
+    free_r = units[k:]
+    while total < need:
+        # upgrade the weakest pick to the cheapest spare copy that closes the gap,
+        # or to the best spare copy if none does
+        lo = chosen.pop(0)
+        gap = need - total
+        j = bisect.bisect_left(free_r, units[lo] + gap)
+        if j >= len(free_r):
+            j = len(free_r) - 1
+        if j < 0 or free_r[j] <= units[lo]:
+            return None
+        hi = free.pop(j)
+        free_r.pop(j)
+        i = bisect.bisect_left(free_r, units[lo])
+        free.insert(i, lo)
+        free_r.insert(i, units[lo])
+        total += units[hi] - units[lo]
+        bisect.insort(chosen, hi)
+    picked = [names[i] for i in chosen]
+    return picked, sum(_card_cost(units[i]) for i in chosen)
+
+
+def _greedy(ctx: _Ctx, banned=frozenset(), forced: Sequence[str] = (), by_value: Optional[bool] = None) -> Plan:
+    left = dict(ctx.spare)
+    plan = Plan()
+    planned = set()
+    forced = [f for f in forced if f not in banned]
+    if by_value is None:
+        by_value = ctx.objective == 'value'
+    squads: Dict[str, Optional[Tuple[List[str], float]]] = {}  # fills still valid for `left`
+    while True:
+        cands = [cid for s in ctx.series for cid in s
+                 if cid not in planned and cid not in banned
+                 and (ctx.prev[cid] is None or ctx.prev[cid] in planned)]
+        best = None
+        for cid in cands:
+            if cid not in squads:
+                squads[cid] = _fill(ctx, cid, left)
+            got = squads[cid]
+            if got is None:
+                continue
+            if cid in forced:
+                best = (float('inf'), cid, got)
+                break
+            weight = ctx.value[cid] if by_value else 1000 + ctx.value[cid]
+            score = weight / max(got[1], 1e-6)
+            if best is None or score > best[0]:
+                best = (score, cid, got)
+        if best is None:
+            break
+        _score, cid, (picked, cost) = best
+        for b in picked:
+            left[b] -= 1
+        # a squad that doesn't use the consumed cards is still the one _fill would pick
+        taken = set(picked)
+        for other in list(squads):
+            got = squads[other]
+            if other == cid or got is None or taken.intersection(got[0]):
+                del squads[other]
+        planned.add(cid)
+        plan.assignments.append((cid, picked))
+        plan.completed += 1
+        plan.value += ctx.value[cid]
+        plan.cost += cost
+        plan.cards_used += len(picked)
+        if ctx.is_bundle_end.get(cid):
+            plan.bundles += 1
+    return plan
+
+
+def _search(ctx: _Ctx, best: Plan, deadline: float, objective: str) -> Plan:
+    ids = [cid for s in ctx.series for cid in s]
+    rng = random.Random(len(ids) * 7919 + len(ctx.spare))
+    improved = True
+    while improved and time.perf_counter() < deadline:
+        improved = False
+        in_plan = best.challenge_ids()
+        moves = [({cid}, ()) for cid in in_plan]
+        moves += [(frozenset(), (cid,)) for cid in ids if cid not in in_plan]
+        moves += [({a}, (b,)) for a in in_plan for b in ids if b not in in_plan]
+        rng.shuffle(moves)
+        for banned, forced in moves:
+            if time.perf_counter() >= deadline:
+                break
+            cand = _greedy(ctx, banned, forced, by_value=objective == 'value')
+            if _key(objective, cand) > _key(objective, best):
+                best = cand
+                improved = True
+                break
+    return best
+
+
+def plan(objective: str = 'count', series: Optional[Sequence[Sequence[str]]] = None,
+         owned: Optional[Dict[str, int]] = None, budget: float = TIME_BUDGET) -> Plan:
+    """Best allocation of the current duplicates over all open challenges.
+    objective='count' maximizes completed challenges, 'value' the reward value."""
+    t0 = time.perf_counter()
+    if owned is None:
+        owned = sbc_mod.get_owned_pool()
+    if series is None:
+        series = default_series()
+    ctx = _Ctx(owned, [list(s) for s in series], sbc_mod.completed_ids(), objective)
+    seeds = (_greedy(ctx, by_value=False), _greedy(ctx, by_value=True))
+    # one search per objective, always in the same order, each with half the
+    # budget (plus what the previous one left): the local optimum of one
+    # objective is often beaten by the other's, and keeping the better of the
+    # two means 'value' never returns less value than 'count' (nor 'count'
+    # fewer challenges than 'value')
+    found = []
+    for i, obj in enumerate(OBJECTIVES):
+        seed = max(seeds, key=lambda p, o=obj: _key(o, p))
+        until = t0 + max(0.0, budget) * (i + 1) / len(OBJECTIVES)
+        found.append(_search(ctx, seed, until, obj))
+    best = max(found, key=ctx.key)
+    best.elapsed_ms = (time.perf_counter() - t0) * 1000
+    return best
+
+
+# ---- applying ---- #
+
+def check(p: Plan, owned: Optional[Dict[str, int]] = None) -> Tuple[bool, str]:
+    """Re-validate a plan against the current collection and progress."""
+    if owned is None:
+        owned = sbc_mod.get_owned_pool()
+    by_id = {ch.id: ch for ch in sbc_mod.CHALLENGES}
+    done = sbc_mod.completed_ids()
+    need: Dict[str, int] = {}
+    for cid, names in p.assignments:
+        ch = by_id.get(cid)
+        if ch is None:
+            return False, f"Défi inconnu: {cid}"
+        if cid in done:
+            return False, f"Défi déjà terminé: {ch.name}"
+        ok, msg = sbc_mod.validate_selection(names, ch)
+        if not ok:
+            return False, f"{ch.name}: {msg}"
+        for n in names:
+            need[n] = need.get(n, 0) + 1
+    for n, cnt in need.items():
+        if owned.get(n, 0) - cnt < 1:
+            return False, f"Utilise uniquement tes doublons (pas assez de {n})."
+    return True, 'OK'
+
+
+def apply(p: Plan) -> ApplyResult:
+    """Submit every squad of the plan as one transaction."""
+    res = ApplyResult()
+    if not p.assignments:
+        res.error = 'Aucun défi réalisable avec tes doublons.'
+        return res
+    ok, msg = check(p)
+    if not ok:
+        res.error = msg
+        return res
+    by_id = {ch.id: ch for ch in sbc_mod.CHALLENGES}
+    used: List[str] = []
+    for cid, names in p.assignments:
+        used.extend(names)
+        pack, count = by_id[cid].reward_pack
+        res.rewards.extend(generate_pack(pack, count))
+        res.completed.append(cid)
+    game_db.update_collection(add=[c.name for c in res.rewards], remove=used)
+    sbc_mod.mark_completed_many(res.completed)
+    try:
+        defi_mod.add_progress('sbc_completed', len(res.completed))
+    except Exception:
+        pass
+    res.specials = sbc_mod.check_and_grant_all()
+    return res
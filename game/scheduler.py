@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import heapq
+import time
+from datetime import timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from . import state_bus
+from . import timeutil as tz
+
+# In-memory timer scheduler.
+# Every deadline the game counts down to (event timers, the 19:00 Europe/Paris
+# daily reset, the calendar day change) lives in one min-heap of epoch seconds.
+# The App calls tick() once per frame: it snapshots "now", fires the timers
+# that came due to their subscribers and refreshes the cached day/cycle keys,
+# so countdown labels and reset checks in draw() are a subtraction or a string
+# compare, never a file read or a timezone computation.
+# Outside the pygame loop (tools, the headless service) nobody ticks, and each
+# access takes its own snapshot instead.
+
+RESET_HOUR = 19
+DAILY_RESET = 'daily_reset'  # 19:00 Europe/Paris: new défi cycle
+MIDNIGHT = 'midnight'  # calendar day change: new daily reward
+
+Listener = Callable[[str, float], None]
+
+_heap: List[Tuple[float, int, str]] = []
+_deadlines: Dict[str, float] = {}  # key -> current deadline (older heap entries are stale)
+_listeners: Dict[str, List[Listener]] = {}
+_seq = 0
+_now: Optional[float] = None
+_driven = False  # True once the frame loop calls tick()
+_cycle_key = ''
+_today = ''
+
+
+def _next_boundary(hour: int) -> float:
+    n = tz.now()
+    boundary = n.replace(hour=hour, minute=0, second=0, microsecond=0)
+    if n >= boundary:
+        boundary += timedelta(days=1)
+    return boundary.timestamp()
+
+
+def schedule(key: str, at: float) -> None:
+    """Fire key at epoch time `at` (replaces an earlier deadline for key)."""
+    global _seq
+    _deadlines[key] = float(at)
+    _seq += 1
+    heapq.heappush(_heap, (float(at), _seq, key))
+
+
+def cancel(key: str) -> None:
+    _deadlines.pop(key, None)  # its heap entry is skipped when popped
+
+
+def deadline(key: str) -> Optional[float]:
+    return _deadlines.get(key)
+
+
+def subscribe(key: str, fn: Listener) -> None:
+    """Call fn(key, deadline) when key fires."""
+    subs = _listeners.setdefault(key, [])
+    if fn not in subs:
+        subs.append(fn)
+
+
+def unsubscribe(key: str, fn: Listener) -> None:
+    try:
+        _listeners.get(key, []).remove(fn)
+    except ValueError:
+        pass
+
+
+def _roll_keys() -> None:
+    global _cycle_key, _today
+    try:
+        _cycle_key = tz.current_cycle_key(RESET_HOUR)
+        _today = tz.today_str()
+    except Exception:
+        _cycle_key = _today = time.strftime('%Y-%m-%d')
+    for key, hour in ((DAILY_RESET, RESET_HOUR), (MIDNIGHT, 0)):
+        if key not in _deadlines or _deadlines[key] <= (_now or 0.0):
+            try:
+                schedule(key, _next_boundary(hour))
+            except Exception:
+                schedule(key, (_now or time.time()) + 60.0)
+
+
+def _advance(now: float) -> None:
+    global _now
+    if _now is None:
+        _now = now
+        _roll_keys()
+    _now = now
+    fired: List[Tuple[str, float]] = []
+    while _heap and _heap[0][0] <= now:
+        at, _, key = heapq.heappop(_heap)
+        if _deadlines.get(key) == at:
+            fired.append((key, at))
+    if not fired:
+        return
+    if any(key in (DAILY_RESET, MIDNIGHT) for key, _ in fired):
+        _roll_keys()
+        state_bus.emit(state_bus.DAILY)
+    for key, at in fired:
+        for fn in list(_listeners.get(key, ())):
+            try:
+                fn(key, at)
+            except Exception:
+                pass
+
+
+def tick(now: Optional[float] = None) -> None:
+    """Snapshot now for this frame and fire every timer that came due."""
+    global _driven
+    _driven = True
+    _advance(time.time() if now is None else now)
+
+
+def now() -> float:
+    """Epoch seconds of the current frame."""
+    if not _driven or _now is None:
+        _advance(time.time())
+    return _now
+
+
+def remaining(key: str) -> int:
+    """Whole seconds until key fires (0 once due or when unknown)."""
+    at = _deadlines.get(key)
+    if at is None:
+        return 0
+    left = at - now()
+    return int(left) if left > 0 else 0
+
+
+def cycle_key() -> str:
+    """Current daily cycle (YYYY-MM-DD, boundary at 19:00 Europe/Paris)."""
+    now()
+    return _cycle_key
+
+
+def today() -> str:
+    """Current Europe/Paris date (YYYY-MM-DD)."""
+    now()
+    return _today
+
+
+def seconds_to_reset() -> int:
+    return remaining(DAILY_RESET)
@@ -0,0 +1 @@
+# UI screens, imported on demand by game.app (see SCREENS)
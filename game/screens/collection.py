@@ -0,0 +1,330 @@
+from __future__ import annotations
+
+from typing import List, Tuple
+
+import pygame
+
+from ..packs import RARITY_COLORS
+from .. import ids as card_ids
+from .. import state_bus
+from .. import card_faces
+from .. import collection_query as cquery
+from .. import stats as stats_mod
+from ..grid import VirtualGrid
+from ..app import App, Button, Screen, draw_player_png_centered, resolve_player_image_by_name_and_rarity
+
+# Collection browser and completion dashboard.
+
+
+class Collection(Screen):
+    FILTERS = ['Tous', 'or non rare', 'or rare', 'hero', 'icon', 'otw', 'flashback', "fin d'une ère"]
+    # (label, min_owned, duplicates_only)
+    OWNED_MODES = [('Tous', 0, False), ('Possédés', 1, False), ('Doublons', 0, True)]
+    # (label, sort key, descending)
+    SORTS = [('Note', 'rating', True), ('Nom', 'name', False), ('Quantité', 'count', True), ('Récents', 'recent', True)]
+    # (label, sources)
+    SOURCES = [('Toutes', ()), ('Packs', ('packable',)), ('SBC', ('sbc_only',)), ('Pass', ('pass_only',)),
+               ('Défis', ('defi_only',)), ('Quotidien', ('daily_only',))]
+    MIN_RATINGS = [0, 75, 80, 85, 90]
+
+    def __init__(self, app: 'App'):
+        super().__init__(app)
+        self.filter_idx = 0
+        self.grid = VirtualGrid(180, 16, 1.3, on_prefetch=self._queue_prefetch)
+        self._prefetch: List[int] = []
+        self.catalog = card_ids.catalog()
+        self.owned = app.owned.get()
+        self._filtered_key = None
+        self._filtered: List[dict] = []
+        self.owned_mode = 0
+        self.sort_idx = 0
+        self.source_idx = 0
+        self.rating_idx = 0
+        self.search_text = ''
+        self._search_active = False
+        self._cell_cache: dict[Tuple[str, int], pygame.Surface] = {}
+
+    def handle(self, event: pygame.event.Event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.app.pop()
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            mx, my = event.pos
+            # quick SBC access button (top-right)
+            sbc_rect = pygame.Rect(self.app.size[0] - 140, 28, 100, 36)
+            if sbc_rect.collidepoint((mx, my)):
+                try:
+                    if self.app.feature_unlocked('sbc'):
+                        self.app.push('SBC')
+                except Exception:
+                    pass
+                return
+            # completion dashboard button
+            stats_rect = pygame.Rect(self.app.size[0] - 260, 28, 100, 36)
+            if stats_rect.collidepoint((mx, my)):
+                self.app.push('CompletionDashboard')
+                return
+            # filter tabs
+            tabs_y = 92
+            x = 40
+            for i, f in enumerate(self.FILTERS):
+                r = pygame.Rect(x + i * (150 + 10), tabs_y, 150, 36)
+                if r.collidepoint((mx, my)):
+                    self.filter_idx = i
+                    break
+            # owned-only toggle
+            own_rect = pygame.Rect(self.app.size[0] - 220, 60, 180, 28)
+            if own_rect.collidepoint((mx, my)):
+                self.owned_mode = (self.owned_mode + 1) % len(self.OWNED_MODES)
+            # sort / source / min rating cycles
+            for attr, rect, opts in self._cycle_buttons():
+                if rect.collidepoint((mx, my)):
+                    setattr(self, attr, (getattr(self, attr) + 1) % len(opts))
+            # search box
+            srect = pygame.Rect(self.app.size[0] - 420, 60, 180, 28)
+            self._search_active = srect.collidepoint((mx, my))
+        elif event.type == pygame.MOUSEWHEEL:
+            self.grid.wheel(event.y)
+        elif event.type == pygame.KEYDOWN and self._search_active:
+            if event.key == pygame.K_BACKSPACE:
+                self.search_text = self.search_text[:-1]
+            elif event.key == pygame.K_RETURN:
+                self._search_active = False
+            else:
+                ch = event.unicode
+                if ch and ch.isprintable():
+                    self.search_text += ch
+
+    def update(self, dt: float):
+        self.grid.update(dt)
+        # warm a few upcoming cell faces per frame so scrolling never loads images mid-draw
+        items = self._filtered
+        for _ in range(3):
+            if not self._prefetch:
+                break
+            idx = self._prefetch.pop(0)
+            if idx < len(items):
+                self._cell_face(items[idx], (self.grid.cell_w, self.grid.cell_h))
+
+    def _queue_prefetch(self, indices: range):
+        self._prefetch = list(indices)
+
+    def _filtered_catalog(self):
+        # owned counts are refreshed when the collection emits a change (e.g. pack reveals)
+        self.owned = self.app.owned.get()
+        q = self._query()
+        key = (q, state_bus.version(state_bus.COLLECTION))
+        if key == self._filtered_key:
+            return self._filtered
+        # owned counts are by base name so variants share ownership visibility
+        self._filtered = [card_ids.card(i) for i in cquery.run(q)]
+        self._filtered_key = key
+        return self._filtered
+
+    def _query(self) -> 'cquery.Query':
+        _, min_owned, dups = self.OWNED_MODES[self.owned_mode]
+        _, sort, desc = self.SORTS[self.sort_idx]
+        return cquery.Query(
+            rarities=frozenset([self.FILTERS[self.filter_idx]]) if self.filter_idx != 0 else frozenset(),
+            min_rating=self.MIN_RATINGS[self.rating_idx],
+            min_owned=min_owned,
+            duplicates_only=dups,
+            sources=frozenset(self.SOURCES[self.source_idx][1]),
+            needle=self.search_text,
+            sort=sort,
+            descending=desc,
+        )
+
+    def _cycle_buttons(self):
+        w = self.app.size[0]
+        return [
+            ('sort_idx', pygame.Rect(w - 620, 60, 180, 28), self.SORTS),
+            ('source_idx', pygame.Rect(w - 820, 60, 180, 28), self.SOURCES),
+            ('rating_idx', pygame.Rect(w - 980, 60, 140, 28), self.MIN_RATINGS),
+        ]
+
+    def draw(self, screen: pygame.Surface):
+        w, h = self.app.size
+        screen.fill((18, 20, 24))
+        title = self.app.h2.render('Collection', True, (230, 230, 240))
+        screen.blit(title, (40, 32))
+        # SBC quick button
+        sbc_rect = pygame.Rect(w - 140, 28, 100, 36)
+        mx, my = pygame.mouse.get_pos()
+        pressed = pygame.mouse.get_pressed()[0]
+        sbc_locked = False
+        try:
+            sbc_locked = not self.app.feature_unlocked('sbc')
+        except Exception:
+            pass
+        Button(sbc_rect, ('SBC 🔒' if sbc_locked else 'SBC')).draw(screen, self.app.h4, hovered=sbc_rect.collidepoint((mx, my)), pressed=pressed and sbc_rect.collidepoint((mx, my)))
+        stats_rect = pygame.Rect(w - 260, 28, 100, 36)
+        Button(stats_rect, 'Stats').draw(screen, self.app.h4, hovered=stats_rect.collidepoint((mx, my)), pressed=pressed and stats_rect.collidepoint((mx, my)))
+
+        # progress (maintained incrementally by the stats module)
+        owned_n, total = stats_mod.completion()
+        progress = self.app.h4.render(f"{owned_n}/{total}  ({stats_mod.completion_pct()}%)", True, (200, 200, 210))
+        screen.blit(progress, (40, 64))
+
+        # owned-only toggle and search box
+        own_rect = pygame.Rect(w - 220, 60, 180, 28)
+        pygame.draw.rect(screen, (38, 40, 50), own_rect, border_radius=8)
+        pygame.draw.rect(screen, (90, 90, 110), own_rect, 2, border_radius=8)
+        own_txt = self.app.h5.render(f"Afficher: {self.OWNED_MODES[self.owned_mode][0]}", True, (235, 235, 245))
+        screen.blit(own_txt, (own_rect.x + 8, own_rect.y + 5))
+        for attr, rect, opts in self._cycle_buttons():
+            opt = opts[getattr(self, attr)]
+            if attr == 'sort_idx':
+                label = f"Tri: {opt[0]}"
+            elif attr == 'source_idx':
+                label = f"Source: {opt[0]}"
+            else:
+                label = f"Note ≥ {opt}" if opt else 'Note: toutes'
+            pygame.draw.rect(screen, (38, 40, 50), rect, border_radius=8)
+            pygame.draw.rect(screen, (90, 90, 110), rect, 2, border_radius=8)
+            screen.blit(self.app.h5.render(label, True, (235, 235, 245)), (rect.x + 8, rect.y + 5))
+
+        srect = pygame.Rect(w - 420, 60, 180, 28)
+        pygame.draw.rect(screen, (38, 40, 50), srect, border_radius=8)
+        pygame.draw.rect(screen, (90, 90, 110), srect, 2, border_radius=8)
+        stxt = self.app.h5.render(self.search_text or 'Recherche…', True, (200, 200, 210) if self.search_text else (140, 140, 150))
+        screen.blit(stxt, (srect.x + 8, srect.y + 5))
+
+        # filter tabs
+        tabs_y = 92
+        mx, my = pygame.mouse.get_pos()
+        pressed = pygame.mouse.get_pressed()[0]
+        for i, f in enumerate(self.FILTERS):
+            r = pygame.Rect(40 + i * (150 + 10), tabs_y, 150, 36)
+            sel = i == self.filter_idx
+            hovered = r.collidepoint((mx, my))
+            bg = (38, 40, 50) if not sel else (58, 60, 90)
+            if hovered:
+                bg = (48, 50, 65) if not sel else (68, 70, 110)
+            pygame.draw.rect(screen, bg, r, border_radius=10)
+            pygame.draw.rect(screen, (90, 90, 110), r, 2, border_radius=10)
+            txt = self.app.h5.render(f, True, (235, 235, 245))
+            screen.blit(txt, (r.centerx - txt.get_width() // 2, r.centery - txt.get_height() // 2))
+
+        # grid area
+        area = pygame.Rect(40, tabs_y + 52, w - 80, h - (tabs_y + 52) - 40)
+        pygame.draw.rect(screen, (25, 27, 33), area, border_radius=16)
+        pygame.draw.rect(screen, (70, 72, 90), area, 2, border_radius=16)
+
+        # layout (cached by the grid until the area or item count changes)
+        items = self._filtered_catalog()
+        self.grid.layout(area, len(items))
+        # Clip drawing to the panel so images never draw outside when scrolling
+        prev_clip = screen.get_clip()
+        screen.set_clip(area.inflate(-2, -2))
+        for idx, r in self.grid.visible_cells():
+            self._draw_collection_cell(screen, r, items[idx])
+        screen.set_clip(prev_clip)
+
+        hint = self.app.h5.render('[Molette] Scroll   [Esc] Retour', True, (150, 150, 160))
+        screen.blit(hint, (w - hint.get_width() - 32, 32))
+
+    def _draw_collection_cell(self, screen: pygame.Surface, rect: pygame.Rect, item: dict):
+        screen.blit(self._cell_face(item, rect.size), rect.topleft)
+
+    def _cell_face(self, item: dict, size: Tuple[int, int]) -> pygame.Surface:
+        name = item['name']
+        # Count ownership by base name so variants (e.g., #pass/#sbc) share counts
+        base_name = (name or '').split('#')[0].strip()
+        owned_count = int(self.owned.get(base_name, 0))
+        if item.get('sbc_only'):
+            label = 'SBC seulement'
+        elif item.get('defi_only'):
+            label = 'Défi seulement'
+        elif item.get('pass_only'):
+            label = 'Pass seulement'
+        else:
+            label = ''
+        # badges are part of the face; only their visible state goes in the key
+        key = ('cell', name, item.get('rarity', ''), label, owned_count if owned_count > 1 else min(owned_count, 1))
+        return card_faces.face(key, size, lambda s: self._render_collection_cell(s, item, label, owned_count))
+
+    def _render_collection_cell(self, face: pygame.Surface, item: dict, label: str, owned_count: int):
+        name = item['name']
+        rect = face.get_rect()
+        # Only draw the PNG image (no framed background behind)
+        pad = 0
+        inner = pygame.Rect(rect.x + pad, rect.y + pad, rect.w - 2 * pad, rect.h - 2 * pad)
+        # player image (PNG-first), fill most of the cell
+        img = resolve_player_image_by_name_and_rarity(name, item.get('rarity', ''))
+        if img is not None:
+            draw_player_png_centered(face, img, inner.center, inner.w, inner.h)
+        else:
+            # subtle placeholder only if image not found
+            pygame.draw.rect(face, (40, 42, 52), inner, border_radius=10)
+        # Note: remove name and rarity text to keep only images as requested
+        # exclusivity badges: SBC-only, Défi-only, or Pass-only
+        if label:
+            badge = pygame.Surface((120, 20), pygame.SRCALPHA)
+            pygame.draw.rect(badge, (200, 120, 40), badge.get_rect(), border_radius=8)
+            bt = self.app.h5.render(label, True, (255, 255, 255))
+            badge.blit(bt, (badge.get_width() // 2 - bt.get_width() // 2, badge.get_height() // 2 - bt.get_height() // 2))
+            face.blit(badge, (rect.x + 8, rect.y + 8))
+        # owned count badge (top-right)
+        if owned_count > 1:
+            b = pygame.Surface((34, 22), pygame.SRCALPHA)
+            pygame.draw.rect(b, (40, 140, 240), b.get_rect(), border_radius=8)
+            t = self.app.h5.render(f"x{owned_count}", True, (255, 255, 255))
+            b.blit(t, (b.get_width() // 2 - t.get_width() // 2, b.get_height() // 2 - t.get_height() // 2))
+            face.blit(b, (rect.right - b.get_width() - 8, rect.y + 8))
+        # lock overlay if not owned
+        if owned_count <= 0:
+            lock = pygame.Surface((inner.w, inner.h), pygame.SRCALPHA)
+            lock.fill((0, 0, 0, 120))
+            face.blit(lock, inner.topleft)
+            # simple lock icon
+            bx = inner.centerx - 12
+            by = inner.centery - 8
+            pygame.draw.rect(face, (235, 235, 245), pygame.Rect(bx, by, 24, 16), 2, border_radius=4)
+            pygame.draw.arc(face, (235, 235, 245), pygame.Rect(bx + 6, by - 14, 12, 14), 3.14, 0, 2)
+
+
+class CompletionDashboard(Screen):
+    """Collection completion per rarity and per promo, plus SBC fodder figures."""
+
+    def handle(self, event: pygame.event.Event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.app.pop()
+
+    def _bar(self, screen: pygame.Surface, rect: pygame.Rect, label: str, owned: int, total: int, color):
+        pct = owned / total if total else 0.0
+        lbl = self.app.h5.render(label, True, (220, 220, 230))
+        screen.blit(lbl, (rect.x, rect.y - lbl.get_height() - 4))
+        pygame.draw.rect(screen, (38, 40, 50), rect, border_radius=6)
+        if pct > 0:
+            pygame.draw.rect(screen, color, pygame.Rect(rect.x, rect.y, max(8, int(rect.w * pct)), rect.h), border_radius=6)
+        txt = self.app.h5.render(f"{owned}/{total}  ({int(pct * 100)}%)", True, (235, 235, 245))
+        screen.blit(txt, (rect.right + 12, rect.centery - txt.get_height() // 2))
+
+    def draw(self, screen: pygame.Surface):
+        w, h = self.app.size
+        screen.fill((16, 18, 22))
+        title = self.app.h2.render('Progression de la collection', True, (230, 230, 240))
+        screen.blit(title, (40, 32))
+        owned, total = stats_mod.completion()
+        self._bar(screen, pygame.Rect(40, 124, w - 360, 22), 'Total', owned, total, (40, 140, 240))
+        # SBC fodder
+        dups = stats_mod.duplicates()
+        mass = stats_mod.fodder_rating()
+        avg = (mass / dups) if dups else 0
+        info = self.app.h4.render(f"Doublons disponibles pour les SBC: {dups}   ·   Note moyenne: {avg:.1f}   ·   Masse de notes: {mass}", True, (210, 210, 220))
+        screen.blit(info, (40, 160))
+        # per rarity (left) and per promo (right)
+        col_w = (w - 120) // 2 - 140
+        for col, (heading, rows) in enumerate((('Raretés', stats_mod.groups(promos=False)), ('Promos', stats_mod.groups(promos=True)))):
+            x = 40 + col * ((w - 80) // 2)
+            hd = self.app.h3.render(heading, True, (230, 230, 240))
+            screen.blit(hd, (x, 208))
+            y = 272
+            for g, g_owned, g_total in rows:
+                if y > h - 60:
+                    break
+                color = RARITY_COLORS.get(g, (120, 160, 220))
+                self._bar(screen, pygame.Rect(x, y, col_w, 16), g[:1].upper() + g[1:], g_owned, g_total, color)
+                y += 52
+        hint = self.app.h5.render('[Esc] Retour', True, (150, 150, 160))
+        screen.blit(hint, (w - hint.get_width() - 32, 32))
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import pygame
+
+from ..cards import Card
+from .. import daily_rewards as daily_mod
+from .. import state_bus
+from ..app import App, Screen, draw_player_png_centered, resolve_player_image_by_name_and_rarity
+
+# Daily login rewards.
+
+
+class DailyRewards(Screen):
+    """Calendar view for the 28-day daily rewards with manual claim option."""
+    def __init__(self, app: 'App'):
+        super().__init__(app)
+        self.message = ''
+        # save state read once per claim / new day instead of every frame
+        self._status = state_bus.Cached(daily_mod.get_status, state_bus.DAILY, default={})
+
+    def handle(self, event: pygame.event.Event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.app.pop()
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            mx, my = event.pos
+            # claim button
+            w, h = self.app.size
+            claim_rect = pygame.Rect(w - 220, 96, 180, 40)
+            if claim_rect.collidepoint((mx, my)):
+                # try claim
+                try:
+                    claimed, info = daily_mod.claim_today()
+                    if claimed and info:
+                        if info.get('type') == 'xp':
+                            self.app.show_toast(f"+{int(info.get('amount', 0))} XP obtenu", 2.0)
+                        elif info.get('type') == 'coins':
+                            self.app.show_toast(f"+{int(info.get('amount', 0))} Minecoins", 2.0)
+                        elif info.get('type') == 'player':
+                            nm = str(info.get('name', ''))
+                            try:
+                                card = Card(name=nm, rarity='squad fondations', bg_color=(90, 110, 150), rating=int(info.get('rating', 84)))
+                                self.app.push('SpecialRewardScreen', card)
+                            except Exception:
+                                self.app.show_toast(nm, 2.0)
+                    else:
+                        self.app.show_toast('Déjà réclamé aujourd\'hui', 2.0)
+                except Exception:
+                    self.app.show_toast('Erreur de réclamation', 2.0)
+
+    def _compute_today_day(self) -> tuple[int, bool]:
+        """Return (day_number, already_claimed_today)."""
+        import datetime
+        st = self._status.get()
+        day_idx = int(st.get('day_index', 0))
+        last = st.get('last_claim_date')
+        today = datetime.date.fromisoformat(st['today'])
+        if last == today.isoformat():
+            return (max(1, min(28, day_idx or 1)), True)
+        # not claimed today → compute next day by consecutive rule
+        if not last:
+            return (1, False)
+        try:
+            last_d = datetime.datetime.strptime(last, '%Y-%m-%d').date()
+        except Exception:
+            return (1, False)
+        if today - last_d == datetime.timedelta(days=1):
+            nxt = (day_idx or 0) + 1
+            return ((1 if nxt > 28 else nxt), False)
+        return (1, False)
+
+    def draw(self, screen: pygame.Surface):
+        w, h = self.app.size
+        screen.fill((16, 18, 22))
+        title = self.app.h2.render('Récompenses quotidiennes', True, (235, 235, 245))
+        screen.blit(title, (40, 32))
+        # status chip
+        try:
+            (day_t, claimed_today) = self._compute_today_day()
+            lbl = f"Jour {day_t}/28  ·  {'Réclamé aujourd\'hui' if claimed_today else 'Disponible'}"
+        except Exception:
+            lbl = 'Statut indisponible'
+        chip = pygame.Rect(40, 80, 420, 44)
+        pygame.draw.rect(screen, (28, 30, 38), chip, border_radius=10)
+        pygame.draw.rect(screen, (70, 72, 90), chip, 2, border_radius=10)
+        t = self.app.h4.render(lbl, True, (235, 235, 245))
+        screen.blit(t, (chip.centerx - t.get_width() // 2, chip.centery - t.get_height() // 2))
+        # claim button (top-right)
+        claim_rect = pygame.Rect(w - 220, 96, 180, 40)
+        can_claim = ("Disponible" in lbl)
+        pygame.draw.rect(screen, (40, 140, 240) if can_claim else (60, 62, 78), claim_rect, border_radius=10)
+        ct = self.app.h4.render('Récupérer', True, (255, 255, 255))
+        screen.blit(ct, (claim_rect.centerx - ct.get_width() // 2, claim_rect.centery - ct.get_height() // 2))
+        # grid panel
+        area = pygame.Rect(40, 140, w - 80, h - 200)
+        pygame.draw.rect(screen, (20, 22, 28), area, border_radius=12)
+        pygame.draw.rect(screen, (60, 62, 78), area, 2, border_radius=12)
+        # layout 7 columns x 4 rows
+        cols, rows = 7, 4
+        gap = 12
+        cell_w = (area.w - (cols + 1) * gap) // cols
+        cell_h = (area.h - (rows + 1) * gap) // rows
+        # get rewards
+        try:
+            rewards = daily_mod.list_cycle_rewards()
+        except Exception:
+            rewards = []
+        # determine claimed up to day_index (inclusive if claimed today)
+        st = self._status.get()
+        last = st.get('last_claim_date')
+        day_idx = int(st.get('day_index', 0))
+        already = (last == st.get('today'))
+        claimed_upto = day_idx if already else max(0, day_idx)
+        # draw tiles
+        for i, rw in enumerate(rewards[:28]):
+            d = i + 1
+            row = i // cols
+            col = i % cols
+            x = area.x + gap + col * (cell_w + gap)
+            y = area.y + gap + row * (cell_h + gap)
+            r = pygame.Rect(x, y, cell_w, cell_h)
+            # state coloring
+            if d <= claimed_upto:
+                bg = (28, 40, 30)
+                border = (90, 140, 100)
+            elif d == day_t and not already:
+                bg = (34, 36, 50)
+                border = (90, 120, 220)
+            else:
+                bg = (32, 34, 44)
+                border = (90, 90, 110)
+            pygame.draw.rect(screen, bg, r, border_radius=10)
+            pygame.draw.rect(screen, border, r, 2, border_radius=10)
+            # Day label
+            dtxt = self.app.h5.render(f'Jour {d}', True, (230, 230, 240))
+            screen.blit(dtxt, (r.centerx - dtxt.get_width() // 2, r.y + 6))
+            # Content
+            if rw.get('type') == 'xp':
+                chip = pygame.Surface((int(r.w * 0.7), 26), pygame.SRCALPHA)
+                pygame.draw.rect(chip, (60, 62, 78, 210), chip.get_rect(), border_radius=8)
+                amt = int(rw.get('amount', 0))
+                ct = self.app.h4.render(f"+{amt} XP", True, (235, 235, 245))
+                chip.blit(ct, (chip.get_width() // 2 - ct.get_width() // 2, chip.get_height() // 2 - ct.get_height() // 2))
+                screen.blit(chip, (r.centerx - chip.get_width() // 2, r.centery - chip.get_height() // 2))
+            elif rw.get('type') == 'coins':
+                chip = pygame.Surface((int(r.w * 0.8), 26), pygame.SRCALPHA)
+                pygame.draw.rect(chip, (60, 62, 78, 210), chip.get_rect(), border_radius=8)
+                amt = int(rw.get('amount', 0))
+                ct = self.app.h4.render(f"+{amt} Coins", True, (235, 235, 245))
+                chip.blit(ct, (chip.get_width() // 2 - ct.get_width() // 2, chip.get_height() // 2 - ct.get_height() // 2))
+                screen.blit(chip, (r.centerx - chip.get_width() // 2, r.centery - chip.get_height() // 2))
+            elif rw.get('type') == 'player':
+                name = str(rw.get('name', ''))
+                # try to draw card image
+                p = resolve_player_image_by_name_and_rarity(name, None)
+                if p is not None:
+                    draw_player_png_centered(screen, p, r.center, int(r.w * 0.7), int(r.h * 0.7))
+                # name label
+                nt = self.app.h5.render(name, True, (220, 220, 230))
+                screen.blit(nt, (r.centerx - nt.get_width() // 2, r.bottom - 24))
+        # bottom hint
+        hint = self.app.h5.render('[Esc] Retour', True, (150, 150, 160))
+        screen.blit(hint, (w - hint.get_width() - 32, 32))
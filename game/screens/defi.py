@@ -0,0 +1,489 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List
+
+import pygame
+
+from .. import content
+from .. import defi as defi_mod
+from .. import assets
+from ..app import App, Screen, draw_bg_cover, draw_player_png_centered, resolve_player_image_by_name_and_rarity
+
+# Défis (objectives) list and group detail.
+
+
+class Defi(Screen):
+    def __init__(self, app: 'App'):
+        super().__init__(app)
+        self.active_group_idx = 0
+        self.groups = defi_mod.groups() or ['Tous']
+        if 'Tous' not in self.groups:
+            self.groups = ['Tous'] + self.groups
+        self.message = ''
+        self.tile_scroll_x = 0
+        self.hover_tile = -1
+
+    def _boateng_ids(self) -> List[str]:
+        try:
+            tasks = defi_mod.list_defis(None if self.groups[self.active_group_idx] == 'Tous' else self.groups[self.active_group_idx])
+        except Exception:
+            tasks = defi_mod.list_defis(None)
+        return [d.id for d in tasks if str(getattr(d, 'id', '')).startswith('boateng_eoe_')]
+
+    def _build_items(self):
+        """Return a list of tiles to render: either ('group', dict) or ('defi', Defi).
+        Groups supported: Boateng (6), Juninho (6), Lacazette (4), Iniesta (8), Pogba (3).
+        """
+        gname = self.groups[self.active_group_idx]
+        tasks = defi_mod.list_defis(None if gname == 'Tous' else gname)
+        # series definitions: prefix -> (title, bg_img, image_key)
+        series = [
+            ('boateng_eoe_', "Jérôme Boateng — Fin d'une ère", str(Path("C:\\Users\\Utilisateur\\Desktop\\Minefut\\Fond\\Sbc\\Fin d'une ère\\fond fin d'une  ère.png")), "Jérôme Boateng"),
+            ('juninho_hero_', 'Juninho — Héro', str(Path("C:\\Users\\Utilisateur\\Desktop\\Minefut\\Fond\\Sbc\\Héro\\fond héro.png")), 'Juninho'),
+            ('lacazette_flashback_', 'Lacazette — Flashback', str(Path("C:\\Users\\Utilisateur\\Desktop\\Minefut\\Fond\\Sbc\\Flashback\\fond flashback.png")), 'Lacazette'),
+            ('iniesta_icon_debut_', 'Iniesta — Icon début', str(Path("C:\\Users\\Utilisateur\\Desktop\\Minefut\\Fond\\Sbc\\Icon debut champion\\fond icon debut champion .png")), 'Iniesta'),
+            ('pogba_halloween_defi_', 'Paul Pogba — Ultimate Scream', str(Path("C:\\Users\\Utilisateur\\Desktop\\Minefut\\Fond\\Sbc\\Ultimate Scream\\Joueur\\fond ultimate scream.png")), 'Paul Pogba#sbc'),
+            ('forsberg_flashback_', 'Emil Forsberg — Flashback', str(Path("C:\\Users\\Utilisateur\\Desktop\\Minefut\\Fond\\Sbc\\Flashback\\fond flashback.png")), 'Emil Forsberg'),
+        ]
+        used_ids = set()
+        items = []
+        for pref, title, bgimg, image_key in series:
+            lst = [d for d in tasks if d.id.startswith(pref)]
+            if lst:
+                lst = sorted(lst, key=lambda d: d.id)
+                items.append(('group', {
+                    'title': title,
+                    'ids': [d.id for d in lst],
+                    'bg_img': bgimg,
+                    'image_key': image_key,
+                    'steps': len(lst),
+                }))
+                used_ids.update(d.id for d in lst)
+        # append remaining individual defis
+        for d in tasks:
+            if d.id not in used_ids:
+                items.append(('defi', d))
+        return items
+
+    def _tasks(self):
+        g = self.groups[self.active_group_idx]
+        return defi_mod.list_defis(None if g == 'Tous' else g)
+
+    def handle(self, event: pygame.event.Event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.app.pop()
+            return
+        if event.type == pygame.MOUSEWHEEL:
+            # horizontal scroll via mouse wheel
+            self.tile_scroll_x = max(0, self.tile_scroll_x - event.y * 60)
+            return
+        if event.type == pygame.KEYDOWN and event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+            # scroll by one tile step
+            win_w, win_h = self.app.size
+            area_h = win_h - 220
+            tile_h = max(220, area_h - 24)
+            tile_w = int(tile_h * 0.78)
+            gap = 20
+            step = tile_w + gap
+            dx = -step if event.key == pygame.K_LEFT else step
+            self.tile_scroll_x = max(0, self.tile_scroll_x + dx)
+            return
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            mx, my = event.pos
+            # tabs
+            tx, ty = 40, 96
+            for i, g in enumerate(self.groups):
+                r = pygame.Rect(tx + i * (140 + 8), ty, 140, 34)
+                if r.collidepoint((mx, my)):
+                    self.active_group_idx = i
+                    return
+            # tiles area + claim buttons inside tile
+            area = pygame.Rect(40, 140, self.app.size[0] - 80, self.app.size[1] - 220)
+            tile_h = max(220, area.h - 24)
+            tile_w = int(tile_h * 0.78)
+            gap = 20
+            start_x = area.x + 4 - self.tile_scroll_x
+            y = area.y + 12
+            items = self._build_items()
+            for idx, itm in enumerate(items):
+                r = pygame.Rect(start_x + idx * (tile_w + gap), y, tile_w, tile_h)
+                if not area.collidepoint((mx, my)) or not r.collidepoint((mx, my)):
+                    continue
+                kind = itm[0]
+                if kind == 'group':
+                    data = itm[1]
+                    # open group detail for Boateng steps
+                    try:
+                        self.app.push('DefiGroupDetail', data['title'], data['ids'])
+                    except Exception:
+                        pass
+                    return
+                else:
+                    d = itm[1]
+                    # claim button rectangle within the tile
+                    claim = pygame.Rect(r.centerx - 60, r.bottom - 56, 120, 36)
+                    if claim.collidepoint((mx, my)):
+                        if defi_mod.can_claim(d):
+                            ok = defi_mod.claim(d)
+                            self.message = 'Récompense récupérée' if ok else 'Non disponible'
+                        else:
+                            self.message = 'Incomplet ou déjà réclamé'
+                        return
+
+    def draw(self, screen: pygame.Surface):
+        w, h = self.app.size
+        screen.fill((12, 14, 18))
+        title = self.app.h2.render('Défis', True, (235, 235, 245))
+        screen.blit(title, (40, 32))
+        # tabs
+        tx, ty = 40, 96
+        mx, my = pygame.mouse.get_pos()
+        for i, g in enumerate(self.groups):
+            r = pygame.Rect(tx + i * (140 + 8), ty, 140, 34)
+            sel = (i == self.active_group_idx)
+            pygame.draw.rect(screen, (38, 40, 50) if not sel else (58, 60, 90), r, border_radius=10)
+            pygame.draw.rect(screen, (90, 90, 110), r, 2, border_radius=10)
+            lbl = self.app.h4.render(g, True, (235, 235, 245))
+            screen.blit(lbl, (r.centerx - lbl.get_width() // 2, r.centery - lbl.get_height() // 2))
+
+        # tiles panel (same style as SBC hub)
+        area = pygame.Rect(40, 140, w - 80, h - 220)
+        pygame.draw.rect(screen, (18, 20, 26), area, border_radius=12)
+        pygame.draw.rect(screen, (60, 62, 78), area, 2, border_radius=12)
+        tile_h = max(220, area.h - 24)
+        tile_w = int(tile_h * 0.78)
+        gap = 20
+        start_x = area.x + 4 - self.tile_scroll_x
+        y = area.y + 12
+        # overflow arrows
+        items = self._build_items()
+        content_w = max(0, len(items) * (tile_w + gap) - gap)
+        overflow = content_w > area.w
+        if overflow:
+            la = pygame.Rect(area.x + 6, area.centery - 24, 32, 48)
+            ra = pygame.Rect(area.right - 38, area.centery - 24, 32, 48)
+            pygame.draw.rect(screen, (28, 30, 38), la, border_radius=8)
+            pygame.draw.rect(screen, (28, 30, 38), ra, border_radius=8)
+            pygame.draw.polygon(screen, (200, 200, 210), [(la.right - 8, la.y + 8), (la.x + 10, la.centery), (la.right - 8, la.bottom - 8)])
+            pygame.draw.polygon(screen, (200, 200, 210), [(ra.x + 8, ra.y + 8), (ra.right - 10, ra.centery), (ra.x + 8, ra.bottom - 8)])
+
+        prev_clip = screen.get_clip()
+        screen.set_clip(area.inflate(-2, -2))
+        self.hover_tile = -1
+        for idx, itm in enumerate(items):
+            r = pygame.Rect(start_x + idx * (tile_w + gap), y, tile_w, tile_h)
+            if r.right < area.x or r.x > area.right:
+                continue
+            hovered = (area.collidepoint((mx, my)) and r.collidepoint((mx, my)))
+            if hovered:
+                self.hover_tile = idx
+            # base tile
+            bg = (32, 34, 44)
+            if hovered:
+                bg = (40, 42, 54)
+            pygame.draw.rect(screen, bg, r, border_radius=14)
+            pygame.draw.rect(screen, (90, 90, 110), r, 2, border_radius=14)
+            if itm[0] == 'group':
+                data = itm[1]
+                # background image like SBC tiles with mask
+                try:
+                    use_p = assets.resolve(data.get('bg_img'))
+                    if use_p is not None:
+                        inner = r.inflate(-8, -8)
+                        panel = pygame.Surface((inner.w, inner.h), pygame.SRCALPHA)
+                        draw_bg_cover(panel, use_p, panel.get_rect())
+                        mask = pygame.Surface((inner.w, inner.h), pygame.SRCALPHA)
+                        pygame.draw.rect(mask, (255, 255, 255, 255), mask.get_rect(), border_radius=12)
+                        panel.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+                        screen.blit(panel, inner.topleft)
+                except Exception:
+                    pass
+                # title
+                ttl = self.app.h4.render(data['title'], True, (235, 235, 245))
+                screen.blit(ttl, (r.x + 12, r.y + 12))
+                # emblem (Boateng image)
+                shield_h = max(120, int(r.h * 0.44))
+                shield_w = int(shield_h * 0.8)
+                shield = pygame.Rect(r.centerx - shield_w // 2, r.y + int(r.h * 0.22), shield_w, shield_h)
+                pygame.draw.rect(screen, (60, 64, 80), shield, border_radius=16)
+                pygame.draw.rect(screen, (120, 124, 140), shield, 2, border_radius=16)
+                # emblem image based on the group's configured image_key
+                try:
+                    key_name = str(data.get('image_key') or '')
+                    pimg = resolve_player_image_by_name_and_rarity(key_name, None)
+                    if pimg is not None:
+                        draw_player_png_centered(screen, pimg, shield.center, shield.w - 12, shield.h - 12)
+                except Exception:
+                    pass
+                # steps chip
+                chip = pygame.Surface((140, 24), pygame.SRCALPHA)
+                pygame.draw.rect(chip, (60, 62, 78, 200), chip.get_rect(), border_radius=8)
+                ct = self.app.h5.render(f"{data['steps']} ÉTAPES", True, (230, 230, 240))
+                chip.blit(ct, (chip.get_width() // 2 - ct.get_width() // 2, chip.get_height() // 2 - ct.get_height() // 2))
+                screen.blit(chip, (r.x + 12, r.bottom - 48))
+                # Open hint
+                bt = self.app.h4.render('Ouvrir', True, (255, 255, 255))
+                open_btn = pygame.Rect(r.centerx - 60, r.bottom - 56, 120, 36)
+                pygame.draw.rect(screen, (40, 140, 240), open_btn, border_radius=10)
+                screen.blit(bt, (open_btn.centerx - bt.get_width() // 2, open_btn.centery - bt.get_height() // 2))
+            else:
+                d = itm[1]
+                # optional background image
+                if getattr(d, 'bg_img', None):
+                    try:
+                        use_p = assets.resolve(d.bg_img)
+                        if use_p is not None:
+                            inner = r.inflate(-8, -8)
+                            panel = pygame.Surface((inner.w, inner.h), pygame.SRCALPHA)
+                            draw_bg_cover(panel, use_p, panel.get_rect())
+                            mask = pygame.Surface((inner.w, inner.h), pygame.SRCALPHA)
+                            pygame.draw.rect(mask, (255, 255, 255, 255), mask.get_rect(), border_radius=12)
+                            panel.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+                            screen.blit(panel, inner.topleft)
+                    except Exception:
+                        pass
+                # title & desc
+                ttl = self.app.h4.render(d.name, True, (235, 235, 245))
+                screen.blit(ttl, (r.x + 12, r.y + 12))
+                dsc = self.app.h5.render(d.description, True, (200, 200, 210))
+                screen.blit(dsc, (r.x + 12, r.y + 44))
+                # card image if present
+                if getattr(d, 'card_img', None):
+                    try:
+                        p = assets.resolve(d.card_img)
+                        if p is not None:
+                            shield_h = max(120, int(r.h * 0.44))
+                            shield_w = int(shield_h * 0.8)
+                            shield = pygame.Rect(r.centerx - shield_w // 2, r.y + int(r.h * 0.22), shield_w, shield_h)
+                            draw_player_png_centered(screen, p, shield.center, shield.w - 8, shield.h - 8)
+                    except Exception:
+                        pass
+                # progress bar
+                cur = defi_mod.get_progress(d.event_key)
+                tgt = max(1, d.target)
+                prog = min(cur / tgt, 1.0)
+                bar = pygame.Rect(r.x + 12, min(r.bottom - 64, r.y + int(r.h * 0.7)), r.w - 24, 8)
+                pygame.draw.rect(screen, (46, 48, 60), bar, border_radius=6)
+                fill = pygame.Rect(bar.x, bar.y, int(bar.w * prog), bar.h)
+                pygame.draw.rect(screen, (90, 200, 110), fill, border_radius=6)
+                pr = self.app.h5.render(f"{min(cur, tgt)}/{tgt}", True, (210, 210, 220))
+                screen.blit(pr, (bar.centerx - pr.get_width() // 2, bar.y - 18))
+                # reward chip
+                typ, amt = d.reward
+                chip = pygame.Surface((130, 22), pygame.SRCALPHA)
+                pygame.draw.rect(chip, (60, 62, 78, 200), chip.get_rect(), border_radius=8)
+                text = f"+{amt} {'XP' if typ=='xp' else 'Coins'}"
+                ct = self.app.h5.render(text, True, (230, 230, 240))
+                chip.blit(ct, (chip.get_width() // 2 - ct.get_width() // 2, chip.get_height() // 2 - ct.get_height() // 2))
+                screen.blit(chip, (r.x + 12, r.bottom - 48))
+                # claim button
+                can = defi_mod.can_claim(d)
+                claim = pygame.Rect(r.centerx - 60, r.bottom - 56, 120, 36)
+                pygame.draw.rect(screen, (40, 140, 240) if can else (60, 62, 78), claim, border_radius=10)
+                bt = self.app.h4.render('Récupérer' if can else 'Bloqué', True, (255, 255, 255))
+                screen.blit(bt, (claim.centerx - bt.get_width() // 2, claim.centery - bt.get_height() // 2))
+        screen.set_clip(prev_clip)
+
+        # hint
+        hint_txt = 'Molette ou ← → pour défiler · Clique Récupérer quand un défi est terminé'
+        hint = self.app.h5.render(hint_txt, True, (160, 160, 170))
+        screen.blit(hint, (area.x + 12, area.bottom + 8))
+        esc = self.app.h5.render('[Esc] Retour', True, (150, 150, 160))
+        screen.blit(esc, (w - esc.get_width() - 32, 32))
+
+
+class DefiGroupDetail(Screen):
+    """Detail view for a group of Défis (multi-step) with SBC-like layout and sizing."""
+    def __init__(self, app: 'App', title: str, defi_ids: List[str]):
+        super().__init__(app)
+        self.title = title
+        self.defi_ids = defi_ids
+        # build id->defi mapping once
+        self.id_map = content.registry().defi_by_id
+        # select first non-claimed, else last
+        self.selected_id = None
+        for cid in self.defi_ids:
+            try:
+                if not defi_mod.is_claimed(cid):
+                    self.selected_id = cid
+                    break
+            except Exception:
+                pass
+        if self.selected_id is None and self.defi_ids:
+            self.selected_id = self.defi_ids[-1]
+
+    def _selected_defi(self):
+        if not self.selected_id:
+            return None
+        return self.id_map.get(self.selected_id)
+
+    def handle(self, event: pygame.event.Event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.app.pop()
+            return
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
+            d = self._selected_defi()
+            if d is not None and defi_mod.can_claim(d):
+                defi_mod.claim(d)
+            return
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            mx, my = event.pos
+            w, h = self.app.size
+            area = pygame.Rect(40, 140, w - 80 - 360, h - 220)
+            padding, gap = 12, 12
+            rows = 2
+            n = len(self.defi_ids)
+            inner = pygame.Rect(area.x + padding, area.y + padding, area.w - 2 * padding, area.h - 2 * padding)
+            if n == 2:
+                cols = 2
+                col_w = (inner.w - (cols - 1) * gap) // cols
+                row0_h = (inner.h - gap) // 2
+                x_left = inner.x
+                x_right = inner.x + col_w + gap
+                y_top = inner.y
+                for i, cid in enumerate(self.defi_ids):
+                    if i == 0:
+                        r = pygame.Rect(x_left, y_top, col_w, row0_h)
+                    else:
+                        r = pygame.Rect(x_right, y_top, col_w, row0_h)
+                    if r.collidepoint((mx, my)):
+                        self.selected_id = cid
+                        return
+            else:
+                cols = max(2, (n + rows - 1) // rows)
+                step_w = (inner.w - (cols - 1) * gap) / max(1, cols)
+                step_h = (inner.h - (rows - 1) * gap) / max(1, rows)
+                for i, cid in enumerate(self.defi_ids):
+                    col = i % cols
+                    row = i // cols
+                    x = int(round(inner.x + col * (step_w + gap)))
+                    y = int(round(inner.y + row * (step_h + gap)))
+                    w_rect = inner.right - x if col == cols - 1 else int(round(step_w))
+                    h_rect = inner.bottom - y if row == rows - 1 else int(round(step_h))
+                    r = pygame.Rect(x, y, w_rect, h_rect)
+                    if r.collidepoint((mx, my)):
+                        self.selected_id = cid
+                        return
+            # right panel claim button
+            right = pygame.Rect(area.right + 24, area.y, 336, area.h)
+            claim_rect = pygame.Rect(right.x + 20, right.bottom - 64, right.w - 40, 44)
+            if claim_rect.collidepoint((mx, my)):
+                d = self._selected_defi()
+                if d is not None and defi_mod.can_claim(d):
+                    defi_mod.claim(d)
+
+    def draw(self, screen: pygame.Surface):
+        w, h = self.app.size
+        screen.fill((10, 12, 16))
+        hdr = self.app.h2.render(self.title, True, (235, 235, 245))
+        screen.blit(hdr, (40, 32))
+        area = pygame.Rect(40, 140, w - 80 - 360, h - 220)
+        right = pygame.Rect(area.right + 24, area.y, 336, area.h)
+        pygame.draw.rect(screen, (18, 20, 26), area, border_radius=12)
+        pygame.draw.rect(screen, (60, 62, 78), area, 2, border_radius=12)
+        pygame.draw.rect(screen, (18, 20, 26), right, border_radius=12)
+        pygame.draw.rect(screen, (60, 62, 78), right, 2, border_radius=12)
+
+        padding, gap = 12, 12
+        rows = 2
+        n = len(self.defi_ids)
+        inner = pygame.Rect(area.x + padding, area.y + padding, area.w - 2 * padding, area.h - 2 * padding)
+        mx, my = pygame.mouse.get_pos()
+        if n == 2:
+            cols = 2
+            col_w = (inner.w - (cols - 1) * gap) // cols
+            row0_h = (inner.h - gap) // 2
+            x_left = inner.x
+            x_right = inner.x + col_w + gap
+            y_top = inner.y
+            for i, cid in enumerate(self.defi_ids):
+                d = self.id_map.get(cid)
+                if i == 0:
+                    r = pygame.Rect(x_left, y_top, col_w, row0_h)
+                else:
+                    r = pygame.Rect(x_right, y_top, col_w, row0_h)
+                claimed = defi_mod.is_claimed(cid)
+                selected = (cid == self.selected_id)
+                hovered = r.collidepoint((mx, my))
+                bg = (32, 34, 44)
+                if selected:
+                    bg = (190, 220, 60)
+                elif hovered:
+                    bg = (40, 42, 54)
+                pygame.draw.rect(screen, bg, r, border_radius=12)
+                pygame.draw.rect(screen, (90, 92, 110), r, 2, border_radius=12)
+                ttl = self.app.h4.render(d.name, True, (20, 22, 26) if selected else (235, 235, 245))
+                screen.blit(ttl, (r.x + 16, r.y + 12))
+                dsc = self.app.h5.render(d.description, True, (30, 32, 36) if selected else (200, 200, 210))
+                screen.blit(dsc, (r.x + 16, r.y + 46))
+                if claimed:
+                    badge = self.app.h5.render('COMPLETED', True, (20, 22, 26) if selected else (180, 240, 120))
+                    screen.blit(badge, (r.x + 16, r.bottom - 28))
+        else:
+            cols = max(2, (n + rows - 1) // rows)
+            step_w = (inner.w - (cols - 1) * gap) / max(1, cols)
+            step_h = (inner.h - (rows - 1) * gap) / max(1, rows)
+            for i, cid in enumerate(self.defi_ids):
+                d = self.id_map.get(cid)
+                col = i % cols
+                row = i // cols
+                x = int(round(inner.x + col * (step_w + gap)))
+                y = int(round(inner.y + row * (step_h + gap)))
+                w_rect = inner.right - x if col == cols - 1 else int(round(step_w))
+                h_rect = inner.bottom - y if row == rows - 1 else int(round(step_h))
+                r = pygame.Rect(x, y, w_rect, h_rect)
+                claimed = defi_mod.is_claimed(cid)
+                selected = (cid == self.selected_id)
+                hovered = r.collidepoint((mx, my))
+                bg = (32, 34, 44)
+                if selected:
+                    bg = (190, 220, 60)
+                elif hovered:
+                    bg = (40, 42, 54)
+                pygame.draw.rect(screen, bg, r, border_radius=12)
+                pygame.draw.rect(screen, (90, 92, 110), r, 2, border_radius=12)
+                ttl = self.app.h4.render(d.name, True, (20, 22, 26) if selected else (235, 235, 245))
+                screen.blit(ttl, (r.x + 16, r.y + 12))
+                dsc = self.app.h5.render(d.description, True, (30, 32, 36) if selected else (200, 200, 210))
+                screen.blit(dsc, (r.x + 16, r.y + 46))
+                if claimed:
+                    badge = self.app.h5.render('COMPLETED', True, (20, 22, 26) if selected else (180, 240, 120))
+                    screen.blit(badge, (r.x + 16, r.bottom - 28))
+
+        # right panel: selected details + claim
+        d = self._selected_defi()
+        if d is not None:
+            hdr2 = self.app.h4.render(d.name, True, (235, 235, 245))
+            screen.blit(hdr2, (right.x + 16, right.y + 16))
+            sub = self.app.h5.render('OBJECTIF', True, (180, 180, 190))
+            screen.blit(sub, (right.x + 16, right.y + 54))
+            y0 = right.y + 80
+            # show target and current progress
+            try:
+                cur = defi_mod.get_progress(d.event_key)
+                tgt = max(1, d.target)
+                lines = [
+                    f"Compléter {tgt} SBC au total",
+                    f"Progression: {min(cur, tgt)}/{tgt}",
+                ]
+            except Exception:
+                lines = []
+            for b in lines:
+                dot = self.app.h4.render('•', True, (210, 210, 220))
+                txt = self.app.h5.render(b, True, (210, 210, 220))
+                screen.blit(dot, (right.x + 18, y0))
+                screen.blit(txt, (right.x + 36, y0 + 4))
+                y0 += 28
+            # reward label
+            rw = self.app.h5.render('RÉCOMPENSE', True, (180, 180, 190))
+            screen.blit(rw, (right.x + 16, right.bottom - 108))
+            # claim button
+            can = defi_mod.can_claim(d)
+            claim_rect = pygame.Rect(right.x + 20, right.bottom - 64, right.w - 40, 44)
+            pygame.draw.rect(screen, (40, 140, 240) if can else (60, 62, 78), claim_rect, border_radius=10)
+            lbl = self.app.h4.render('Récupérer' if can else ('Réclamé' if defi_mod.is_claimed(d.id) else 'Bloqué'), True, (255, 255, 255))
+            screen.blit(lbl, (claim_rect.centerx - lbl.get_width() // 2, claim_rect.centery - lbl.get_height() // 2))
+
+        hint = self.app.h5.render('[Esc] Retour', True, (150, 150, 160))
+        screen.blit(hint, (w - hint.get_width() - 32, 32))
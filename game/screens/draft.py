@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+import pygame
+
+from ..packs import RARITY_COLORS
+from .. import card_faces
+from .. import draft as draft_mod
+from .. import ids as card_ids
+from .. import xp
+from ..app import App, Button, Screen, draw_player_png_centered, resolve_player_image_by_name_and_rarity
+
+# Draft mode: pay the entry, pick one card per slot, then play the AI squads.
+# The screen opens on an entry button; leaving mid-run forfeits the fee.
+
+
+class Draft(Screen):
+    def __init__(self, app: 'App'):
+        super().__init__(app)
+        self.message = ''
+        self.show_hint = True
+        self.run: Optional[draft_mod.DraftRun] = None
+
+    def _new_run(self):
+        try:
+            player = xp.get_name()
+        except Exception:
+            player = 'Joueur'
+        run = draft_mod.start(player=player)
+        if run is None:
+            self.app.show_toast(f"Pas assez de Minecoins ({draft_mod.ENTRY_COST})", 2.0)
+            return
+        self.run = run
+
+    # --- layout ---
+    def _offer_rects(self) -> List[pygame.Rect]:
+        w, h = self.app.size
+        n = max(1, len(self.run.offer))
+        card_h = max(180, min(320, h - 360))
+        card_w = int(card_h * 0.72)
+        gap = 24
+        total = n * card_w + (n - 1) * gap
+        x0 = w // 2 - total // 2
+        return [pygame.Rect(x0 + i * (card_w + gap), 210, card_w, card_h) for i in range(n)]
+
+    def _action_rect(self) -> pygame.Rect:
+        w, h = self.app.size
+        return pygame.Rect(w // 2 - 120, h - 110, 240, 48)
+
+    def _hint_rect(self) -> pygame.Rect:
+        return pygame.Rect(self.app.size[0] - 40 - 180, 150, 180, 36)
+
+    def handle(self, event: pygame.event.Event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.app.pop()
+                return
+            if event.key == pygame.K_h:
+                self.show_hint = not self.show_hint
+                return
+            if self.run is None:
+                if event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
+                    self._new_run()
+                return
+            if pygame.K_1 <= event.key <= pygame.K_9 and not self.run.done:
+                self.run.pick(event.key - pygame.K_1)
+                return
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            pos = event.pos
+            if self.run is None:
+                if self._action_rect().collidepoint(pos):
+                    self._new_run()
+                return
+            if self._hint_rect().collidepoint(pos):
+                self.show_hint = not self.show_hint
+                return
+            if not self.run.done:
+                for i, r in enumerate(self._offer_rects()):
+                    if r.collidepoint(pos):
+                        self.run.pick(i)
+                        return
+                return
+            if self._action_rect().collidepoint(pos):
+                if self.run.result is None:
+                    res = self.run.play()
+                    if res is not None and res.coins:
+                        self.app.show_toast(f"+{res.coins} Minecoins", 2.0)
+                else:
+                    self._new_run()
+
+    # --- drawing ---
+    def _render_card(self, face: pygame.Surface, cid: int):
+        rect = face.get_rect()
+        item = card_ids.card(cid)
+        name = card_ids.name_of(cid)
+        rarity = str(item.get('rarity', '') or '')
+        color = RARITY_COLORS.get(rarity, (160, 160, 160))
+        pygame.draw.rect(face, (24, 26, 32), rect, border_radius=14)
+        inner = rect.inflate(-12, -40)
+        inner.y = rect.y + 6
+        img_path = resolve_player_image_by_name_and_rarity(name, rarity)
+        if img_path is not None:
+            draw_player_png_centered(face, img_path, inner.center, inner.w, inner.h)
+        pygame.draw.rect(face, color, rect, 3, border_radius=14)
+        lbl = self.app.h5.render(f"{card_ids.rating_of(cid)} {name.split('#')[0]}", True, (235, 235, 245))
+        if lbl.get_width() > rect.w - 12:
+            lbl = lbl.subsurface((0, 0, rect.w - 12, lbl.get_height()))
+        face.blit(lbl, (rect.centerx - lbl.get_width() // 2, rect.bottom - 26))
+
+    def _draw_squad(self, screen: pygame.Surface):
+        w = self.app.size[0]
+        n = draft_mod.SQUAD_SIZE
+        gap = 6
+        bw = (w - 80 - (n - 1) * gap) // n
+        for i, slot in enumerate(draft_mod.FORMATION):
+            r = pygame.Rect(40 + i * (bw + gap), 88, bw, 48)
+            cur = i == self.run.slot
+            pygame.draw.rect(screen, (58, 60, 90) if cur else (30, 32, 40), r, border_radius=8)
+            pygame.draw.rect(screen, (90, 90, 110), r, 1, border_radius=8)
+            lbl = self.app.h5.render(slot, True, (170, 170, 185))
+            screen.blit(lbl, (r.x + 6, r.y + 4))
+            if i < len(self.run.squad.picks):
+                cid = self.run.squad.picks[i]
+                txt = self.app.h5.render(f"{card_ids.rating_of(cid)} {card_ids.name_of(cid).split('#')[0]}", True, (235, 235, 245))
+                if txt.get_width() > r.w - 8:
+                    txt = txt.subsurface((0, 0, r.w - 8, txt.get_height()))
+                screen.blit(txt, (r.x + 4, r.bottom - txt.get_height() - 4))
+        rating = self.app.h4.render(f"Note d'équipe : {self.run.squad.rating()}", True, (235, 235, 245))
+        screen.blit(rating, (40, 152))
+
+    def _draw_offer(self, screen: pygame.Surface):
+        mx, my = pygame.mouse.get_pos()
+        best, expected = self.run.hint() if self.show_hint else (-1, [])
+        for i, (r, cid) in enumerate(zip(self._offer_rects(), self.run.offer)):
+            face = card_faces.face(('draft', cid), r.size, lambda s, c=cid: self._render_card(s, c))
+            screen.blit(face, r.topleft)
+            if r.collidepoint((mx, my)):
+                pygame.draw.rect(screen, (235, 235, 245), r, 2, border_radius=14)
+            key = self.app.h5.render(str(i + 1), True, (150, 150, 160))
+            screen.blit(key, (r.x + 8, r.y - 20))
+            if i < len(expected):
+                col = (120, 230, 140) if i == best else (170, 170, 185)
+                est = self.app.h5.render(f"Équipe : {expected[i]:.0f}", True, col)
+                screen.blit(est, (r.centerx - est.get_width() // 2, r.bottom + 8))
+                if i == best:
+                    pygame.draw.rect(screen, (120, 230, 140), r.inflate(8, 8), 3, border_radius=16)
+
+    def _draw_matches(self, screen: pygame.Surface):
+        w, h = self.app.size
+        y = 210
+        res = self.run.result
+        played = {m[0]: m for m in res.matches} if res is not None else {}
+        ours = self.run.squad.rating()
+        for opp in self.run.opponents:
+            theirs = opp.rating()
+            line = f"{opp.name} — note {theirs}"
+            col = (220, 220, 230)
+            m = played.get(opp.name)
+            if m is not None:
+                line += '   Victoire' if m[3] else '   Défaite'
+                col = (120, 230, 140) if m[3] else (240, 120, 120)
+            elif res is None:
+                line += f"   ({int(draft_mod.DraftRun.win_chance(ours, theirs) * 100)}% de victoire)"
+            txt = self.app.h4.render(line, True, col)
+            screen.blit(txt, (w // 2 - txt.get_width() // 2, y))
+            y += 40
+        if res is not None:
+            txt = self.app.h3.render(f"{res.wins} victoire(s) — +{res.coins} Minecoins", True, (235, 235, 245))
+            screen.blit(txt, (w // 2 - txt.get_width() // 2, y + 20))
+        ar = self._action_rect()
+        label = 'Jouer' if res is None else f'Nouveau draft ({draft_mod.ENTRY_COST})'
+        mx, my = pygame.mouse.get_pos()
+        Button(ar, label).draw(screen, self.app.h3, hovered=ar.collidepoint((mx, my)))
+
+    def _draw_entry(self, screen: pygame.Surface):
+        w, h = self.app.size
+        lines = (
+            f"Entrée : {draft_mod.ENTRY_COST} Minecoins",
+            'Choisis une carte par poste puis affronte les équipes IA.',
+            'Quitter un draft en cours fait perdre l\'entrée.',
+        )
+        y = 220
+        for line in lines:
+            txt = self.app.h4.render(line, True, (220, 220, 230))
+            screen.blit(txt, (w // 2 - txt.get_width() // 2, y))
+            y += 40
+        ar = self._action_rect()
+        mx, my = pygame.mouse.get_pos()
+        Button(ar, f'Commencer ({draft_mod.ENTRY_COST})').draw(screen, self.app.h3, hovered=ar.collidepoint((mx, my)))
+
+    def draw(self, screen: pygame.Surface):
+        w, h = self.app.size
+        screen.fill((14, 16, 22))
+        title = self.app.h2.render('Draft', True, (235, 235, 245))
+        screen.blit(title, (40, 32))
+        esc = self.app.h5.render('[Esc] Retour', True, (150, 150, 160))
+        screen.blit(esc, (w - esc.get_width() - 32, 32))
+        if self.run is None:
+            self._draw_entry(screen)
+            return
+        self._draw_squad(screen)
+        if not self.run.done:
+            hr = self._hint_rect()
+            mx, my = pygame.mouse.get_pos()
+            Button(hr, 'Conseil : oui' if self.show_hint else 'Conseil : non').draw(screen, self.app.h5, hovered=hr.collidepoint((mx, my)))
+            self._draw_offer(screen)
+            hint = self.app.h5.render('Clique une carte ou 1-5 pour choisir · H : conseil', True, (160, 160, 170))
+            screen.blit(hint, (40, h - 40))
+        else:
+            self._draw_matches(screen)
@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import time
+from typing import List, Optional
+
+import pygame
+
+from ..packs import generate_pack, PACK_SHOP, RARITY_COLORS
+from ..cards import Card
+from .. import db as game_db
+from .. import wallet
+from .. import xp
+from .. import defi as defi_mod
+from .. import card_faces
+from .. import bulk_open
+from ..grid import VirtualGrid
+from ..app import App, Button, Screen, draw_player_png_centered, resolve_player_image_by_name_and_rarity
+
+# Pack shop and opening screen.
+
+
+class Packs(Screen):
+    PACKS = PACK_SHOP
+
+    def __init__(self, app: 'App'):
+        super().__init__(app)
+        self.generated: Optional[List[Card]] = None
+        self.revealed_index = -1
+        self.last_reveal = 0.0
+        self.selected_pack = 0
+        # track which cards have been recorded into collection during reveal
+        self._revealed_recorded: set[int] = set()
+        self.message = ''
+        # bulk opening summary (replaces the reveal while shown)
+        self.bulk: Optional[bulk_open.BulkResult] = None
+        self.bulk_grid = VirtualGrid(150, 14, 1.35, label_h=20)
+
+    def _bulk_rects(self) -> List[pygame.Rect]:
+        return [pygame.Rect(320 + i * 122, 170, 110, 48) for i in range(len(bulk_open.BULK_COUNTS))]
+
+    def _reveal_area(self) -> pygame.Rect:
+        w, h = self.app.size
+        return pygame.Rect(40, 240, w - 80, h - 300)
+
+    def handle(self, event: pygame.event.Event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self._record_unrevealed()
+            self.app.pop()
+        if event.type == pygame.MOUSEWHEEL and self.bulk is not None:
+            self.bulk_grid.wheel(event.y)
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            mx, my = event.pos
+            # bulk open buttons (x10 / x50 / x100)
+            for n, r in zip(bulk_open.BULK_COUNTS, self._bulk_rects()):
+                if r.collidepoint((mx, my)):
+                    self.open_bulk(n)
+                    return
+            if self.bulk is not None and self._reveal_area().collidepoint((mx, my)):
+                return  # clicks on the summary don't open another pack
+            # quick access SBC button (top-right)
+            sbc_rect = pygame.Rect(self.app.size[0] - 140, 28, 100, 36)
+            if sbc_rect.collidepoint((mx, my)):
+                # gate SBC behind feature unlock
+                try:
+                    if self.app.feature_unlocked('sbc'):
+                        self.app.push('SBC')
+                except Exception:
+                    pass
+                return
+            # click on pack to open
+            self.open_selected_pack()
+
+    def open_selected_pack(self):
+        label, count, price = self.PACKS[self.selected_pack]
+        # attempt to spend Minecoins
+        if not wallet.spend_coins(price):
+            self.message = "Pas assez de Minecoins"
+            return
+        # log defi event: coins spent
+        try:
+            defi_mod.add_progress('coins_spent', price)
+        except Exception:
+            pass
+        self._record_unrevealed()
+        self.generated = generate_pack(label, count)
+        self.bulk = None
+        self.revealed_index = -1
+        self.last_reveal = 0.0
+        # reset reveal recorded set; collection will update on each reveal, Madfut-style
+        self._revealed_recorded.clear()
+        # award XP for opening a paid pack
+        try:
+            xp.add_xp(10)
+        except Exception:
+            pass
+        # log defi event: pack opened
+        try:
+            defi_mod.add_progress('pack_opened', 1)
+        except Exception:
+            pass
+
+    def open_bulk(self, n: int):
+        """Open n packs of the selected type at once and show the summary grid."""
+        label, count, price = self.PACKS[self.selected_pack]
+        res = bulk_open.open_packs(label, count, price, n)
+        if res is None:
+            self.message = f"Pas assez de Minecoins ({price * n} requis)"
+            return
+        self.message = ''
+        self._record_unrevealed()
+        self.generated = None
+        self.revealed_index = -1
+        self.bulk = res
+        self.bulk_grid.reset()
+
+    def _record_unrevealed(self):
+        """Add the paid cards a reveal hasn't shown yet (it is being replaced or left)."""
+        if not self.generated:
+            return
+        rest = [c.name for i, c in enumerate(self.generated) if i not in self._revealed_recorded]
+        self._revealed_recorded.update(range(len(self.generated)))
+        if rest:
+            try:
+                game_db.add_to_collection_by_names(rest)
+            except Exception:
+                pass
+
+    def update(self, dt: float):
+        if self.bulk is not None:
+            self.bulk_grid.update(dt)
+        if self.generated:
+            if time.time() - self.last_reveal > 0.45 and self.revealed_index < len(self.generated) - 1:
+                self.revealed_index += 1
+                self.last_reveal = time.time()
+                # record collection increment for the newly revealed card
+                if self.revealed_index not in self._revealed_recorded:
+                    self._revealed_recorded.add(self.revealed_index)
+                    try:
+                        game_db.add_to_collection_by_names([self.generated[self.revealed_index].name])
+                    except Exception:
+                        pass
+
+    def draw(self, screen: pygame.Surface):
+        w, h = self.app.size
+        screen.fill((14, 16, 20))
+        title = self.app.h2.render('Packs', True, (230, 230, 240))
+        screen.blit(title, (40, 32))
+        # Minecoins + XP chips
+        y = self._draw_wallet_chip(screen)
+        self._draw_xp_chip(screen, y + 8)
+        # SBC quick button (top-right)
+        sbc_rect = pygame.Rect(w - 140, 28, 100, 36)
+        mx, my = pygame.mouse.get_pos()
+        pressed = pygame.mouse.get_pressed()[0]
+        sbc_locked = False
+        try:
+            sbc_locked = not self.app.feature_unlocked('sbc')
+        except Exception:
+            pass
+        sbc_label = 'SBC 🔒' if sbc_locked else 'SBC'
+        Button(sbc_rect, sbc_label).draw(screen, self.app.h4, hovered=sbc_rect.collidepoint((mx, my)), pressed=pressed and sbc_rect.collidepoint((mx, my)))
+        # pack tabs
+        tab_w, tab_h = 180, 42
+        tab_x = 40
+        mx, my = pygame.mouse.get_pos()
+        pressed = pygame.mouse.get_pressed()[0]
+        for i, (label, count, price) in enumerate(self.PACKS):
+            r = pygame.Rect(tab_x + i * (tab_w + 12), 96, tab_w, tab_h)
+            hovered = r.collidepoint((mx, my))
+            sel = (i == self.selected_pack)
+            bg = (38, 40, 50) if not sel else (58, 60, 90)
+            if hovered:
+                bg = (48, 50, 65) if not sel else (68, 70, 110)
+            pygame.draw.rect(screen, bg, r, border_radius=10)
+            pygame.draw.rect(screen, (90, 90, 110), r, 2, border_radius=10)
+            txt = self.app.h4.render(f'{label}  x{count}  — {price}', True, (235, 235, 245))
+            screen.blit(txt, (r.centerx - txt.get_width() // 2, r.centery - txt.get_height() // 2))
+            if hovered and pressed:
+                self.selected_pack = i
+                self._record_unrevealed()
+                self.generated = None
+                self.bulk = None
+                self.revealed_index = -1
+
+        # open button
+        open_rect = pygame.Rect(40, 170, 260, 48)
+        # display price on button
+        _, _, price = self.PACKS[self.selected_pack]
+        open_btn = Button(open_rect, f'Ouvrir le pack ({price})')
+        open_btn.draw(screen, self.app.h3, hovered=open_rect.collidepoint((mx, my)), pressed=pressed and open_rect.collidepoint((mx, my)))
+        if pressed and open_rect.collidepoint((mx, my)):
+            self.open_selected_pack()
+        for n, r in zip(bulk_open.BULK_COUNTS, self._bulk_rects()):
+            Button(r, f'x{n}').draw(screen, self.app.h3, hovered=r.collidepoint((mx, my)), pressed=pressed and r.collidepoint((mx, my)))
+
+        # reveal area
+        reveal_area = self._reveal_area()
+        pygame.draw.rect(screen, (25, 27, 33), reveal_area, border_radius=16)
+        pygame.draw.rect(screen, (70, 72, 90), reveal_area, 2, border_radius=16)
+        if self.bulk is not None:
+            self._draw_bulk(screen, reveal_area)
+
+        if self.generated:
+            cols = min(5, max(1, len(self.generated)))
+            gap = 18
+            card_w = min(220, (reveal_area.w - (cols + 1) * gap) // cols)
+            card_h = int(card_w * 1.35)
+            for i, card in enumerate(self.generated[: self.revealed_index + 1]):
+                row = i // cols
+                col = i % cols
+                x = reveal_area.x + gap + col * (card_w + gap)
+                y = reveal_area.y + gap + row * (card_h + gap)
+                self._draw_card(screen, pygame.Rect(x, y, card_w, card_h), card)
+
+        # back hint
+        hint = self.app.h4.render('[Esc] Retour', True, (150, 150, 160))
+        screen.blit(hint, (w - hint.get_width() - 32, 32))
+        if self.message:
+            msg = self.app.h4.render(self.message, True, (220, 120, 120))
+            screen.blit(msg, (40, 136))
+
+    def _draw_wallet_chip(self, screen: pygame.Surface) -> int:
+        # reuse the same chip rendering as MainMenu
+        w, _ = self.app.size
+        bal = self.app.balance.get()
+        txt = self.app.h4.render(f"{bal} Minecoins", True, (235, 235, 245))
+        pad = 10
+        box = pygame.Rect(0, 0, txt.get_width() + pad * 2, txt.get_height() + pad)
+        box.topright = (w - 20, 20)
+        pygame.draw.rect(screen, (28, 30, 38), box, border_radius=10)
+        pygame.draw.rect(screen, (70, 72, 90), box, 2, border_radius=10)
+        screen.blit(txt, (box.x + pad, box.y + (box.h - txt.get_height()) // 2))
+        return box.bottom
+
+    def _draw_xp_chip(self, screen: pygame.Surface, top: int):
+        w, _ = self.app.size
+        total, lvl, cur, need = self.app.xp_progress.get()
+        txt = self.app.h4.render(f"XP {total}  ·  Lv {lvl}", True, (235, 235, 245))
+        pad = 10
+        box = pygame.Rect(0, 0, txt.get_width() + pad * 2, txt.get_height() + pad)
+        box.topright = (w - 20, top)
+        pygame.draw.rect(screen, (28, 30, 38), box, border_radius=10)
+        pygame.draw.rect(screen, (70, 72, 90), box, 2, border_radius=10)
+        screen.blit(txt, (box.x + pad, box.y + (box.h - txt.get_height()) // 2))
+
+    def _draw_bulk(self, screen: pygame.Surface, area: pygame.Rect):
+        res = self.bulk
+        head = self.app.h4.render(
+            f"{res.packs} × {res.pack} — {len(res.cards)} cartes, {len(res.summary)} différentes  ·  -{res.coins} Minecoins  ·  +{res.xp} XP",
+            True, (235, 235, 245))
+        screen.blit(head, (area.x + 16, area.y + 12))
+        grid_area = pygame.Rect(area.x + 8, area.y + 44, area.w - 16, area.h - 52)
+        grid = self.bulk_grid
+        grid.layout(grid_area, len(res.summary))
+        prev_clip = screen.get_clip()
+        screen.set_clip(grid_area)
+        for idx, r in grid.visible_cells():
+            card, copies = res.summary[idx]
+            self._draw_card(screen, r, card)
+            if copies > 1:
+                badge = self.app.h5.render(f'x{copies}', True, (255, 255, 255))
+                chip = pygame.Rect(r.right - badge.get_width() - 14, r.y + 6, badge.get_width() + 10, badge.get_height() + 4)
+                pygame.draw.rect(screen, (40, 140, 240), chip, border_radius=8)
+                screen.blit(badge, (chip.x + 5, chip.y + 2))
+            lbl = self.app.h5.render(f'{card.rating} {card.name}', True, (220, 220, 230))
+            if lbl.get_width() > r.w:
+                lbl = lbl.subsurface((0, 0, r.w, lbl.get_height()))
+            screen.blit(lbl, (r.centerx - lbl.get_width() // 2, r.bottom + 2))
+        screen.set_clip(prev_clip)
+
+    def _draw_card(self, screen: pygame.Surface, rect: pygame.Rect, card: Card):
+        face = card_faces.face(('pack', card_faces.card_key(card)), rect.size, lambda s: self._render_card(s, card))
+        screen.blit(face, rect.topleft)
+
+    def _render_card(self, face: pygame.Surface, card: Card):
+        rect = face.get_rect()
+        color = RARITY_COLORS.get(card.rarity, (160, 160, 160))
+        # raw PNG full-bleed with a thin rarity border
+        bg = (24, 26, 32)
+        pygame.draw.rect(face, bg, rect, border_radius=14)
+        # draw PNG centered, with small padding
+        pad = 6
+        inner = pygame.Rect(rect.x + pad, rect.y + pad, rect.w - 2 * pad, rect.h - 2 * pad)
+        img_path = resolve_player_image_by_name_and_rarity(card.name, card.rarity)
+        if img_path is not None:
+            ok = draw_player_png_centered(face, img_path, (inner.centerx, inner.centery), inner.w, inner.h)
+            if not ok:
+                pygame.draw.rect(face, (45, 47, 58), inner, border_radius=12)
+        else:
+            pygame.draw.rect(face, (45, 47, 58), inner, border_radius=12)
+        # rarity outline
+        pygame.draw.rect(face, color, rect, 3, border_radius=14)
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+import pygame
+
+from .. import profiles
+from ..app import App, Button, Screen
+
+# Profile switcher: one row per save profile; clicking a row activates it.
+# New profiles are named in the text box at the bottom.
+
+
+class Profiles(Screen):
+    def __init__(self, app: 'App'):
+        super().__init__(app)
+        self.message = ''
+        self.name_text = ''
+        self._name_active = False
+        self._refresh()
+
+    def _refresh(self):
+        self.rows: List[Dict] = profiles.list_profiles()
+
+    # --- layout ---
+    def _row_rects(self) -> List[Tuple[Dict, pygame.Rect, pygame.Rect]]:
+        w = self.app.size[0]
+        out = []
+        for i, p in enumerate(self.rows):
+            r = pygame.Rect(40, 100 + i * 58, w - 80, 50)
+            out.append((p, r, pygame.Rect(r.right - 150, r.y + 8, 140, 34)))
+        return out
+
+    def _name_rect(self) -> pygame.Rect:
+        return pygame.Rect(40, self.app.size[1] - 90, 320, 42)
+
+    def _create_rect(self) -> pygame.Rect:
+        return pygame.Rect(380, self.app.size[1] - 90, 220, 42)
+
+    def _create(self):
+        pid = profiles.create(self.name_text)
+        self.name_text = ''
+        self._name_active = False
+        self._switch(pid)
+
+    def _switch(self, pid: str):
+        ok = profiles.switch(pid)
+        self._refresh()
+        if ok:
+            self.message = f"Profil actif : {self._name_of(pid)}"
+
+    def _name_of(self, pid: str) -> str:
+        for p in self.rows:
+            if p['id'] == pid:
+                return p['name']
+        return pid
+
+    def handle(self, event: pygame.event.Event):
+        if event.type == pygame.KEYDOWN:
+            if self._name_active:
+                if event.key == pygame.K_BACKSPACE:
+                    self.name_text = self.name_text[:-1]
+                elif event.key == pygame.K_RETURN:
+                    self._create()
+                elif event.key == pygame.K_ESCAPE:
+                    self._name_active = False
+                else:
+                    ch = event.unicode
+                    if ch and ch.isprintable() and len(self.name_text) < 24:
+                        self.name_text += ch
+                return
+            if event.key == pygame.K_ESCAPE:
+                self.app.pop()
+            return
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            pos = event.pos
+            self._name_active = self._name_rect().collidepoint(pos)
+            if self._create_rect().collidepoint(pos):
+                self._create()
+                return
+            for p, row, delete in self._row_rects():
+                if delete.collidepoint(pos) and not p['active'] and p['id'] != profiles.DEFAULT_ID:
+                    if profiles.delete(p['id']):
+                        self.message = f"Profil supprimé : {p['name']}"
+                    self._refresh()
+                    return
+                if row.collidepoint(pos):
+                    if not p['active']:
+                        self._switch(p['id'])
+                    return
+
+    def draw(self, screen: pygame.Surface):
+        w, h = self.app.size
+        screen.fill((16, 18, 22))
+        title = self.app.h2.render('Profils', True, (230, 230, 240))
+        screen.blit(title, (40, 32))
+        esc = self.app.h5.render('[Esc] Retour', True, (150, 150, 160))
+        screen.blit(esc, (w - esc.get_width() - 32, 32))
+        mx, my = pygame.mouse.get_pos()
+        for p, row, delete in self._row_rects():
+            hovered = row.collidepoint((mx, my))
+            bg = (40, 70, 52) if p['active'] else (34, 36, 46) if hovered else (26, 28, 36)
+            pygame.draw.rect(screen, bg, row, border_radius=10)
+            pygame.draw.rect(screen, (90, 90, 110), row, 1, border_radius=10)
+            name = self.app.h4.render(p['name'] + ('  (actif)' if p['active'] else ''), True, (235, 235, 245))
+            screen.blit(name, (row.x + 16, row.centery - name.get_height() // 2))
+            if p['last_used']:
+                info = 'Dernière partie : ' + datetime.fromtimestamp(p['last_used']).strftime('%d/%m/%Y')
+            else:
+                info = 'Jamais utilisé' if not p['active'] else ''
+            if p['archived']:
+                info += '  · archivé'
+            txt = self.app.h5.render(info, True, (160, 160, 175))
+            screen.blit(txt, (row.x + 360, row.centery - txt.get_height() // 2))
+            if not p['active'] and p['id'] != profiles.DEFAULT_ID:
+                Button(delete, 'Supprimer').draw(screen, self.app.h5, hovered=delete.collidepoint((mx, my)))
+
+        nr = self._name_rect()
+        pygame.draw.rect(screen, (30, 32, 40), nr, border_radius=8)
+        pygame.draw.rect(screen, (62, 140, 255) if self._name_active else (90, 90, 110), nr, 2, border_radius=8)
+        shown = self.name_text or ('' if self._name_active else 'Nom du profil')
+        col = (235, 235, 245) if self.name_text else (120, 120, 135)
+        txt = self.app.h4.render(shown + ('|' if self._name_active else ''), True, col)
+        screen.blit(txt, (nr.x + 10, nr.centery - txt.get_height() // 2))
+        cr = self._create_rect()
+        Button(cr, 'Nouveau profil').draw(screen, self.app.h4, hovered=cr.collidepoint((mx, my)))
+        if self.message:
+            msg = self.app.h5.render(self.message, True, (200, 220, 200))
+            screen.blit(msg, (40, h - 130))
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import time
+import random
+
+import pygame
+
+from ..cards import Card
+from ..particles import ParticlePool
+from .. import quality as quality_mod
+from ..app import App, Screen, draw_player_png_centered, resolve_player_image_by_name_and_rarity
+
+# Full-screen reveal for special reward cards.
+
+
+class SpecialRewardScreen(Screen):
+    """Overlay screen showing an animated special card reward (zoom-in + confetti)."""
+    animated = True
+    scaled = True
+
+    def __init__(self, app: 'App', card: Card):
+        super().__init__(app)
+        self.card = card
+        self.t0 = time.time()
+        self._layer_size = None
+        self._confetti = ParticlePool('dot', centered=True)
+        w, h = self.app.size
+        cols = [(240, 90, 90), (90, 200, 120), (90, 160, 240), (240, 200, 90), (200, 90, 220)]
+        factor = quality_mod.preset(self.app.settings.get('effects_quality', 'medium'))['factor']
+        for _ in range(int(140 * factor)):
+            self._confetti.spawn(
+                random.randint(0, w), random.randint(-h // 2, 0),
+                random.uniform(-40, 40), random.uniform(120, 240),
+                size=random.randint(2, 4), color=random.choice(cols),
+            )
+
+    def handle(self, event: pygame.event.Event):
+        if event.type == pygame.KEYDOWN or (event.type == pygame.MOUSEBUTTONDOWN and event.button == 1):
+            self.app.pop()
+
+    def update(self, dt: float):
+        w, h = self.app.size
+        # confetti falling past the bottom is recycled above the screen
+        self._confetti.update(dt, bottom=h + 10, wrap=(w, h))
+
+    def draw(self, screen: pygame.Surface):
+        w, h = self.app.size
+        # dim + confetti on the render-scale layer; it keeps its content between
+        # frames (the dim fades the trails), so it starts from what is on screen
+        rt = self.app.render
+        layer = rt.layer(screen)
+        if layer.get_size() != self._layer_size:
+            if layer is not screen:
+                pygame.transform.scale(screen, layer.get_size(), layer)
+            self._layer_size = layer.get_size()
+        layer.blit(rt.dim(180, layer.get_size()), (0, 0))
+        self._confetti.draw(layer, scale=rt.scale)
+        rt.present(screen, layer)
+        now = time.time()
+        # center panel
+        panel = pygame.Rect(w // 2 - 360, h // 2 - 220, 720, 440)
+        pygame.draw.rect(screen, (24, 26, 34), panel, border_radius=16)
+        pygame.draw.rect(screen, (90, 90, 110), panel, 2, border_radius=16)
+        # title
+        title = self.app.h3.render('Carte spéciale obtenue !', True, (235, 235, 245))
+        screen.blit(title, (panel.centerx - title.get_width() // 2, panel.y + 20))
+        # zoom animation
+        t = min(1.0, (now - self.t0) / 1.0)
+        # ease out cubic
+        s = 1 - pow(1 - t, 3)
+        max_w = int(panel.w * 0.42)
+        max_h = int(panel.h * 0.58)
+        img = resolve_player_image_by_name_and_rarity(self.card.name, self.card.rarity)
+        if img is not None:
+            draw_player_png_centered(screen, img, (panel.centerx, panel.centery + 10), int(max_w * s), int(max_h * s))
+        # name + rarity
+        nm = self.app.h3.render(self.card.name, True, (230, 230, 240))
+        screen.blit(nm, (panel.centerx - nm.get_width() // 2, panel.bottom - 96))
+        rar = self.app.h5.render(str(self.card.rarity).upper(), True, (200, 200, 210))
+        screen.blit(rar, (panel.centerx - rar.get_width() // 2, panel.bottom - 68))
+        hint = self.app.h5.render('Cliquer ou Entrée pour continuer', True, (170, 170, 180))
+        screen.blit(hint, (panel.centerx - hint.get_width() // 2, panel.bottom - 36))
@@ -0,0 +1,1197 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import pygame
+
+from ..packs import generate_pack, RARITY_COLORS
+from ..cards import Card
+from .. import content
+from .. import db as game_db
+from .. import sbc as sbc_mod
+from .. import sbc_planner
+from .. import defi as defi_mod
+from .. import ids as card_ids
+from .. import state_bus
+from .. import card_faces
+from ..grid import VirtualGrid
+from .. import assets
+from ..app import App, Button, Screen, draw_bg_cover, draw_player_png_centered, normalize_text, resolve_player_image_by_name_and_rarity
+
+# SBC list, group detail and squad builder.
+
+
+class SBC(Screen):
+    def __init__(self, app: 'App'):
+        super().__init__(app)
+        # FIFA-like SBC hub (tile menu like the screenshot)
+        self.message = ''
+        self.groups = self._build_groups()
+        self.tile_scroll_x = 0
+        self.hover_tile = -1
+        # Tabs: 'Tous', 'Ultimate Scream' and 'Premium'
+        self.tabs = ['Tous', 'Ultimate Scream', 'Premium']
+        self.active_tab = 0
+        # global planner overlay (None when closed)
+        self.plan: Optional[sbc_planner.Plan] = None
+        self.plan_objective = 'count'
+
+    def _challenges(self):
+        return content.registry().challenges
+
+    def _series(self, series: str):
+        return content.registry().challenge_series.get(series, ())
+
+    def _owned(self):
+        return self.app.owned.get()
+
+    def _catalog(self):
+        return card_ids.catalog_index()
+
+    # --- New: group tiles (like FIFA) ---
+    def _build_groups(self):
+        # Group busquets series together; others are standalone
+        groups = []
+        busq_ids = list(self._series('busquets_eoe'))
+        if busq_ids:
+            groups.append({
+                'title': "Sergio Busquets — Fin d'une ère",
+                'challenge_ids': busq_ids,
+                'days': 15,
+                'image_key': 'Sergio Busquets',
+                'bg': (92, 82, 54),
+                'bg_img': str(Path("C:\\Users\\Utilisateur\\Desktop\\Minefut\\Fond\\Sbc\\Fin d'une ère\\fond fin d'une  ère.png")),
+                'type': 'premium',
+            })
+        alba_ids = list(self._series('alba_eoe'))
+        if alba_ids:
+            groups.append({
+                'title': "Jordi Alba — Fin d'une ère",
+                'challenge_ids': alba_ids,
+                'days': 12,
+                'image_key': 'Jordi Alba',
+                'bg': (92, 82, 54),
+                'bg_img': str(Path("C:\\Users\\Utilisateur\\Desktop\\Minefut\\Fond\\Sbc\\Fin d'une ère\\fond fin d'une  ère.png")),
+                'type': 'premium',
+            })
+        gori_ids = list(self._series('goretzka_fb'))
+        # fallback by name contains 'flashback' + 'goretzka' if prefix not found
+        if not gori_ids:
+            gori_ids = [ch.id for ch in self._challenges() if ('flashback' in normalize_text(ch.name) and 'goretzka' in normalize_text(ch.name))]
+        if gori_ids:
+            groups.append({
+                'title': 'Goretzka — Flashback',
+                'challenge_ids': gori_ids,
+                'days': 10,
+                'image_key': 'Goretzka',
+                'bg': (46, 76, 112),
+                'bg_img': str(Path("C:\\Users\\Utilisateur\\Desktop\\Minefut\\Fond\\Sbc\\Flashback\\fond flashback.png")),
+            })
+        dzeko_ids = list(self._series('dzeko_fb'))
+        if not dzeko_ids:
+            dzeko_ids = [ch.id for ch in self._challenges() if ('flashback' in normalize_text(ch.name) and ('dzeko' in normalize_text(ch.name) or 'džeko' in normalize_text(ch.name)))]
+        if dzeko_ids:
+            groups.append({
+                'title': 'Džeko — Flashback',
+                'challenge_ids': dzeko_ids,
+                'days': 10,
+                'image_key': 'Džeko',
+                'bg': (46, 76, 112),
+                'bg_img': str(Path("C:\\Users\\Utilisateur\\Desktop\\Minefut\\Fond\\Sbc\\Flashback\\fond flashback.png")),
+            })
+        # Flashback: Xherdan Shaqiri
+        shaq_ids = list(self._series('shaqiri_fb'))
+        if not shaq_ids:
+            shaq_ids = [ch.id for ch in self._challenges() if ('flashback' in normalize_text(ch.name) and 'shaqiri' in normalize_text(ch.name))]
+        if shaq_ids:
+            groups.append({
+                'title': 'Xherdan Shaqiri — Flashback',
+                'challenge_ids': shaq_ids,
+                'days': 10,
+                'image_key': 'Xherdan Shaqiri',
+                'bg': (46, 76, 112),
+                'bg_img': str(Path("C:\\Users\\Utilisateur\\Desktop\\Minefut\\Fond\\Sbc\\Flashback\\fond flashback.png")),
+                'type': 'halloween',
+            })
+        # Hero: Van Buyten
+        van_ids = list(self._series('vanbuyten_hero'))
+        if not van_ids:
+            van_ids = [ch.id for ch in self._challenges() if ('hero' in normalize_text(ch.name) and 'van buyten' in normalize_text(ch.name))]
+        if van_ids:
+            groups.append({
+                'title': 'Van Buyten — Héro',
+                'challenge_ids': van_ids,
+                'days': 9,
+                'image_key': 'Van Buyten',
+                'bg': (84, 58, 110),
+                'bg_img': str(Path("C:\\Users\\Utilisateur\\Desktop\\Minefut\\Fond\\Sbc\\Héro\\fond héro.png")),
+            })
+        # Icon début: Zlatan Ibrahimović (5 steps)
+        zlatan_ids = list(self._series('zlatan_icon'))
+        if not zlatan_ids:
+            zlatan_ids = [ch.id for ch in self._challenges() if ('icon' in normalize_text(ch.name) and ('zlatan' in normalize_text(ch.name) or 'ibrahimovic' in normalize_text(ch.name)))]
+        if zlatan_ids:
+            groups.append({
+                'title': 'Zlatan Ibrahimović — Icon début',
+                'challenge_ids': zlatan_ids,
+                'days': 20,
+                'image_key': 'Ibrahimović',
+                'bg': (90, 90, 110),
+                'bg_img': str(Path("C:\\Users\\Utilisateur\\Desktop\\Minefut\\Fond\\Sbc\\Icon debut champion\\fond icon debut champion .png")),
+            })
+        # Hero: Dimitri Payet (single)
+        payet_ids = list(self._series('payet_hero'))
+        if not payet_ids:
+            payet_ids = [ch.id for ch in self._challenges() if ('hero' in normalize_text(ch.name) and 'payet' in normalize_text(ch.name))]
+        if payet_ids:
+            groups.append({
+                'title': 'Dimitri Payet — Héro',
+                'challenge_ids': payet_ids,
+                'days': 9,
+                'image_key': 'Payet',
+                'bg': (84, 58, 110),
+                'bg_img': str(Path("C:\\Users\\Utilisateur\\Desktop\\Minefut\\Fond\\Sbc\\Héro\\fond héro.png")),
+            })
+        # Ultimate Scream: Paul Pogba (single)
+        pogba_ids = list(self._series('pogba_halloween'))
+        if pogba_ids:
+            groups.append({
+                'title': 'Paul Pogba — Ultimate Scream',
+                'challenge_ids': pogba_ids,
+                'days': 14,
+                'image_key': 'Paul Pogba#sbc',
+                'bg_img': str(Path("C:\\Users\\Utilisateur\\Desktop\\Minefut\\Fond\\Sbc\\Ultimate Scream\\Joueur\\fond ultimate scream.png")),
+                'bg': (96, 72, 20),  # orange-ish
+                'type': 'halloween',
+            })
+        # other singles
+        for ch in self._challenges():
+            name_norm = normalize_text(ch.name)
+            is_flashback_name = ('flashback' in name_norm and ('goretzka' in name_norm or 'dzeko' in name_norm or 'džeko' in name_norm))
+            if ch.id.startswith('busquets_eoe_') or ch.id.startswith('alba_eoe_') or ch.id.startswith('goretzka_fb_') or ch.id.startswith('dzeko_fb_') or is_flashback_name:
+                continue
+            groups.append({
+                'title': ch.name,
+                'challenge_ids': [ch.id],
+                'days': 5,
+                'image_key': None,
+                'bg': (58, 62, 78),
+            })
+        return groups
+
+    def _visible_groups(self):
+        if self.active_tab == 0:
+            return self.groups
+        if self.active_tab == 1:
+            # Ultimate Scream tab
+            return [g for g in self.groups if str(g.get('type', '')).lower() == 'halloween']
+        # Premium tab
+        return [g for g in self.groups if str(g.get('type', '')).lower() == 'premium']
+
+    def _group_progress(self, challenge_ids: List[str]) -> tuple[int, int]:
+        done = sum(1 for cid in challenge_ids if sbc_mod.is_completed(cid))
+        return done, len(challenge_ids)
+
+    def _next_incomplete_id(self, challenge_ids: List[str]) -> Optional[str]:
+        for cid in challenge_ids:
+            if not sbc_mod.is_completed(cid):
+                return cid
+        # all complete; return the last one
+        return challenge_ids[-1] if challenge_ids else None
+
+    # --- Global planner ---
+    def _plan_button_rect(self) -> pygame.Rect:
+        return pygame.Rect(self.app.size[0] - 40 - 200, 88, 200, 36)
+
+    def _plan_rects(self) -> dict:
+        w, h = self.app.size
+        panel = pygame.Rect(0, 0, min(760, w - 80), min(520, h - 120))
+        panel.center = (w // 2, h // 2)
+        by = panel.bottom - 56
+        return {
+            'panel': panel,
+            'apply': pygame.Rect(panel.x + 20, by, 200, 40),
+            'objective': pygame.Rect(panel.centerx - 110, by, 220, 40),
+            'cancel': pygame.Rect(panel.right - 180, by, 160, 40),
+        }
+
+    def _compute_plan(self):
+        series = sbc_planner.series_from_groups([g['challenge_ids'] for g in self.groups])
+        self.plan = sbc_planner.plan(self.plan_objective, series=series)
+
+    def _apply_plan(self):
+        res = sbc_planner.apply(self.plan)
+        self.plan = None
+        if res.error:
+            self.message = res.error
+            return
+        self.message = f"{len(res.completed)} défi(s) validé(s) · {len(res.rewards)} carte(s) reçue(s)"
+        if res.specials:
+            self.message += ' · ' + ', '.join(c.name.split('#')[0] for c in res.specials) + ' obtenu !'
+        for c in reversed(res.specials):
+            self.app.push('SpecialRewardScreen', c)
+
+    def _handle_plan(self, event: pygame.event.Event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.plan = None
+            return
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
+            self._apply_plan()
+            return
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            rects = self._plan_rects()
+            if rects['apply'].collidepoint(event.pos):
+                self._apply_plan()
+            elif rects['objective'].collidepoint(event.pos):
+                self.plan_objective = 'value' if self.plan_objective == 'count' else 'count'
+                self._compute_plan()
+            elif rects['cancel'].collidepoint(event.pos) or not rects['panel'].collidepoint(event.pos):
+                self.plan = None
+
+    def _draw_plan(self, screen: pygame.Surface):
+        w, h = self.app.size
+        shade = pygame.Surface((w, h), pygame.SRCALPHA)
+        shade.fill((0, 0, 0, 170))
+        screen.blit(shade, (0, 0))
+        rects = self._plan_rects()
+        panel = rects['panel']
+        pygame.draw.rect(screen, (24, 26, 34), panel, border_radius=14)
+        pygame.draw.rect(screen, (90, 90, 110), panel, 2, border_radius=14)
+        p = self.plan
+        title = self.app.h3.render('Plan SBC global', True, (235, 235, 245))
+        screen.blit(title, (panel.x + 20, panel.y + 16))
+        summary = f"{p.completed} défi(s) · {p.cards_used} doublon(s) utilisé(s) · valeur {p.value}"
+        if p.bundles:
+            summary += f" · {p.bundles} joueur(s) SBC"
+        sub = self.app.h5.render(summary, True, (190, 190, 205))
+        screen.blit(sub, (panel.x + 20, panel.y + 56))
+        by_id = content.registry().challenge_by_id
+        y = panel.y + 88
+        bottom = rects['apply'].y - 12
+        if not p.assignments:
+            none = self.app.h4.render('Aucun défi réalisable avec tes doublons.', True, (220, 200, 200))
+            screen.blit(none, (panel.x + 20, y))
+        for i, (cid, names) in enumerate(p.assignments):
+            if y + 44 > bottom:
+                more = self.app.h5.render(f"… et {len(p.assignments) - i} autre(s)", True, (170, 170, 185))
+                screen.blit(more, (panel.x + 20, y))
+                break
+            ch = by_id.get(cid)
+            head = self.app.h4.render(ch.name if ch else cid, True, (235, 235, 245))
+            screen.blit(head, (panel.x + 20, y))
+            counts: dict = {}
+            for n in names:
+                counts[n] = counts.get(n, 0) + 1
+            parts = [f"{n.split('#')[0]} x{c}" if c > 1 else n.split('#')[0] for n, c in counts.items()]
+            line = ', '.join(parts)
+            body = self.app.h5.render(line, True, (170, 170, 185))
+            if body.get_width() > panel.w - 40:
+                body = body.subsurface((0, 0, panel.w - 40, body.get_height()))
+            screen.blit(body, (panel.x + 20, y + 22))
+            y += 46
+        mx, my = pygame.mouse.get_pos()
+        obj = 'Objectif : défis' if self.plan_objective == 'count' else 'Objectif : valeur'
+        for key, label in (('apply', 'Appliquer'), ('objective', obj), ('cancel', 'Annuler')):
+            btn = Button(rects[key], label)
+            btn.draw(screen, self.app.h4, hovered=rects[key].collidepoint((mx, my)))
+        ms = self.app.h5.render(f"{p.elapsed_ms:.0f} ms", True, (120, 120, 135))
+        screen.blit(ms, (panel.right - ms.get_width() - 16, panel.y + 20))
+
+    def handle(self, event: pygame.event.Event):
+        if self.plan is not None:
+            self._handle_plan(event)
+            return
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.app.pop()
+            return
+        if event.type == pygame.MOUSEWHEEL:
+            # horizontal scroll with wheel
+            self.tile_scroll_x = max(0, self.tile_scroll_x - event.y * 60)
+            return
+        if event.type == pygame.KEYDOWN and event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+            # Dynamic step = one tile width + gap based on current window height
+            win_w, win_h = self.app.size
+            area_h = win_h - 220
+            tile_h = max(220, area_h - 24)
+            tile_w = int(tile_h * 0.78)
+            gap = 20
+            step = tile_w + gap
+            dx = -step if event.key == pygame.K_LEFT else step
+            self.tile_scroll_x = max(0, self.tile_scroll_x + dx)
+            return
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            mx, my = event.pos
+            # tabs (placeholder)
+            tx = 40
+            ty = 88
+            for i, t in enumerate(self.tabs):
+                r = pygame.Rect(tx + i * (120 + 8), ty, 120, 36)
+                if r.collidepoint((mx, my)):
+                    self.active_tab = i
+                    return
+            if self._plan_button_rect().collidepoint((mx, my)):
+                self.message = ''
+                self._compute_plan()
+                return
+            # tiles area
+            area = pygame.Rect(40, 140, self.app.size[0] - 80, self.app.size[1] - 220)
+            # Make tile height fill the vertical area with a 12px padding top/bottom
+            tile_h = max(220, area.h - 24)
+            tile_w = int(tile_h * 0.78)
+            gap = 20
+            start_x = area.x + 4 - self.tile_scroll_x
+            y = area.y
+            # arrows (if overflow) handled below
+            vis_groups = self._visible_groups()
+            content_w = max(0, len(vis_groups) * (tile_w + gap) - gap)
+            overflow = content_w > area.w
+            left_arrow = right_arrow = None
+            if overflow:
+                left_arrow = pygame.Rect(area.x + 6, area.centery - 24, 32, 48)
+                right_arrow = pygame.Rect(area.right - 38, area.centery - 24, 32, 48)
+                if left_arrow.collidepoint((mx, my)):
+                    self.tile_scroll_x = max(0, self.tile_scroll_x - (tile_w + gap))
+                    return
+                if right_arrow.collidepoint((mx, my)):
+                    self.tile_scroll_x = max(0, self.tile_scroll_x + (tile_w + gap))
+                    return
+            for idx, g in enumerate(vis_groups):
+                r = pygame.Rect(start_x + idx * (tile_w + gap), y, tile_w, tile_h)
+                # Only allow clicks inside the panel area
+                if area.collidepoint((mx, my)) and r.collidepoint((mx, my)):
+                    # open group detail if multiple steps, else go straight to the single challenge
+                    if len(g['challenge_ids']) > 1:
+                        try:
+                            self.app.push('SBCGroupDetail', g['title'], g['challenge_ids'])
+                        except Exception:
+                            pass
+                    else:
+                        next_id = self._next_incomplete_id(g['challenge_ids'])
+                        if next_id is not None:
+                            try:
+                                self.app.push('SBCSquad', next_id)
+                            except Exception:
+                                pass
+                    return
+
+    def _filtered_owned_names(self) -> List[str]:
+        # Not used in hub view anymore; keep as safe stub
+        return []
+
+    def _toggle_select(self, name: str):
+        # Not used in hub view
+        return
+
+    def _submit(self):
+        # Not used in hub view
+        return
+
+    def draw(self, screen: pygame.Surface):
+        w, h = self.app.size
+        screen.fill((12, 14, 18))
+        # title
+        title = self.app.h2.render('SBC', True, (235, 235, 245))
+        screen.blit(title, (40, 32))
+        # tabs (placeholder)
+        tx = 40
+        ty = 88
+        for i, t in enumerate(self.tabs):
+            r = pygame.Rect(tx + i * (120 + 8), ty, 120, 36)
+            sel = i == self.active_tab
+            pygame.draw.rect(screen, (38, 40, 50) if not sel else (58, 60, 90), r, border_radius=10)
+            pygame.draw.rect(screen, (90, 90, 110), r, 2, border_radius=10)
+            lbl = self.app.h4.render(t, True, (235, 235, 245))
+            screen.blit(lbl, (r.centerx - lbl.get_width() // 2, r.centery - lbl.get_height() // 2))
+
+    # tiles area
+        area = pygame.Rect(40, 140, w - 80, h - 220)
+        pygame.draw.rect(screen, (18, 20, 26), area, border_radius=12)
+        pygame.draw.rect(screen, (60, 62, 78), area, 2, border_radius=12)
+        # Dynamic tile size: fill vertical space with margins
+        tile_h = max(220, area.h - 24)
+        tile_w = int(tile_h * 0.78)
+        gap = 20
+        start_x = area.x + 4 - self.tile_scroll_x
+        y = area.y + 12
+        mx, my = pygame.mouse.get_pos()
+        self.hover_tile = -1
+        # overflow arrows
+        vis_groups = self._visible_groups()
+        content_w = max(0, len(vis_groups) * (tile_w + gap) - gap)
+        overflow = content_w > area.w
+        if overflow:
+            # left arrow
+            la = pygame.Rect(area.x + 6, area.centery - 24, 32, 48)
+            ra = pygame.Rect(area.right - 38, area.centery - 24, 32, 48)
+            pygame.draw.rect(screen, (28, 30, 38), la, border_radius=8)
+            pygame.draw.rect(screen, (28, 30, 38), ra, border_radius=8)
+            pygame.draw.polygon(screen, (200, 200, 210), [(la.right - 8, la.y + 8), (la.x + 10, la.centery), (la.right - 8, la.bottom - 8)])
+            pygame.draw.polygon(screen, (200, 200, 210), [(ra.x + 8, ra.y + 8), (ra.right - 10, ra.centery), (ra.x + 8, ra.bottom - 8)])
+        # Clip drawing to the panel so tiles never paint outside the frame
+        prev_clip = screen.get_clip()
+        screen.set_clip(area.inflate(-2, -2))
+        for idx, g in enumerate(vis_groups):
+            r = pygame.Rect(start_x + idx * (tile_w + gap), y, tile_w, tile_h)
+            if r.right < area.x or r.x > area.right:
+                continue
+            hovered = (area.collidepoint((mx, my)) and r.collidepoint((mx, my)))
+            if hovered:
+                self.hover_tile = idx
+            # card background (use group bg on the frame itself)
+            tile_bg = g.get('bg') or (30, 32, 42)
+            if hovered:
+                tile_bg = tuple(min(255, c + 12) for c in tile_bg)
+            pygame.draw.rect(screen, tile_bg, r, border_radius=14)
+            # background image inside the card (cover) with rounded-corner mask so it never escapes the frame
+            bg_img = g.get('bg_img')
+            if bg_img:
+                try:
+                    use_p = assets.resolve(bg_img)
+                    if use_p is not None:
+                        inner = r.inflate(-8, -8)
+                        # render onto a temporary surface
+                        panel = pygame.Surface((inner.w, inner.h), pygame.SRCALPHA)
+                        draw_bg_cover(panel, use_p, panel.get_rect())
+                        # rounded mask
+                        mask = pygame.Surface((inner.w, inner.h), pygame.SRCALPHA)
+                        pygame.draw.rect(mask, (255, 255, 255, 255), mask.get_rect(), border_radius=12)
+                        panel.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+                        screen.blit(panel, inner.topleft)
+                except Exception:
+                    pass
+            pygame.draw.rect(screen, (90, 90, 110), r, 2, border_radius=14)
+            # corner ribbon like FIFA
+            rib = pygame.Rect(r.right - 36, r.y + 8, 28, 28)
+            pygame.draw.polygon(screen, (80, 180, 220), [(rib.x, rib.y), (rib.right, rib.y), (rib.right, rib.bottom)])
+            # title
+            ttl = self.app.h4.render(g['title'], True, (235, 235, 245))
+            screen.blit(ttl, (r.x + 12, r.y + 12))
+            # emblem area (image) - scaled with tile size
+            shield_h = max(120, int(r.h * 0.44))
+            shield_w = int(shield_h * 0.8)
+            shield_y = r.y + max(70, int(r.h * 0.2))
+            # ensure bottom spacing stays within the card
+            if shield_y + shield_h > r.bottom - 96:
+                shield_y = r.bottom - 96 - shield_h
+            shield = pygame.Rect(r.centerx - shield_w // 2, shield_y, shield_w, shield_h)
+            # neutral shield background and frame (image sits on top)
+            pygame.draw.rect(screen, (60, 64, 80), shield, border_radius=16)
+            pygame.draw.rect(screen, (120, 124, 140), shield, 2, border_radius=16)
+            # try to draw group image if available
+            gkey = g.get('image_key')
+            if gkey:
+                p = resolve_player_image_by_name_and_rarity(gkey, None)
+                if p is not None:
+                    # draw centered inside shield with small padding
+                    draw_player_png_centered(screen, p, (shield.centerx, shield.centery), shield.w - 12, shield.h - 12)
+            # stars (progress style)
+            done, total = self._group_progress(g['challenge_ids'])
+            for s in range(3):
+                cx = r.centerx - 34 + s * 34
+                cy = min(r.bottom - 60, shield.bottom + max(18, int(r.h * 0.05)))
+                col = (200, 200, 210) if s < min(3, done) else (100, 100, 120)
+                pygame.draw.circle(screen, col, (cx, cy), 9)
+            # remaining days
+            rem = self.app.h5.render(f"{g['days']} Days Remaining", True, (180, 180, 190))
+            rem_y = min(r.bottom - 42, cy + max(12, int(r.h * 0.05)))
+            screen.blit(rem, (r.centerx - rem.get_width() // 2, rem_y))
+            # completed text
+            comp = self.app.h5.render(f"{done}/{total} COMPLETED", True, (210, 210, 220))
+            screen.blit(comp, (r.centerx - comp.get_width() // 2, r.bottom - 34))
+        # restore clipping
+        screen.set_clip(prev_clip)
+
+        # hint
+        hint_txt = 'Molette ou ← → pour défiler · Clique une tuile pour ouvrir'
+        hint = self.app.h5.render(hint_txt, True, (160, 160, 170))
+        screen.blit(hint, (area.x + 12, area.bottom + 8))
+        if self.message:
+            msg = self.app.h5.render(self.message, True, (220, 220, 160))
+            screen.blit(msg, (area.x + 12, area.bottom + 30))
+        esc = self.app.h5.render('[Esc] Retour', True, (150, 150, 160))
+        screen.blit(esc, (w - esc.get_width() - 32, 32))
+        pr = self._plan_button_rect()
+        Button(pr, 'Planifier mes doublons').draw(screen, self.app.h5, hovered=pr.collidepoint((mx, my)))
+        if self.plan is not None:
+            self._draw_plan(screen)
+
+
+class SBCGroupDetail(Screen):
+    """Detail view for a group of SBCs (multi-step). Shows step tiles and a requirements panel."""
+    def __init__(self, app: 'App', title: str, challenge_ids: List[str]):
+        super().__init__(app)
+        self.title = title
+        self.challenge_ids = challenge_ids
+        # default select next incomplete
+        self.selected_id = None
+        for cid in self.challenge_ids:
+            if not sbc_mod.is_completed(cid):
+                self.selected_id = cid
+                break
+        if self.selected_id is None and self.challenge_ids:
+            self.selected_id = self.challenge_ids[-1]
+
+    def _selected_challenge(self):
+        if not self.selected_id:
+            return None
+        return sbc_mod.get_challenge(self.selected_id)
+
+    def handle(self, event: pygame.event.Event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.app.pop()
+            return
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
+            ch = self._selected_challenge()
+            if ch is not None:
+                self.app.push('SBCSquad', ch.id)
+            return
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            mx, my = event.pos
+            # step tiles area (left)
+            w, h = self.app.size
+            area = pygame.Rect(40, 140, w - 80 - 360, h - 220)
+            # 2 rows per column layout
+            padding, gap = 12, 12
+            rows = 2
+            n = len(self.challenge_ids)
+            inner = pygame.Rect(40 + padding, 140 + padding, (w - 80 - 360) - 2 * padding, (h - 220) - 2 * padding)
+            if n == 2:
+                # Place both steps on the TOP ROW: left and right columns, using 2x2 grid sizes.
+                cols = 2
+                col_w = (inner.w - (cols - 1) * gap) // cols
+                row0_h = (inner.h - gap) // 2
+                x_left = inner.x
+                x_right = inner.x + col_w + gap
+                y_top = inner.y
+                for i, cid in enumerate(self.challenge_ids):
+                    if i == 0:
+                        r = pygame.Rect(x_left, y_top, col_w, row0_h)
+                    else:
+                        r = pygame.Rect(x_right, y_top, col_w, row0_h)
+                    if r.collidepoint((mx, my)):
+                        self.selected_id = cid
+                        return
+            else:
+                # Fill entire panel: distribute width and height across cols x rows
+                cols = max(2, (n + rows - 1) // rows)
+                step_w = (inner.w - (cols - 1) * gap) / max(1, cols)
+                step_h = (inner.h - (rows - 1) * gap) / max(1, rows)
+                for i, cid in enumerate(self.challenge_ids):
+                    col = i % cols
+                    row = i // cols
+                    x = int(round(inner.x + col * (step_w + gap)))
+                    y = int(round(inner.y + row * (step_h + gap)))
+                    # last col/row absorb leftover pixels
+                    w_rect = inner.right - x if col == cols - 1 else int(round(step_w))
+                    h_rect = inner.bottom - y if row == rows - 1 else int(round(step_h))
+                    r = pygame.Rect(x, y, w_rect, h_rect)
+                    if r.collidepoint((mx, my)):
+                        self.selected_id = cid
+                        return
+            # start button in right panel
+            right = pygame.Rect(area.right + 24, area.y, 336, area.h)
+            start_rect = pygame.Rect(right.x + 20, right.bottom - 64, right.w - 40, 44)
+            if start_rect.collidepoint((mx, my)):
+                ch = self._selected_challenge()
+                if ch is not None:
+                    self.app.push('SBCSquad', ch.id)
+
+    def draw(self, screen: pygame.Surface):
+        w, h = self.app.size
+        screen.fill((10, 12, 16))
+        # header / breadcrumb-like
+        hdr = self.app.h2.render(self.title, True, (235, 235, 245))
+        screen.blit(hdr, (40, 32))
+        # areas
+        area = pygame.Rect(40, 140, w - 80 - 360, h - 220)
+        right = pygame.Rect(area.right + 24, area.y, 336, area.h)
+        pygame.draw.rect(screen, (18, 20, 26), area, border_radius=12)
+        pygame.draw.rect(screen, (60, 62, 78), area, 2, border_radius=12)
+        pygame.draw.rect(screen, (18, 20, 26), right, border_radius=12)
+        pygame.draw.rect(screen, (60, 62, 78), right, 2, border_radius=12)
+
+        # step tiles in a grid: fill panel except when exactly 2 challenges (don't stretch)
+        padding, gap = 12, 12
+        rows = 2
+        n = len(self.challenge_ids)
+        inner = pygame.Rect(area.x + padding, area.y + padding, area.w - 2 * padding, area.h - 2 * padding)
+        mx, my = pygame.mouse.get_pos()
+        if n == 2:
+            # Draw both steps on the top row, left and right columns, with 2x2 grid sizing
+            cols = 2
+            col_w = (inner.w - (cols - 1) * gap) // cols
+            row0_h = (inner.h - gap) // 2
+            x_left = inner.x
+            x_right = inner.x + col_w + gap
+            y_top = inner.y
+            for i, cid in enumerate(self.challenge_ids):
+                ch = sbc_mod.get_challenge(cid)
+                if i == 0:
+                    r = pygame.Rect(x_left, y_top, col_w, row0_h)
+                else:
+                    r = pygame.Rect(x_right, y_top, col_w, row0_h)
+                completed = sbc_mod.is_completed(cid)
+                selected = (cid == self.selected_id)
+                hovered = r.collidepoint((mx, my))
+                bg = (32, 34, 44)
+                if selected:
+                    bg = (190, 220, 60)
+                elif hovered:
+                    bg = (40, 42, 54)
+                pygame.draw.rect(screen, bg, r, border_radius=12)
+                pygame.draw.rect(screen, (90, 92, 110), r, 2, border_radius=12)
+                ttl = self.app.h4.render(ch.name, True, (20, 22, 26) if selected else (235, 235, 245))
+                screen.blit(ttl, (r.x + 16, r.y + 12))
+                dsc = self.app.h5.render(ch.description, True, (30, 32, 36) if selected else (200, 200, 210))
+                screen.blit(dsc, (r.x + 16, r.y + 46))
+                emblem = pygame.Rect(r.right - 110, r.y + 40, 76, 76)
+                pygame.draw.rect(screen, (70, 72, 90), emblem, border_radius=14)
+                pygame.draw.rect(screen, (120, 124, 140), emblem, 2, border_radius=14)
+                if completed:
+                    badge = self.app.h5.render('COMPLETED', True, (20, 22, 26) if selected else (180, 240, 120))
+                    screen.blit(badge, (r.x + 16, r.bottom - 28))
+        else:
+            cols = max(2, (n + rows - 1) // rows)
+            step_w = (inner.w - (cols - 1) * gap) / max(1, cols)
+            step_h = (inner.h - (rows - 1) * gap) / max(1, rows)
+            for i, cid in enumerate(self.challenge_ids):
+                ch = sbc_mod.get_challenge(cid)
+                col = i % cols
+                row = i // cols
+                x = int(round(inner.x + col * (step_w + gap)))
+                y = int(round(inner.y + row * (step_h + gap)))
+                w_rect = inner.right - x if col == cols - 1 else int(round(step_w))
+                h_rect = inner.bottom - y if row == rows - 1 else int(round(step_h))
+                r = pygame.Rect(x, y, w_rect, h_rect)
+                completed = sbc_mod.is_completed(cid)
+                selected = (cid == self.selected_id)
+                hovered = r.collidepoint((mx, my))
+                bg = (32, 34, 44)
+                if selected:
+                    bg = (190, 220, 60)
+                elif hovered:
+                    bg = (40, 42, 54)
+                pygame.draw.rect(screen, bg, r, border_radius=12)
+                pygame.draw.rect(screen, (90, 92, 110), r, 2, border_radius=12)
+                ttl = self.app.h4.render(ch.name, True, (20, 22, 26) if selected else (235, 235, 245))
+                screen.blit(ttl, (r.x + 16, r.y + 12))
+                dsc = self.app.h5.render(ch.description, True, (30, 32, 36) if selected else (200, 200, 210))
+                screen.blit(dsc, (r.x + 16, r.y + 46))
+                emblem = pygame.Rect(r.right - 110, r.y + 40, 76, 76)
+                pygame.draw.rect(screen, (70, 72, 90), emblem, border_radius=14)
+                pygame.draw.rect(screen, (120, 124, 140), emblem, 2, border_radius=14)
+                if completed:
+                    badge = self.app.h5.render('COMPLETED', True, (20, 22, 26) if selected else (180, 240, 120))
+                    screen.blit(badge, (r.x + 16, r.bottom - 28))
+
+        # right panel: requirements
+        ch = self._selected_challenge()
+        if ch is not None:
+            hdr2 = self.app.h4.render(ch.name, True, (235, 235, 245))
+            screen.blit(hdr2, (right.x + 16, right.y + 16))
+            sub = self.app.h5.render('REQUIREMENTS', True, (180, 180, 190))
+            screen.blit(sub, (right.x + 16, right.y + 54))
+            y0 = right.y + 80
+            # bullets from our requirement model
+            bullets = [
+                f"Joueurs requis: {sbc_mod.squad_size(ch)}",
+            ]
+            if ch.requirement.min_avg_rating:
+                bullets.append(f"Note moyenne min: {ch.requirement.min_avg_rating}")
+            if ch.requirement.allowed_rarities:
+                bullets.append("Raretés: " + ', '.join(ch.requirement.allowed_rarities))
+            for b in bullets:
+                dot = self.app.h4.render('•', True, (210, 210, 220))
+                txt = self.app.h5.render(b, True, (210, 210, 220))
+                screen.blit(dot, (right.x + 18, y0))
+                screen.blit(txt, (right.x + 36, y0 + 4))
+                y0 += 28
+            # view rewards label
+            vr = self.app.h5.render('VIEW REWARDS', True, (180, 180, 190))
+            screen.blit(vr, (right.x + 16, right.bottom - 108))
+            # start button
+            start_rect = pygame.Rect(right.x + 20, right.bottom - 64, right.w - 40, 44)
+            pygame.draw.rect(screen, (40, 140, 240), start_rect, border_radius=10)
+            lbl = self.app.h4.render('Commencer', True, (255, 255, 255))
+            screen.blit(lbl, (start_rect.centerx - lbl.get_width() // 2, start_rect.centery - lbl.get_height() // 2))
+        # back hint
+        hint = self.app.h5.render('[Esc] Retour', True, (150, 150, 160))
+        screen.blit(hint, (w - hint.get_width() - 32, 32))
+
+
+class SBCSquad(Screen):
+    """Dedicated squad page for a specific SBC challenge. Only duplicates are usable."""
+    def __init__(self, app: 'App', challenge_id: str):
+        super().__init__(app)
+        self.challenge_id = challenge_id
+        # fixed 11 slots (4-3-3) — None when empty, otherwise player name
+        self.slots = [None] * 11
+        self.message = ''
+        self.reward_cards = None
+        self.search = ''
+        self._search_active = False
+        # duplicates pool grid (~150-160px cards with a label row under each)
+        self.pool_grid = VirtualGrid(160, 12, 1.35, label_h=16, inset=12, on_prefetch=self._queue_prefetch)
+        self._prefetch: List[int] = []
+        self._pool: List[str] = []
+        self._pool_key = None
+        self.FILTERS = ['Tous', 'or non rare', 'or rare', 'hero', 'icon', 'otw']
+        self.filter_idx = 0
+        # background pitch image for the squad placement area
+        try:
+            self._pitch_img_path = assets.path('Fond/terrain de foot vertical.png')
+        except Exception:
+            self._pitch_img_path = None
+        # drag & drop state
+        self._drag_name = None
+        self._drag_pos = (0, 0)
+        self._drag_from = None  # 'pool' or 'slot'
+
+    def _ch(self):
+        return sbc_mod.get_challenge(self.challenge_id)
+
+    def _owned(self):
+        return self.app.owned.get()
+
+    def _catalog(self):
+        return card_ids.catalog_index()
+
+    def handle(self, event: pygame.event.Event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.app.pop()
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            mx, my = event.pos
+            # rarity filter tabs
+            fbase = pygame.Rect(40, 108, 560, 32)
+            for i, f in enumerate(self.FILTERS):
+                r = pygame.Rect(fbase.x + i * (100 + 8), fbase.y, 100, fbase.h)
+                if r.collidepoint((mx, my)):
+                    self.filter_idx = i
+                    self.pool_grid.reset()
+                    return
+            # search
+            srect = pygame.Rect(self.app.size[0] - 420, 108, 220, 28)
+            self._search_active = srect.collidepoint((mx, my))
+            # buttons
+            submit_rect = pygame.Rect(self.app.size[0] - 220, self.app.size[1] - 80, 160, 42)
+            clear_rect = pygame.Rect(self.app.size[0] - 400, self.app.size[1] - 80, 160, 42)
+            if submit_rect.collidepoint((mx, my)):
+                self._submit()
+                return
+            if clear_rect.collidepoint((mx, my)):
+                self.slots = [None] * 11
+                self.message = ''
+                self.reward_cards = None
+                return
+            # right slots (formation) : click to remove
+            w, h = self.app.size
+            right = pygame.Rect(w // 2 + 20, 156, w - (w // 2 + 20) - 40, h - 240)
+            # fixed 4-3-3 with exactly 11 slots
+            target_n = 11
+            for i, r in enumerate(self._formation_433_positions(right, target_n)):
+                if r.collidepoint((mx, my)) and self.slots[i] is not None:
+                    # simple remove on click (drag from slot not implemented yet)
+                    self.slots[i] = None
+                    return
+            # start drag from pool card
+            left = pygame.Rect(40, 156, w // 2 - 60, h - 240)
+            pool = self._filtered_owned_names()
+            self.pool_grid.layout(left, len(pool))
+            idx = self.pool_grid.index_at((mx, my))
+            if idx is not None:
+                self._drag_name = pool[idx]
+                self._drag_from = 'pool'
+                self._drag_pos = (mx, my)
+                return
+        elif event.type == pygame.MOUSEMOTION:
+            self._drag_pos = event.pos
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            if self._drag_name:
+                mx, my = event.pos
+                w, h = self.app.size
+                right = pygame.Rect(w // 2 + 20, 156, w - (w // 2 + 20) - 40, h - 240)
+                slots = self._formation_433_positions(right, 11)
+                for i, r in enumerate(slots):
+                    if r.collidepoint((mx, my)):
+                        name = self._drag_name
+                        owned_cnt = self._owned().get(name, 0)
+                        cur = sum(1 for x in self.slots if x == name)
+                        if self.slots[i] is None and cur < max(0, owned_cnt - 1):
+                            self.slots[i] = name
+                        else:
+                            self.message = "Emplacement indisponible ou pas assez de doublons"
+                        break
+                self._drag_name = None
+                self._drag_from = None
+        elif event.type == pygame.KEYDOWN and self._search_active:
+            if event.key == pygame.K_BACKSPACE:
+                self.search = self.search[:-1]
+            elif event.key == pygame.K_RETURN:
+                self._search_active = False
+            else:
+                ch = event.unicode
+                if ch and ch.isprintable():
+                    self.search += ch
+        elif event.type == pygame.MOUSEWHEEL:
+            w, h = self.app.size
+            left = pygame.Rect(40, 156, w // 2 - 60, h - 240)
+            if left.collidepoint(pygame.mouse.get_pos()):
+                self.pool_grid.wheel(event.y)
+
+    def update(self, dt: float):
+        self.pool_grid.update(dt)
+        # warm upcoming pool card faces a few per frame
+        g = self.pool_grid
+        for _ in range(3):
+            if not self._prefetch:
+                break
+            idx = self._prefetch.pop(0)
+            if idx < len(self._pool):
+                self._pool_face(self._pool[idx], (g.cell_w, g.cell_h), False)
+
+    def _queue_prefetch(self, indices: range):
+        self._prefetch = list(indices)
+
+    def _filtered_owned_names(self) -> List[str]:
+        owned = self._owned()
+        key = (self.filter_idx, self.search, state_bus.version(state_bus.COLLECTION))
+        if key == self._pool_key:
+            return self._pool
+        self._pool_key = key
+        # duplicates only: count >= 2
+        cids = []
+        for n, c in owned.items():
+            if c >= 2:
+                cid = card_ids.card_id(n)
+                if cid is not None:
+                    cids.append(cid)
+        rid = card_ids.rarity_id(self.FILTERS[self.filter_idx]) if self.filter_idx != 0 else None
+        cids = card_ids.filter_ids(cids, rarity=rid, needle=self.search)
+        cids.sort(key=lambda i: (-card_ids.rating_of(i), card_ids.name_of(i)))
+        self._pool = [card_ids.name_of(i) for i in cids]
+        return self._pool
+
+    def _toggle_select(self, name: str):
+        # Add to first empty slot if allowed; otherwise remove one occurrence
+        owned_cnt = self._owned().get(name, 0)
+        cur = sum(1 for x in self.slots if x == name)
+        max_allowed = max(0, owned_cnt - 1)
+        if cur < max_allowed and any(s is None for s in self.slots):
+            for i in range(len(self.slots)):
+                if self.slots[i] is None:
+                    self.slots[i] = name
+                    return
+        else:
+            for i, x in enumerate(self.slots):
+                if x == name:
+                    self.slots[i] = None
+                    return
+
+    def _submit(self):
+        ch_obj = self._ch()
+        # must be exactly 11 players selected (no None)
+        if any(s is None for s in self.slots):
+            cur = sum(1 for s in self.slots if s is not None)
+            self.message = f"Sélection incomplète (" + str(cur) + "/11)."
+            return
+        # quick duplicates guard: ensure we keep at least one of each selected name
+        owned = self._owned()
+        need: dict[str, int] = {}
+        sel_list = [s for s in self.slots if s is not None]
+        for n in sel_list:
+            need[n] = need.get(n, 0) + 1
+        for n, cnt in need.items():
+            if owned.get(n, 0) - cnt < 1:
+                self.message = f"Utilise uniquement tes doublons (pas assez de {n})."
+                return
+        ok, msg = sbc_mod.validate_selection(sel_list, ch_obj)
+        if not ok:
+            self.message = msg
+            return
+        # also check normal consume guard (owned >= need)
+        ok2, msg2 = sbc_mod.can_consume(sel_list)
+        if not ok2:
+            self.message = msg2
+            return
+        sbc_mod.consume(sel_list)
+        self.slots = [None] * 11
+        self.message = 'Défi validé ! Récompense en cours…'
+        pack_name, count = ch_obj.reward_pack
+        self.reward_cards = generate_pack(pack_name, count)
+        game_db.add_to_collection_by_names([c.name for c in self.reward_cards])
+        # log defi event: sbc completed
+        try:
+            defi_mod.add_progress('sbc_completed', 1)
+        except Exception:
+            pass
+        # mark completion and check special Busquets reward
+        try:
+            sbc_mod.mark_completed(ch_obj.id)
+            extras_to_show: List[Card] = []
+            extra = sbc_mod.check_and_grant_busquets_bundle()
+            if extra is not None:
+                self.message = "Défi validé ! Récompense en cours… + Busquets obtenu !"
+                self.reward_cards.append(extra)
+                extras_to_show.append(extra)
+            # check Alba as well
+            extra2 = sbc_mod.check_and_grant_alba_bundle()
+            if extra2 is not None:
+                self.message = "Défi validé ! Récompense en cours… + Alba obtenu !"
+                self.reward_cards.append(extra2)
+                extras_to_show.append(extra2)
+            # check Flashbacks: Goretzka & Džeko
+            extra3 = sbc_mod.check_and_grant_goretzka_bundle()
+            if extra3 is not None:
+                self.message = "Défi validé ! Récompense en cours… + Goretzka obtenu !"
+                self.reward_cards.append(extra3)
+                extras_to_show.append(extra3)
+            extra4 = sbc_mod.check_and_grant_dzeko_bundle()
+            if extra4 is not None:
+                self.message = "Défi validé ! Récompense en cours… + Džeko obtenu !"
+                self.reward_cards.append(extra4)
+                extras_to_show.append(extra4)
+            # check Flashback: Xherdan Shaqiri
+            extra_sh = sbc_mod.check_and_grant_shaqiri_bundle()
+            if extra_sh is not None:
+                self.message = "Défi validé ! Récompense en cours… + Shaqiri obtenu !"
+                self.reward_cards.append(extra_sh)
+                extras_to_show.append(extra_sh)
+            # check Hero: Van Buyten
+            extra5 = sbc_mod.check_and_grant_vanbuyten_bundle()
+            if extra5 is not None:
+                self.message = "Défi validé ! Récompense en cours… + Van Buyten obtenu !"
+                self.reward_cards.append(extra5)
+                extras_to_show.append(extra5)
+            # check Hero: Dimitri Payet
+            extra6 = sbc_mod.check_and_grant_payet_bundle()
+            if extra6 is not None:
+                self.message = "Défi validé ! Récompense en cours… + Payet obtenu !"
+                self.reward_cards.append(extra6)
+                extras_to_show.append(extra6)
+            # check Icon début: Zlatan Ibrahimović
+            extra7 = sbc_mod.check_and_grant_zlatan_bundle()
+            if extra7 is not None:
+                self.message = "Défi validé ! Récompense en cours… + Ibrahimović obtenu !"
+                self.reward_cards.append(extra7)
+                extras_to_show.append(extra7)
+            # check Halloween: Paul Pogba
+            extra8 = sbc_mod.check_and_grant_pogba_bundle()
+            if extra8 is not None:
+                self.message = "Défi validé ! Récompense en cours… + Pogba obtenu !"
+                self.reward_cards.append(extra8)
+                extras_to_show.append(extra8)
+            # push special reward screens (stacked)
+            for c in reversed(extras_to_show):
+                self.app.push('SpecialRewardScreen', c)
+        except Exception:
+            pass
+
+    def draw(self, screen: pygame.Surface):
+        w, h = self.app.size
+        screen.fill((14, 16, 20))
+        title = self.app.h2.render('SQUAD — Défi SBC', True, (230, 230, 240))
+        screen.blit(title, (40, 32))
+        # challenge name
+        ch_obj = self._ch()
+        cname = self.app.h4.render(ch_obj.name, True, (210, 210, 220))
+        screen.blit(cname, (40, 68))
+        # search box
+        srect = pygame.Rect(w - 420, 108, 220, 28)
+        pygame.draw.rect(screen, (38, 40, 50), srect, border_radius=8)
+        pygame.draw.rect(screen, (90, 90, 110), srect, 2, border_radius=8)
+        stxt = self.app.h5.render(self.search or 'Recherche…', True, (200, 200, 210) if self.search else (140, 140, 150))
+        screen.blit(stxt, (srect.x + 8, srect.y + 5))
+        # rarity filter tabs
+        fbase = pygame.Rect(40, 108, 560, 32)
+        for i, f in enumerate(self.FILTERS):
+            r = pygame.Rect(fbase.x + i * (100 + 8), fbase.y, 100, fbase.h)
+            sel = i == self.filter_idx
+            bg = (38, 40, 50) if not sel else (58, 60, 90)
+            pygame.draw.rect(screen, bg, r, border_radius=8)
+            pygame.draw.rect(screen, (90, 90, 110), r, 1, border_radius=8)
+            txt = self.app.h5.render(f, True, (235, 235, 245))
+            screen.blit(txt, (r.centerx - txt.get_width() // 2, r.centery - txt.get_height() // 2))
+
+        # left pool (duplicates only) — show card images (thumbnails) instead of name rows
+        left = pygame.Rect(40, 156, w // 2 - 60, h - 240)
+        pygame.draw.rect(screen, (25, 27, 33), left, border_radius=12)
+        pygame.draw.rect(screen, (70, 72, 90), left, 2, border_radius=12)
+        pool = self._filtered_owned_names()
+        # grid layout (cached by the grid until the area or pool size changes)
+        self.pool_grid.layout(left, len(pool))
+        mx, my = pygame.mouse.get_pos()
+        pressed = pygame.mouse.get_pressed()[0]
+        for idx, r in self.pool_grid.visible_cells():
+            name = pool[idx]
+            plus = pygame.Rect(r.right - 28, r.bottom - 28, 24, 24)
+            hovered = plus.collidepoint((mx, my))
+            screen.blit(self._pool_face(name, r.size, hovered), r.topleft)
+            if hovered and pressed:
+                self._toggle_select(name)
+
+        # right formation (4-3-3) with pitch background
+        right = pygame.Rect(w // 2 + 20, 156, w - (w // 2 + 20) - 40, h - 240)
+        # draw background image (cover) clipped to rounded rect; fallback to green pitch lines
+        if self._pitch_img_path is not None:
+            panel = pygame.Surface((right.w, right.h), pygame.SRCALPHA)
+            ok = draw_bg_cover(panel, self._pitch_img_path, panel.get_rect())
+            # rounded mask so it doesn't escape the area
+            mask = pygame.Surface((right.w, right.h), pygame.SRCALPHA)
+            pygame.draw.rect(mask, (255, 255, 255, 255), mask.get_rect(), border_radius=12)
+            panel.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+            screen.blit(panel, right.topleft)
+            if not ok:
+                # fallback if draw failed
+                pitch = pygame.Surface((right.w, right.h))
+                pitch.fill((24, 66, 40))
+                pygame.draw.rect(pitch, (220, 220, 220), pitch.get_rect(), 2, border_radius=12)
+                mid_y = right.h // 2
+                pygame.draw.line(pitch, (220, 220, 220), (10, mid_y), (right.w - 10, mid_y), 1)
+                screen.blit(pitch, right.topleft)
+        else:
+            pitch = pygame.Surface((right.w, right.h))
+            pitch.fill((24, 66, 40))
+            pygame.draw.rect(pitch, (220, 220, 220), pitch.get_rect(), 2, border_radius=12)
+            mid_y = right.h // 2
+            pygame.draw.line(pitch, (220, 220, 220), (10, mid_y), (right.w - 10, mid_y), 1)
+            screen.blit(pitch, right.topleft)
+
+        # render exactly 11 slots for 4-3-3
+        slots = self._formation_433_positions(right, 11)
+        for i, r in enumerate(slots):
+            pygame.draw.rect(screen, (32, 34, 42), r, border_radius=10)
+            pygame.draw.rect(screen, (70, 72, 90), r, 2, border_radius=10)
+            num = self.app.h5.render(str(i + 1), True, (160, 160, 170))
+            screen.blit(num, (r.x + 8, r.y + 6))
+            if self.slots[i] is not None:
+                name = self.slots[i]
+                item = self._catalog()[name]
+                face = card_faces.face(('sbc_slot', name, item.get('rarity', '')), r.size, lambda s: self._render_slot_card(s, name, item))
+                screen.blit(face, r.topleft)
+            else:
+                hint = self.app.h5.render('Ajouter', True, (120, 120, 130))
+                screen.blit(hint, (r.centerx - hint.get_width() // 2, r.centery - hint.get_height() // 2))
+
+        # highlight slot under cursor while dragging
+        if self._drag_name:
+            mx, my = pygame.mouse.get_pos()
+            for r in slots:
+                if r.collidepoint((mx, my)):
+                    pygame.draw.rect(screen, (90, 200, 110), r, 3, border_radius=10)
+                    break
+
+        # bottom controls and info
+        submit_rect = pygame.Rect(w - 220, h - 80, 160, 42)
+        clear_rect = pygame.Rect(w - 400, h - 80, 160, 42)
+        pygame.draw.rect(screen, (40, 140, 240), submit_rect, border_radius=10)
+        pygame.draw.rect(screen, (120, 120, 140), clear_rect, border_radius=10)
+        screen.blit(self.app.h4.render('Valider', True, (255, 255, 255)), (submit_rect.x + 24, submit_rect.y + 8))
+        screen.blit(self.app.h4.render('Effacer', True, (255, 255, 255)), (clear_rect.x + 24, clear_rect.y + 8))
+
+        pack_name, count = self._ch().reward_pack
+        preview = self.app.h4.render(f"Récompense: {pack_name} x{count}", True, (210, 210, 220))
+        screen.blit(preview, (40, h - 118))
+        if self.message:
+            m = self.app.h4.render(self.message, True, (220, 220, 230))
+            screen.blit(m, (40, h - 78))
+        if self.reward_cards:
+            strip = pygame.Rect(40, h - 220, w - 320, 120)
+            pygame.draw.rect(screen, (20, 22, 28), strip, border_radius=10)
+            x = strip.x + 10
+            for c in self.reward_cards:
+                img = resolve_player_image_by_name_and_rarity(c.name, c.rarity)
+                if img is not None:
+                    draw_player_png_centered(screen, img, (x + 50, strip.centery), 100, 110)
+                x += 110
+        hint = self.app.h5.render('[Esc] Retour', True, (150, 150, 160))
+        screen.blit(hint, (w - hint.get_width() - 32, 32))
+        # draw floating dragged card
+        if self._drag_name:
+            name = self._drag_name
+            item = self._catalog().get(name)
+            if item:
+                mx, my = self._drag_pos
+                fw, fh = 140, int(140 * 1.35)
+                face = card_faces.face(('sbc_drag', name, item.get('rarity', '')), (fw, fh), lambda s: self._render_drag_card(s, name, item))
+                screen.blit(face, (mx - fw // 2, my - fh // 2))
+
+    def _pool_face(self, name: str, size: Tuple[int, int], hovered: bool) -> pygame.Surface:
+        item = self._catalog()[name]
+        owned_cnt = max(0, self._owned().get(name, 0) - 1)
+        key = ('sbc_pool', name, item.get('rarity', ''), owned_cnt, hovered)
+        return card_faces.face(key, size, lambda s: self._render_pool_card(s, name, item, owned_cnt, hovered))
+
+    def _render_pool_card(self, face: pygame.Surface, name: str, item: dict, owned_cnt: int, hovered: bool):
+        r = face.get_rect()
+        color = RARITY_COLORS.get(item.get('rarity', ''), (120, 120, 130))
+        # card background and border
+        pygame.draw.rect(face, (30, 32, 40), r, border_radius=12)
+        pygame.draw.rect(face, color, r, 2, border_radius=12)
+        # image inside with small padding
+        img = resolve_player_image_by_name_and_rarity(name, item.get('rarity', ''))
+        pad = 6
+        inner = pygame.Rect(r.x + pad, r.y + pad, r.w - 2 * pad, r.h - 2 * pad)
+        if img is not None:
+            draw_player_png_centered(face, img, inner.center, inner.w, inner.h)
+        else:
+            pygame.draw.rect(face, (45, 47, 58), inner, border_radius=10)
+        # duplicates badge (owned-1)
+        badge = pygame.Rect(r.right - 38, r.y + 8, 30, 20)
+        pygame.draw.rect(face, (28, 30, 38), badge, border_radius=6)
+        pygame.draw.rect(face, (90, 92, 110), badge, 1, border_radius=6)
+        btxt = self.app.h5.render(f"x{owned_cnt}", True, (235, 235, 245))
+        face.blit(btxt, (badge.centerx - btxt.get_width() // 2, badge.centery - btxt.get_height() // 2))
+        # plus button overlay
+        plus = pygame.Rect(r.right - 28, r.bottom - 28, 24, 24)
+        pygame.draw.rect(face, (80, 180, 90) if not hovered else (90, 200, 100), plus, border_radius=6)
+        ptxt = self.app.h5.render('+', True, (255, 255, 255))
+        face.blit(ptxt, (plus.centerx - ptxt.get_width() // 2, plus.centery - ptxt.get_height() // 2 - 1))
+
+    def _render_slot_card(self, face: pygame.Surface, name: str, item: dict):
+        r = face.get_rect()
+        img = resolve_player_image_by_name_and_rarity(name, item.get('rarity', ''))
+        pad = 6
+        inner = pygame.Rect(r.x + pad, r.y + pad, r.w - 2 * pad, r.h - 2 * pad)
+        if img is not None:
+            draw_player_png_centered(face, img, inner.center, inner.w, inner.h)
+        else:
+            pygame.draw.rect(face, (40, 42, 52), inner, border_radius=8)
+        ntxt = self.app.h5.render(name, True, (235, 235, 245))
+        face.blit(ntxt, (r.centerx - ntxt.get_width() // 2, r.bottom - ntxt.get_height() - 4))
+
+    def _render_drag_card(self, face: pygame.Surface, name: str, item: dict):
+        r = face.get_rect()
+        color = RARITY_COLORS.get(item.get('rarity', ''), (120, 120, 130))
+        pygame.draw.rect(face, (30, 32, 40, 220), r, border_radius=12)
+        pygame.draw.rect(face, color, r, 2, border_radius=12)
+        img = resolve_player_image_by_name_and_rarity(name, item.get('rarity', ''))
+        pad = 6
+        inner = pygame.Rect(r.x + pad, r.y + pad, r.w - 2 * pad, r.h - 2 * pad)
+        if img is not None:
+            draw_player_png_centered(face, img, inner.center, inner.w, inner.h)
+        ntxt = self.app.h5.render(name, True, (235, 235, 245))
+        face.blit(ntxt, (r.centerx - ntxt.get_width() // 2, r.bottom - ntxt.get_height() - 4))
+
+    def _formation_433_positions(self, area: pygame.Rect, count: int) -> List[pygame.Rect]:
+        # center coordinates normalized for 4-3-3: forwards (top), mids, defs, GK (bottom)
+        W, H = area.w, area.h
+        cx = lambda f: area.x + int(W * f)
+        cy = lambda f: area.y + int(H * f)
+        centers = []
+        # Forwards (LW, ST, RW)
+        centers += [(cx(0.2), cy(0.18)), (cx(0.5), cy(0.18)), (cx(0.8), cy(0.18))]
+        # Midfield (LCM, CM, RCM)
+        centers += [(cx(0.25), cy(0.40)), (cx(0.5), cy(0.40)), (cx(0.75), cy(0.40))]
+        # Defense (LB, LCB, RCB, RB)
+        centers += [(cx(0.15), cy(0.65)), (cx(0.38), cy(0.65)), (cx(0.62), cy(0.65)), (cx(0.85), cy(0.65))]
+        # GK
+        centers += [(cx(0.5), cy(0.85))]
+        # determine slot size
+        s = max(64, min(W // 5, H // 6))
+        rects: List[pygame.Rect] = []
+        for (x, y) in centers[:count]:
+            r = pygame.Rect(0, 0, int(s * 0.9), int(s * 1.1))
+            r.center = (x, y)
+            rects.append(r)
+        return rects
@@ -0,0 +1,362 @@
+from __future__ import annotations
+
+import pygame
+
+from .. import xp
+from .. import season_pass as sp_mod
+from .. import assets
+from ..app import App, Screen, draw_bg_cover, draw_player_png_centered
+
+# Season Pass reward track.
+
+
+class SeasonPass(Screen):
+    """Simple Season Pass screen (placeholder): shows current XP/level and a few tiers."""
+    def __init__(self, app: 'App'):
+        super().__init__(app)
+        # horizontal scroll like SBC/Défis
+        self.tile_scroll_x = 0
+        self._tiles = []  # list of (rect, level)
+        # optional background image for the Season Pass screen
+        try:
+            # Use project-relative background for Android compatibility
+            self._pass_bg_path = assets.path("Fond/Sbc/Ultimate Scream/Joueur/fond ultimate scream.png")
+        except Exception:
+            self._pass_bg_path = None
+        # pass selector tabs cache (id, name)
+        try:
+            # (id, name, unlocked)
+            self.pass_tabs = sp_mod.list_all_passes()
+        except Exception:
+            self.pass_tabs = [('halloween', 'Saison 2 : Ultimate Scream', False)]
+
+    def handle(self, event: pygame.event.Event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.app.pop()
+        elif event.type == pygame.MOUSEWHEEL:
+            # horizontal scroll via mouse wheel
+            self.tile_scroll_x = max(0, self.tile_scroll_x - event.y * 60)
+        elif event.type == pygame.KEYDOWN and event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+            # scroll by one tile step (based on 3 columns layout)
+            w, h = self.app.size
+            area = pygame.Rect(40, 150, w - 80, h - 220)
+            gap = 20
+            cols = 3
+            tile_h = max(220, area.h - 24)
+            tile_w = max(180, (area.w - (cols - 1) * gap - 8) // cols)
+            step = tile_w + gap
+            dx = -step if event.key == pygame.K_LEFT else step
+            self.tile_scroll_x = max(0, self.tile_scroll_x + dx)
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            mx, my = event.pos
+            # pass selector tabs click
+            try:
+                tabs = sp_mod.list_all_passes()
+            except Exception:
+                tabs = [('halloween', 'Saison 2 : Ultimate Scream', False)]
+            tx, ty = 40, 60
+            # dynamic tab widths based on label size to avoid clipping
+            spacing = 12
+            x = tx
+            for i, (pid, pname, unlocked) in enumerate(tabs):
+                label_txt = pname + ('  🔒' if not unlocked else '')
+                try:
+                    lbl = self.app.h4.render(label_txt, True, (0, 0, 0))
+                    tab_w = max(140, lbl.get_width() + 28)
+                except Exception:
+                    tab_w = 200
+                r = pygame.Rect(x, ty, tab_w, 36)
+                if r.collidepoint((mx, my)):
+                    try:
+                        if unlocked and sp_mod.set_active_pass(pid):
+                            self.tile_scroll_x = 0
+                    except Exception:
+                        pass
+                    return
+                x += tab_w + spacing
+            # check claim buttons by recomputing positions
+            lvl, cur, need = xp.get_level_progress()
+            current_level = lvl
+            # Recompute current tile layout
+            w, h = self.app.size
+            area = pygame.Rect(40, 150, w - 80, h - 220)
+            gap = 20
+            cols = 3
+            tile_h = max(220, area.h - 24)
+            tile_w = max(180, (area.w - (cols - 1) * gap - 8) // cols)
+            rewards = sp_mod.list_rewards()
+            # Overflow arrows clickable like SBC/Collection
+            content_w = max(0, len(rewards) * (tile_w + gap) - gap)
+            overflow = content_w > area.w
+            if overflow:
+                left_arrow = pygame.Rect(area.x + 6, area.centery - 24, 32, 48)
+                right_arrow = pygame.Rect(area.right - 38, area.centery - 24, 32, 48)
+                if left_arrow.collidepoint((mx, my)):
+                    self.tile_scroll_x = max(0, self.tile_scroll_x - (tile_w + gap))
+                    return
+                if right_arrow.collidepoint((mx, my)):
+                    self.tile_scroll_x = max(0, self.tile_scroll_x + (tile_w + gap))
+                    return
+            # single row scroller (3 tiles per view)
+            start_x = area.x + 4 - self.tile_scroll_x
+            y = area.y + 12
+            for i, rw in enumerate(rewards):
+                r = pygame.Rect(start_x + i * (tile_w + gap), y, tile_w, tile_h)
+                if not area.collidepoint((mx, my)) or not r.collidepoint((mx, my)):
+                    continue
+                claim = pygame.Rect(r.centerx - 60, r.bottom - 44, 120, 32)
+                if claim.collidepoint((mx, my)):
+                    if sp_mod.can_claim(rw.level, current_level):
+                        sp_mod.claim(rw.level)
+                    break
+
+    def _compose_backdrop(self, bg_path):
+        def compose(surf: pygame.Surface):
+            surf.fill((16, 18, 22))
+            draw_bg_cover(surf, bg_path, surf.get_rect())
+            surf.blit(self.app.render.dim(120, surf.get_size()), (0, 0))
+        return compose
+
+    def draw(self, screen: pygame.Surface):
+        w, h = self.app.size
+        screen.fill((16, 18, 22))
+        # background cover image (per-pass), composed once with its dim
+        try:
+            active_pid = sp_mod.get_active_pass_id()
+        except Exception:
+            active_pid = 'launch'
+        try:
+            if active_pid == 'halloween':
+                bg_rel = "Fond/Sbc/Ultimate Scream/Joueur/fond ultimate scream.png"
+            else:
+                # default background for launch or others
+                bg_rel = "Fond/fond de football pass saison.png"
+            bg_path = assets.path(bg_rel)
+            if bg_path is not None:
+                screen.blit(self.app.render.backdrop(('season_pass', bg_path), self._compose_backdrop(bg_path)), (0, 0))
+        except Exception:
+            pass
+        try:
+            pass_name = sp_mod.get_active_pass_name()
+        except Exception:
+            pass_name = 'Saison 2 : Ultimate Scream'
+        # title removed (avoid white text behind season tabs)
+        # pass selector tabs
+        try:
+            tabs = sp_mod.list_all_passes()
+        except Exception:
+            tabs = [('halloween', 'Saison 2 : Ultimate Scream', False)]
+        active_id = None
+        try:
+            active_id = sp_mod.get_active_pass_id()
+        except Exception:
+            active_id = 'halloween'
+        tx, ty = 40, 60
+        mx, my = pygame.mouse.get_pos()
+        # Tabs backdrop to improve readability over bright backgrounds
+        rects = []
+        try:
+            spacing = 12
+            # compute dynamic widths from labels
+            x = tx
+            total_w = 0
+            for (pid, pname, unlocked) in tabs:
+                label_txt = pname + ('  🔒' if not unlocked else '')
+                try:
+                    lbl = self.app.h4.render(label_txt, True, (0, 0, 0))
+                    tab_w = max(140, lbl.get_width() + 28)
+                except Exception:
+                    tab_w = 200
+                rects.append((pid, pygame.Rect(x, ty, tab_w, 36), pname, unlocked))
+                x += tab_w + spacing
+                total_w += (tab_w + spacing)
+            if rects:
+                total_w = total_w - spacing  # remove last spacing
+            back = pygame.Rect(tx - 12, ty - 8, max(0, total_w) + 24, 52)
+            back_surf = pygame.Surface((back.w, back.h), pygame.SRCALPHA)
+            back_surf.fill((10, 12, 16, 200))
+            pygame.draw.rect(back_surf, (90, 94, 120, 220), back_surf.get_rect(), 2, border_radius=12)
+            screen.blit(back_surf, back.topleft)
+        except Exception:
+            # fallback to fixed layout if something goes wrong
+            rects = [(pid, pygame.Rect(tx + i * (240 + 12), ty, 240, 36), pname, unlocked) for i, (pid, pname, unlocked) in enumerate(tabs)]
+        for (pid, r, pname, unlocked) in rects:
+            sel = (pid == active_id)
+            hovered = r.collidepoint((mx, my))
+            # locked style: darker, no hover brighten
+            if not unlocked:
+                bg = (32, 34, 44)
+            else:
+                bg = (38, 40, 50) if not sel else (58, 60, 90)
+            if hovered:
+                if unlocked:
+                    bg = (48, 50, 65) if not sel else (68, 70, 110)
+            pygame.draw.rect(screen, bg, r, border_radius=10)
+            pygame.draw.rect(screen, (90, 90, 110), r, 2, border_radius=10)
+            label_txt = pname + ('  🔒' if not unlocked else '')
+            # keep legible but compact font
+            lbl = self.app.h4.render(label_txt, True, (235, 235, 245))
+            screen.blit(lbl, (r.centerx - lbl.get_width() // 2, r.centery - lbl.get_height() // 2))
+        # If hovering a locked tab, show small hint under tabs
+        try:
+            for (pid, r, pname, unlocked) in rects:
+                if not unlocked and r.collidepoint((mx, my)):
+                    hint = sp_mod.get_unlock_hint(pid)
+                    ht = self.app.h5.render(hint, True, (180, 180, 190))
+                    screen.blit(ht, (tx, ty + 32))
+                    break
+        except Exception:
+            pass
+        # XP chip
+        _total, lvl, cur, need = self.app.xp_progress.get()
+        # XP chip — slightly larger to stand out
+        chip = pygame.Rect(40, 92, 380, 56)
+        pygame.draw.rect(screen, (28, 30, 38), chip, border_radius=12)
+        pygame.draw.rect(screen, (70, 72, 90), chip, 3, border_radius=12)
+        txt = self.app.h4.render(f"Niveau {lvl}  ·  {cur}/{need} XP", True, (235, 235, 245))
+        screen.blit(txt, (chip.centerx - txt.get_width() // 2, chip.centery - txt.get_height() // 2))
+        # area for tiles and scrolled content (slightly taller for top progress bar clearance)
+        area = pygame.Rect(40, 162, w - 80, h - 216)
+        pygame.draw.rect(screen, (20, 22, 28), area, border_radius=12)
+        pygame.draw.rect(screen, (60, 62, 78), area, 2, border_radius=12)
+        # Season Pass tiles area — show 3 tiles per view, scroll with wheel/arrow keys
+        pygame.draw.rect(screen, (18, 20, 26), area, border_radius=12)
+        pygame.draw.rect(screen, (60, 62, 78), area, 2, border_radius=12)
+        rewards = sp_mod.list_rewards()
+        gap = 20
+        cols = 3
+        pad_top = 28  # extra top padding to avoid overlap with the progress bar
+        tile_h = max(220, area.h - 24 - pad_top)
+        tile_w = max(180, (area.w - (cols - 1) * gap - 8) // cols)
+        start_x = area.x + 4 - self.tile_scroll_x
+        y = area.y + pad_top
+        # overflow arrows
+        content_w = max(0, len(rewards) * (tile_w + gap) - gap)
+        overflow = content_w > area.w
+        if overflow:
+            la = pygame.Rect(area.x + 6, area.centery - 24, 32, 48)
+            ra = pygame.Rect(area.right - 38, area.centery - 24, 32, 48)
+            pygame.draw.rect(screen, (28, 30, 38), la, border_radius=8)
+            pygame.draw.rect(screen, (28, 30, 38), ra, border_radius=8)
+            pygame.draw.polygon(screen, (200, 200, 210), [(la.right - 8, la.y + 8), (la.x + 10, la.centery), (la.right - 8, la.bottom - 8)])
+            pygame.draw.polygon(screen, (200, 200, 210), [(ra.x + 8, ra.y + 8), (ra.right - 10, ra.centery), (ra.x + 8, ra.bottom - 8)])
+        # clip to area
+        prev_clip = screen.get_clip()
+        screen.set_clip(area.inflate(-2, -2))
+        self._tiles.clear()
+        mx, my = pygame.mouse.get_pos()
+        for i, rw in enumerate(rewards):
+            r = pygame.Rect(start_x + i * (tile_w + gap), y, tile_w, tile_h)
+            if r.right < area.x or r.x > area.right:
+                continue
+            self._tiles.append((r, rw.level))
+            # base card with hover effect to match SBC/Collection
+            hovered = (area.collidepoint((mx, my)) and r.collidepoint((mx, my)))
+            base_col = (32, 36, 46)
+            if hovered:
+                base_col = (38, 42, 56)
+            pygame.draw.rect(screen, base_col, r, border_radius=14)
+            pygame.draw.rect(screen, (90, 94, 120), r, 2, border_radius=14)
+            # title
+            t = self.app.h4.render(f'Niveau {rw.level}', True, (235, 235, 245))
+            screen.blit(t, (r.centerx - t.get_width() // 2, r.y + 10))
+            # background image (cover)
+            if getattr(rw, 'bg_img', None):
+                try:
+                    use_p = assets.resolve(rw.bg_img)
+                    if use_p is not None:
+                        inner_bg = r.inflate(-8, -8)
+                        panel = pygame.Surface((inner_bg.w, inner_bg.h), pygame.SRCALPHA)
+                        draw_bg_cover(panel, use_p, panel.get_rect())
+                        mask = pygame.Surface((inner_bg.w, inner_bg.h), pygame.SRCALPHA)
+                        pygame.draw.rect(mask, (255, 255, 255, 255), mask.get_rect(), border_radius=12)
+                        panel.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+                        screen.blit(panel, inner_bg.topleft)
+                except Exception:
+                    pass
+            # card image (if card reward)
+            if rw.kind == 'card' and getattr(rw, 'card_img', None):
+                try:
+                    p = assets.resolve(rw.card_img)
+                    if p is not None:
+                        draw_player_png_centered(screen, p, r.center, int(r.w * 0.7), int(r.h * 0.7))
+                except Exception:
+                    pass
+            # (badge for unlock rewards removed by request)
+            # non-card reward chip (coins/XP/unlock), centered like Defi reward chip
+            if rw.kind in ('coins', 'xp', 'unlock'):
+                chip = pygame.Surface((int(r.w * 0.7), 32), pygame.SRCALPHA)
+                pygame.draw.rect(chip, (60, 62, 78, 210), chip.get_rect(), border_radius=10)
+                if rw.kind == 'coins':
+                    label = f"+{rw.amount} Coins"
+                elif rw.kind == 'xp':
+                    label = f"+{rw.amount} XP"
+                else:
+                    # unlock
+                    target_pass = getattr(rw, 'unlock_pass_id', None)
+                    feat = getattr(rw, 'unlock_feature', None)
+                    if feat == 'sbc':
+                        label = 'Débloque SBC'
+                    elif feat == 'draft':
+                        label = 'Débloque Draft'
+                    elif feat == 'defi':
+                        label = 'Débloque Défis'
+                    elif target_pass == 'halloween':
+                        label = 'Débloque Saison 2 : Ultimate Scream'
+                    elif target_pass == 'futmas':
+                        label = 'Débloque Saison 3 : Futmas'
+                    else:
+                        label = 'Débloque du contenu'
+                ct = self.app.h4.render(label, True, (235, 235, 245))
+                chip.blit(ct, (chip.get_width() // 2 - ct.get_width() // 2, chip.get_height() // 2 - ct.get_height() // 2))
+                screen.blit(chip, (r.centerx - chip.get_width() // 2, r.centery - chip.get_height() // 2))
+            # state + claim button
+            current_level = lvl
+            claimed = sp_mod.is_claimed(rw.level)
+            eligible = sp_mod.can_claim(rw.level, current_level)
+            status = 'Réclamé' if claimed else ('Disponible' if eligible else 'Verrouillé')
+            st = self.app.h5.render(status, True, (230, 230, 240))
+            screen.blit(st, (r.centerx - st.get_width() // 2, r.bottom - 76))
+            claim = pygame.Rect(r.centerx - 60, r.bottom - 44, 120, 32)
+            pygame.draw.rect(screen, (40, 140, 240) if eligible else (60, 62, 78), claim, border_radius=8)
+            ct = self.app.h4.render('Récupérer' if eligible else ('Réclamé' if claimed else 'Bloqué'), True, (255, 255, 255))
+            screen.blit(ct, (claim.centerx - ct.get_width() // 2, claim.centery - ct.get_height() // 2))
+        # XP progress bar that follows the mouse wheel (overall: Niveau 1 -> Niveau max)
+        try:
+            max_level = max((rw.level for rw in rewards), default=1)
+        except Exception:
+            max_level = 1
+        # overall ratio includes previous levels + fraction of current
+        frac_in_level = 0.0 if need <= 0 else min(1.0, cur / max(1, need))
+        denom = max(1, max_level - 1)
+        ratio = max(0.0, min(1.0, ((max(lvl, 1) - 1) + frac_in_level) / denom))
+        # make the track span the entire scroll content width so it truly goes to the max level
+        track_w = content_w if content_w > 0 else int(area.w * 0.9)
+        prog_w = max(300, track_w)
+        # position the bar at the top of the scroll area
+        bar_area = pygame.Rect(start_x + 8, area.y + 6, prog_w, 16)
+        # background and border for visibility
+        pygame.draw.rect(screen, (50, 54, 70), bar_area, border_radius=8)
+        pygame.draw.rect(screen, (90, 94, 120), bar_area, 2, border_radius=8)
+        # fill
+        fill = pygame.Rect(bar_area.x, bar_area.y, int(bar_area.w * ratio), bar_area.h)
+        pygame.draw.rect(screen, (80, 210, 120), fill, border_radius=8)
+        # end cap marker for clarity
+        head_x = fill.right
+        if head_x > bar_area.x:
+            pygame.draw.circle(screen, (120, 255, 160), (head_x, bar_area.centery), 5)
+        # optional ticks every 5 levels for readability
+        step = 5 if max_level > 10 else 1
+        denom = max(1, max_level - 1)
+        for t in range(0, max_level + 1, step):
+            tx = bar_area.x + int(bar_area.w * (t / denom))
+            pygame.draw.line(screen, (100, 104, 130), (tx, bar_area.y), (tx, bar_area.bottom), 1)
+        # no start/end level labels requested
+        # restore clip
+        screen.set_clip(prev_clip)
+        # bottom hint like SBC/Défis
+        hint_txt = 'Molette ou ← → pour défiler · Clique Récupérer quand un palier est atteint'
+        hint = self.app.h5.render(hint_txt, True, (160, 160, 170))
+        screen.blit(hint, (area.x + 12, area.bottom + 8))
+        esc = self.app.h5.render('[Esc] Retour', True, (150, 150, 160))
+        screen.blit(esc, (w - esc.get_width() - 32, 32))
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import pygame
+
+from .. import profiles
+from .. import settings as app_settings
+from .. import quality as quality_mod
+from .. import render_scale
+from ..app import App, Button, Screen
+
+# Settings screen (quality, render scale, FPS counter, fullscreen, save profile).
+
+
+class Settings(Screen):
+    def __init__(self, app: 'App'):
+        super().__init__(app)
+        self.dragging_vol = False
+
+    def handle(self, event: pygame.event.Event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.app.pop()
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            mx, my = event.pos
+            vs = self._vol_slider_rect()
+            if vs.collidepoint((mx, my)):
+                self.dragging_vol = True
+                self._update_volume(mx)
+            if self._profile_rect().collidepoint((mx, my)):
+                self.app.push('Profiles')
+            if self._render_rect().collidepoint((mx, my)):
+                mode = render_scale.next_mode(self.app.settings.get('render_scale', 'auto'))
+                self.app.settings['render_scale'] = mode
+                self.app.render.set_mode(mode)
+                app_settings.save_settings(self.app.settings)
+        if event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            self.dragging_vol = False
+        if event.type == pygame.MOUSEMOTION and self.dragging_vol:
+            self._update_volume(event.pos[0])
+
+    def _vol_slider_rect(self) -> pygame.Rect:
+        return pygame.Rect(320, 200, 400, 24)
+
+    def _profile_rect(self) -> pygame.Rect:
+        return pygame.Rect(40, 260, 360, 42)
+
+    def _render_rect(self) -> pygame.Rect:
+        return pygame.Rect(360, 100, 340, 42)
+
+    def _update_volume(self, mouse_x: int):
+        vs = self._vol_slider_rect()
+        rel = max(0, min(vs.w, mouse_x - vs.x))
+        vol = int((rel / vs.w) * 100)
+        self.app.settings['volume'] = vol
+        app_settings.save_settings(self.app.settings)
+
+    def draw(self, screen: pygame.Surface):
+        w, h = self.app.size
+        screen.fill((16, 18, 22))
+        title = self.app.h2.render('Paramètres', True, (230, 230, 240))
+        screen.blit(title, (40, 32))
+
+        # effects quality cycle
+        q = self.app.settings.get('effects_quality', 'medium')
+        auto = self.app.settings.get('effects_auto', True)
+        lbl = 'Qualité effets: ' + ('Bas' if q == 'low' else 'Moyen' if q == 'medium' else 'Élevé')
+        if auto:
+            lbl += ' (auto)'
+        qrect = pygame.Rect(40, 100, 300, 42)
+        btn = Button(qrect, lbl)
+        mx, my = pygame.mouse.get_pos()
+        pressed = pygame.mouse.get_pressed()[0]
+        btn.draw(screen, self.app.h4, hovered=qrect.collidepoint((mx, my)), pressed=pressed and qrect.collidepoint((mx, my)))
+        if pressed and qrect.collidepoint((mx, my)):
+            # auto -> low -> medium -> high -> auto
+            if auto:
+                self.app.settings['effects_auto'] = False
+                self.app.settings['effects_quality'] = 'low'
+            elif q == 'high':
+                self.app.settings['effects_auto'] = True
+            else:
+                self.app.settings['effects_quality'] = {'low': 'medium', 'medium': 'high'}.get(q, 'medium')
+            self.app.quality.level = quality_mod.normalize(self.app.settings['effects_quality'])
+            app_settings.save_settings(self.app.settings)
+
+        # render scale of full-screen effect layers
+        rrect = self._render_rect()
+        rlbl = 'Résolution effets : ' + render_scale.label(self.app.settings.get('render_scale', 'auto'))
+        if self.app.render.mode == 'auto' and self.app.render.scale < 1.0:
+            rlbl += f' ({int(self.app.render.scale * 100)}%)'
+        Button(rrect, rlbl).draw(screen, self.app.h4, hovered=rrect.collidepoint((mx, my)))
+
+        # show fps toggle
+        srect = pygame.Rect(40, 160, 220, 42)
+        sbtn = Button(srect, f"Afficher FPS: {'Oui' if self.app.settings.get('show_fps') else 'Non'}")
+        sbtn.draw(screen, self.app.h4, hovered=srect.collidepoint((mx, my)), pressed=pressed and srect.collidepoint((mx, my)))
+        if pressed and srect.collidepoint((mx, my)):
+            self.app.settings['show_fps'] = not self.app.settings.get('show_fps', False)
+            app_settings.save_settings(self.app.settings)
+
+        # volume slider
+        vs = self._vol_slider_rect()
+        pygame.draw.rect(screen, (42, 44, 54), vs, border_radius=8)
+        vol = self.app.settings.get('volume', 80)
+        filled = pygame.Rect(vs.x, vs.y, int(vs.w * (vol / 100.0)), vs.h)
+        pygame.draw.rect(screen, (62, 140, 255), filled, border_radius=8)
+        vtxt = self.app.h4.render(f'Volume: {vol}%', True, (210, 210, 220))
+        screen.blit(vtxt, (vs.x, vs.y - 32))
+
+        # save profile
+        prect = self._profile_rect()
+        cur = profiles.active()
+        name = next((p['name'] for p in profiles.list_profiles() if p['id'] == cur), cur)
+        Button(prect, f'Profil : {name}').draw(screen, self.app.h4, hovered=prect.collidepoint((mx, my)))
+
+        hint = self.app.h5.render('[Esc] Retour', True, (150, 150, 160))
+        screen.blit(hint, (w - hint.get_width() - 32, 32))
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-import json
+from bisect import bisect_right
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
 
+from . import content
 from . import db as game_db
+from . import savefile
+from . import state_bus
 
 ROOT = Path(__file__).resolve().parents[1]
-DATA_FILE = ROOT / 'data' / 'season_pass_progress.json'
 
  
 
@@ -257,65 +259,182 @@ PASS_NAMES: Dict[str, str] = {
 }
 
 
-def _ensure_file():
-    if not DATA_FILE.exists():
-        DATA_FILE.parent.mkdir(parents=True, exist_ok=True)
-        DATA_FILE.write_text(
-            json.dumps({'active': 'launch', 'claimed': {}, 'unlocked': ['launch'], 'features': {'sbc': False, 'defi': False, 'draft': False, 'sbc_hero': False, 'sbc_icon': False}, 'start_xp': {}, 'frozen_xp': {}}, ensure_ascii=False, indent=2),
-            encoding='utf-8'
-        )
+_DEFAULT_FEATURES = {'sbc': False, 'defi': False, 'draft': False, 'sbc_hero': False, 'sbc_icon': False}
+_DEFAULT_STATE = {'active': 'launch', 'claimed': {}, 'unlocked': ['launch'], 'features': _DEFAULT_FEATURES, 'start_xp': {}, 'frozen_xp': {}}
+
+
+def _migrate_v1(data) -> Dict:
+    # legacy season_pass_progress.json, any of its historical shapes
+    if not isinstance(data, dict):
+        data = {}
+    # Back-compat: if claimed is a list, wrap it under 'halloween'
+    if isinstance(data.get('claimed'), list):
+        data = {
+            'active': data.get('active', 'launch'),
+            'claimed': {'halloween': list(data.get('claimed', []))},
+        }
+    if 'active' not in data:
+        data['active'] = 'launch'
+    if 'claimed' not in data or not isinstance(data['claimed'], dict):
+        data['claimed'] = {}
+    # Introduce unlocked pass list
+    if 'unlocked' not in data or not isinstance(data['unlocked'], list):
+        data['unlocked'] = ['launch']
+    # Introduce features dictionary
+    if 'features' not in data or not isinstance(data['features'], dict):
+        data['features'] = dict(_DEFAULT_FEATURES)
+    else:
+        for k, v in _DEFAULT_FEATURES.items():
+            data['features'].setdefault(k, v)
+    # Per-pass XP baseline so levels reset when switching seasons
+    if 'start_xp' not in data or not isinstance(data['start_xp'], dict):
+        data['start_xp'] = {}
+    # Frozen per-pass XP deltas for inactive passes (so progress doesn't move when inactive)
+    if 'frozen_xp' not in data or not isinstance(data['frozen_xp'], dict):
+        data['frozen_xp'] = {}
+    # Guard: ensure active is an unlocked pass
+    if data.get('active') not in data['unlocked']:
+        data['active'] = 'launch'
+    return data
+
+
+savefile.register('season_pass_progress', _DEFAULT_STATE, [_migrate_v1])
 
 
 def _load() -> Dict:
-    _ensure_file()
+    return savefile.load('season_pass_progress')
+
+
+# --- In-memory pass state ---
+# The progress file is read once; baselines, frozen deltas and claimed levels live in
+# memory and every change is written through _save. Claimed levels are also kept as
+# per-pass bitsets so is_claimed is a bit test.
+_state: Optional[Dict] = None
+_claimed_bits: Dict[str, int] = {}
+_listeners: List[Callable[[], None]] = []
+
+# Bumped on every write so pass-derived values can be memoized
+_version = 0
+
+
+def version() -> int:
+    return _version
+
+
+def add_listener(fn: Callable[[], None]) -> None:
+    """Register a callback invoked after every pass state change."""
+    if fn not in _listeners:
+        _listeners.append(fn)
+
+
+def remove_listener(fn: Callable[[], None]) -> None:
     try:
-        with DATA_FILE.open('r', encoding='utf-8') as f:
-            data = json.load(f)
-            # Back-compat: if claimed is a list, wrap it under 'halloween'
-            if isinstance(data.get('claimed'), list):
-                data = {
-                    'active': data.get('active', 'launch'),
-                    'claimed': {'halloween': list(data.get('claimed', []))},
-                }
-            if 'active' not in data:
-                data['active'] = 'launch'
-            if 'claimed' not in data or not isinstance(data['claimed'], dict):
-                data['claimed'] = {}
-            # Introduce unlocked pass list
-            if 'unlocked' not in data or not isinstance(data['unlocked'], list):
-                data['unlocked'] = ['launch']
-            # Introduce features dictionary
-            if 'features' not in data or not isinstance(data['features'], dict):
-                data['features'] = {'sbc': False, 'defi': False, 'draft': False, 'sbc_hero': False, 'sbc_icon': False}
-            else:
-                data['features'].setdefault('sbc', False)
-                data['features'].setdefault('defi', False)
-                data['features'].setdefault('draft', False)
-                data['features'].setdefault('sbc_hero', False)
-                data['features'].setdefault('sbc_icon', False)
-            # Per-pass XP baseline so levels reset when switching seasons
-            if 'start_xp' not in data or not isinstance(data['start_xp'], dict):
-                data['start_xp'] = {}
-            # Frozen per-pass XP deltas for inactive passes (so progress doesn't move when inactive)
-            if 'frozen_xp' not in data or not isinstance(data['frozen_xp'], dict):
-                data['frozen_xp'] = {}
-            # Guard: ensure active is an unlocked pass
-            if data.get('active') not in data['unlocked']:
-                data['active'] = 'launch'
-            return data
-    except Exception:
-        return {'active': 'launch', 'claimed': {}, 'unlocked': ['launch'], 'features': {'sbc': False, 'defi': False}, 'start_xp': {}}
+        _listeners.remove(fn)
+    except ValueError:
+        pass
+
+
+def mark_changed() -> None:
+    global _version
+    _version += 1
+    state_bus.emit(state_bus.SEASON_PASS)
+    for fn in list(_listeners):
+        try:
+            fn()
+        except Exception:
+            pass
+
+
+def _rebuild_claimed_bits(d: Dict) -> None:
+    _claimed_bits.clear()
+    for pid, levels in (d.get('claimed') or {}).items():
+        bits = 0
+        try:
+            for lvl in levels:
+                bits |= 1 << int(lvl)
+        except Exception:
+            pass
+        _claimed_bits[pid] = bits
+
+
+def _get() -> Dict:
+    """In-memory pass state, loaded from disk on first use."""
+    global _state
+    if _state is None:
+        _state = _load()
+        _rebuild_claimed_bits(_state)
+    return _state
+
+
+def reload() -> None:
+    """Drop the in-memory state (e.g. after the save files were reset)."""
+    global _state
+    _state = None
+    _claimed_bits.clear()
+    mark_changed()
 
 
 def _save(d: Dict):
+    global _state
     try:
-        DATA_FILE.write_text(json.dumps(d, ensure_ascii=False, indent=2), encoding='utf-8')
+        savefile.save('season_pass_progress', d)
     except Exception:
         pass
+    _state = d
+    _rebuild_claimed_bits(d)
+    mark_changed()
+
+
+# --- XP curves ---
+class XPCurve:
+    """Level curve with precomputed cumulative XP thresholds.
+
+    cost(level) is the XP needed to go from `level` to `level + 1`. Level lookup is a
+    binary search over the cumulative thresholds, extended on demand.
+    """
+
+    def __init__(self, cost: Callable[[int], int], levels: int = 100):
+        self._cost = cost
+        self.thresholds: List[int] = [0]  # thresholds[i] = total XP to reach level i + 1
+        self._extend(levels)
+
+    def _extend(self, levels: int) -> None:
+        while len(self.thresholds) <= levels:
+            lvl = len(self.thresholds)
+            self.thresholds.append(self.thresholds[-1] + max(1, int(self._cost(lvl))))
+
+    def progress(self, total_xp: int) -> Tuple[int, int, int]:
+        """Return (level, current_in_level, needed_for_next) for a total XP amount."""
+        total_xp = max(0, int(total_xp))
+        while total_xp >= self.thresholds[-1]:
+            self._extend(len(self.thresholds) * 2)
+        i = bisect_right(self.thresholds, total_xp) - 1
+        return i + 1, total_xp - self.thresholds[i], self.thresholds[i + 1] - self.thresholds[i]
+
+    def level(self, total_xp: int) -> int:
+        return self.progress(total_xp)[0]
+
+
+# same leveling curve as xp.py: 100 XP per level
+DEFAULT_CURVE = XPCurve(lambda _lvl: 100)
+_CURVES: Dict[str, XPCurve] = {}
+
+
+def set_xp_curve(pass_id: str, curve: Optional[XPCurve]) -> None:
+    """Use a custom XP curve for a pass (None restores the default)."""
+    if curve is None:
+        _CURVES.pop(pass_id, None)
+    else:
+        _CURVES[pass_id] = curve
+    mark_changed()
+
+
+def get_xp_curve(pass_id: str) -> XPCurve:
+    return _CURVES.get(pass_id, DEFAULT_CURVE)
 
 
 def get_active_pass_id() -> str:
-    d = _load()
+    d = _get()
     aid = d.get('active') or 'launch'
     if aid not in PASSES or aid not in set(d.get('unlocked', [])):
         aid = 'launch'
@@ -330,7 +449,7 @@ def get_active_pass_name() -> str:
 def list_passes() -> List[Tuple[str, str]]:
     """Return list of available passes as (id, displayName)."""
     out: List[Tuple[str, str]] = []
-    d = _load()
+    d = _get()
     unlocked = set(d.get('unlocked', []))
     for pid, name in PASS_NAMES.items():
         if pid in unlocked:
@@ -342,7 +461,7 @@ def list_passes() -> List[Tuple[str, str]]:
 
 def set_active_pass(pass_id: str) -> bool:
     """Set the active pass if it exists. Returns True if changed/applied."""
-    d = _load()
+    d = _get()
     if pass_id not in PASSES or pass_id not in set(d.get('unlocked', [])):
         return False
     if d.get('active') == pass_id:
@@ -395,7 +514,7 @@ def get_relative_level_progress(pass_id: Optional[str] = None) -> Tuple[int, int
     progress does not move while inactive.
     """
     # read data and ensure baseline for the pass
-    d = _load()
+    d = _get()
     pid = pass_id or (d.get('active') or 'launch')
     active = d.get('active') or 'launch'
     try:
@@ -415,18 +534,16 @@ def get_relative_level_progress(pass_id: Optional[str] = None) -> Tuple[int, int
     else:
         # Inactive: use frozen snapshot; if missing, default to 0 (not started)
         delta = max(0, int(frozen.get(pid, 0)))
-    # same leveling curve as xp.py: 100 XP per level
-    level = max(1, (delta // 100) + 1)
-    cur = delta % 100
-    need = 100
-    return level, cur, need
+    return get_xp_curve(pid).progress(delta)
 
 
 def is_claimed(level: int, pass_id: Optional[str] = None) -> bool:
-    d = _load()
+    _get()
     pid = pass_id or get_active_pass_id()
-    cl = set(int(x) for x in d.get('claimed', {}).get(pid, []))
-    return int(level) in cl
+    try:
+        return bool((_claimed_bits.get(pid, 0) >> int(level)) & 1)
+    except Exception:
+        return False
 
 
 def can_claim(level: int, current_level: int, pass_id: Optional[str] = None) -> bool:
@@ -440,10 +557,9 @@ def claim(level: int, pass_id: Optional[str] = None) -> bool:
     rewards = PASSES.get(pid, {})
     if level not in rewards:
         return False
-    d = _load()
-    already = set(int(x) for x in d.get('claimed', {}).get(pid, []))
-    if int(level) in already:
+    if is_claimed(level, pid):
         return False
+    d = _get()
     reward = rewards[level]
     if reward.kind == 'card' and reward.name:
         try:
@@ -485,44 +601,37 @@ def claim(level: int, pass_id: Optional[str] = None) -> bool:
     return True
 
 
-def get_pass_only_players() -> List[Dict]:
+# Catalog rating of pass reward cards by lowercase name (others: 90)
+_PASS_CARD_RATINGS: Dict[str, int] = {
+    'xabi alonso': 88,
+    'ribéry': 89, 'ribery': 89,
+    'paul pogba': 86,
+    'peter crouch': 87,
+    'bryan mbeumo': 87,
+    'diego chará': 83, 'diego chara': 83,
+    'heung min son': 88,
+    'joão neves': 86, 'joao neves': 86,
+    'jakub kamiński': 83, 'jakub kaminski': 83,
+    'cha bum kun': 86, 'cha-bum kun': 86, 'cha bum-keun': 86,
+    'guéla doué': 84, 'guela doue': 84,
+    'quaresma': 85, 'ricardo quaresma': 85,
+    'carney chukwuemeka': 84, 'chukwuemeka': 84,
+    'james ward-prowse': 84, 'ward-prowse': 84, 'james ward prowse': 84,
+}
+
+
+def get_pass_only_players() -> Tuple[Mapping, ...]:
     """Players that are obtainable only via Season Pass (not packable)."""
+    return content.registry().pass_only
+
+
+def _pass_only_players() -> List[Dict]:
     out: List[Dict] = []
     # Provide catalog entries for card rewards across all passes
     for rewards in PASSES.values():
         for r in rewards.values():
             if r.kind == 'card' and r.name and r.rarity:
-                nl = r.name.lower()
-                if nl == 'xabi alonso':
-                    rating = 88
-                elif nl in ('ribéry', 'ribery'):
-                    rating = 89
-                elif nl == 'paul pogba':
-                    rating = 86
-                elif nl == 'peter crouch':
-                    rating = 87
-                elif nl == 'bryan mbeumo':
-                    rating = 87
-                elif nl in ('diego chará', 'diego chara'):
-                    rating = 83
-                elif nl in ('heung min son',):
-                    rating = 88
-                elif nl in ('joão neves', 'joao neves'):
-                    rating = 86
-                elif nl in ('jakub kamiński', 'jakub kaminski'):
-                    rating = 83
-                elif nl in ('cha bum kun', 'cha-bum kun', 'cha bum-keun'):
-                    rating = 86
-                elif nl in ('guéla doué', 'guela doue'):
-                    rating = 84
-                elif nl in ('quaresma', 'ricardo quaresma'):
-                    rating = 85
-                elif nl in ('carney chukwuemeka', 'chukwuemeka'):
-                    rating = 84
-                elif nl in ('james ward-prowse', 'ward-prowse', 'james ward prowse'):
-                    rating = 84
-                else:
-                    rating = 90
+                rating = _PASS_CARD_RATINGS.get(r.name.lower(), 90)
                 # For Pogba, expose a distinct variant name so Collection lists CAM separately
                 disp_name = r.name
                 if r.name and r.name.lower() == 'paul pogba':
@@ -542,7 +651,7 @@ def get_pass_only_players() -> List[Dict]:
 # ---- Feature flags API ----
 def is_feature_unlocked(feature: str) -> bool:
     try:
-        d = _load()
+        d = _get()
         feats = d.get('features') if isinstance(d.get('features'), dict) else {}
         return bool(feats.get(feature, False))
     except Exception:
@@ -552,7 +661,7 @@ def is_feature_unlocked(feature: str) -> bool:
 # ---- Pass listing including locked ----
 def list_all_passes() -> List[Tuple[str, str, bool]]:
     """Return list of all passes as (id, displayName, unlocked_flag)."""
-    d = _load()
+    d = _get()
     unlocked = set(d.get('unlocked', []))
     out: List[Tuple[str, str, bool]] = []
     for pid, name in PASS_NAMES.items():
@@ -565,14 +674,10 @@ def list_all_passes() -> List[Tuple[str, str, bool]]:
 def get_unlock_hint(pass_id: str) -> str:
     """If a pass is locked, return a short hint on how to unlock it.
 
-    Searches all PASSES for an unlock reward pointing to pass_id and reports the source.
+    Uses the unlock source precomputed by the content registry.
     """
-    try:
-        for src_id, rewards in PASSES.items():
-            for lvl, r in rewards.items():
-                if r.kind == 'unlock' and r.unlock_pass_id == pass_id:
-                    src_name = PASS_NAMES.get(src_id, src_id)
-                    return f"Débloqué au Niv {lvl} — {src_name}"
-        return 'Débloqué via Pass'
-    except Exception:
+    src = content.registry().pass_unlocked_by.get(pass_id)
+    if src is None:
         return 'Débloqué via Pass'
+    src_id, lvl = src
+    return f"Débloqué au Niv {lvl} — {PASS_NAMES.get(src_id, src_id)}"
@@ -0,0 +1,611 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
+
+from .packs import PACK_SHOP, generate_pack
+from . import bulk_open
+from . import content
+from . import daily_rewards
+from . import db as game_db
+from . import sbc as sbc_mod
+from . import season_pass
+from . import timeutil as tz
+from . import wallet
+
+# Headless game service.
+# The same rules as the pygame screens (packs, SBC, daily rewards, season pass,
+# wallet, defi counters) applied to in-memory profiles instead of the single
+# save under data/, served over a local line protocol: one JSON object per
+# line, {"id", "profile", "op", "args"} in, {"id", "ok", "result"|"error"} out.
+# Requests are handled concurrently; mutations of one profile are serialized by
+# that profile's lock. Hot profiles stay in memory (LRU, MAX_HOT) and dirty ones
+# are written by a write-behind task every FLUSH_INTERVAL seconds, off the
+# event loop. A profile whose write is still running is served from memory,
+# and a write never replaces a file holding a newer version of the profile.
+# Defi claims and the UI-only flows are not exposed.
+#
+#   python -m game.service --port 8765      (see tools/load_test.py for a client)
+
+HOST = '127.0.0.1'
+PORT = 8765
+PROFILES_DIR = Path(__file__).resolve().parents[1] / 'data' / 'service_profiles'
+MAX_HOT = 10000
+FLUSH_INTERVAL = 1.0  # seconds between two write-behind passes
+MAX_PACKS = 100  # per packs.open request
+
+_PROFILE_ID = re.compile(r'^[A-Za-z0-9_\-]{1,64}$')
+
+
+class ServiceError(Exception):
+    """Rejected request; the message is sent back to the client."""
+
+
+@dataclass
+class Profile:
+    id: str
+    name: str = 'Joueur'
+    coins: int = wallet._DEFAULT['minecoins']
+    xp: int = 0
+    owned: Dict[str, int] = field(default_factory=dict)
+    sbc_completed: Set[str] = field(default_factory=set)
+    bundles_granted: Set[str] = field(default_factory=set)
+    defi_events: Dict[str, int] = field(default_factory=dict)
+    daily: Dict = field(default_factory=lambda: {'last_claim_date': None, 'day_index': 0, 'cycles_completed': 0})
+    pass_claimed: Dict[str, List[int]] = field(default_factory=dict)
+    pass_start_xp: Dict[str, int] = field(default_factory=lambda: {'launch': 0})
+    features: Dict[str, bool] = field(default_factory=dict)
+    version: int = 0  # bumped by every mutation
+
+    def to_dict(self) -> Dict:
+        return {
+            'id': self.id,
+            'name': self.name,
+            'coins': self.coins,
+            'xp': self.xp,
+            'owned': dict(self.owned),
+            'sbc_completed': sorted(self.sbc_completed),
+            'bundles_granted': sorted(self.bundles_granted),
+            'defi_events': dict(self.defi_events),
+            'daily': dict(self.daily),
+            'pass_claimed': {k: list(v) for k, v in self.pass_claimed.items()},
+            'pass_start_xp': dict(self.pass_start_xp),
+            'features': dict(self.features),
+            'version': self.version,
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict) -> 'Profile':
+        p = cls(id=str(d['id']))
+        p.name = str(d.get('name', p.name))
+        p.coins = int(d.get('coins', p.coins))
+        p.xp = int(d.get('xp', 0))
+        p.owned = {str(k): int(v) for k, v in (d.get('owned') or {}).items()}
+        p.sbc_completed = set(d.get('sbc_completed') or ())
+        p.bundles_granted = set(d.get('bundles_granted') or ())
+        p.defi_events = {str(k): int(v) for k, v in (d.get('defi_events') or {}).items()}
+        p.daily.update(d.get('daily') or {})
+        p.pass_claimed = {str(k): [int(x) for x in v] for k, v in (d.get('pass_claimed') or {}).items()}
+        p.pass_start_xp.update({str(k): int(v) for k, v in (d.get('pass_start_xp') or {}).items()})
+        p.features = {str(k): bool(v) for k, v in (d.get('features') or {}).items()}
+        p.version = int(d.get('version', 0))
+        return p
+
+
+# ---- operations ---- #
+# op(profile, **args) -> JSON-able result. Ops listed in _MUTATING bump the
+# profile version and schedule a write.
+
+def _add_cards(p: Profile, names: List[str]) -> None:
+    for n in names:
+        b = game_db._base_name(n)
+        if b:
+            p.owned[b] = p.owned.get(b, 0) + 1
+
+
+def _event(p: Profile, key: str, amount: int) -> None:
+    if amount > 0:
+        p.defi_events[key] = p.defi_events.get(key, 0) + int(amount)
+
+
+def _op_profile_get(p: Profile) -> Dict:
+    d = p.to_dict()
+    d['level'] = season_pass.DEFAULT_CURVE.level(p.xp)
+    d['cards'] = sum(p.owned.values())
+    del d['owned']
+    return d
+
+
+def _op_profile_rename(p: Profile, name: str) -> Dict:
+    name = str(name).strip()[:24]
+    if not name:
+        raise ServiceError('Nom vide.')
+    p.name = name
+    return {'name': name}
+
+
+def _op_collection_get(p: Profile) -> Dict:
+    return {'owned': dict(p.owned)}
+
+
+def _op_packs_open(p: Profile, pack: str = 'Pack Classique', n: int = 1) -> Dict:
+    shop = {label: (count, price) for label, count, price in PACK_SHOP}
+    if pack not in shop:
+        raise ServiceError(f'Pack inconnu: {pack}')
+    n = max(1, min(MAX_PACKS, int(n)))
+    count, price = shop[pack]
+    total = price * n
+    if p.coins < total:
+        raise ServiceError(f'Pas assez de Minecoins ({total} requis)')
+    p.coins -= total
+    cards = []
+    for _ in range(n):
+        cards.extend(generate_pack(pack, count))
+    _add_cards(p, [c.name for c in cards])
+    p.xp += bulk_open.XP_PER_PACK * n
+    _event(p, 'coins_spent', total)
+    _event(p, 'pack_opened', n)
+    return {
+        'coins': p.coins,
+        'xp': p.xp,
+        'cards': [{'name': c.name, 'rarity': c.rarity, 'rating': int(c.rating)} for c in cards],
+    }
+
+
+def _op_sbc_list(p: Profile) -> Dict:
+    open_ids = [ch.id for ch in content.registry().challenges if ch.id not in p.sbc_completed]
+    return {'open': open_ids, 'completed': sorted(p.sbc_completed)}
+
+
+def _op_sbc_submit(p: Profile, challenge: str, names: List[str]) -> Dict:
+    ch = sbc_mod.get_challenge(challenge)
+    if ch is None:
+        raise ServiceError(f'Défi inconnu: {challenge}')
+    if ch.id in p.sbc_completed:
+        raise ServiceError('Défi déjà terminé.')
+    prev = content.registry().challenge_prev.get(ch.id)
+    if prev is not None and prev not in p.sbc_completed:
+        # same rule as the hub and the planner: a series is played step by step
+        raise ServiceError("Termine d'abord l'étape précédente.")
+    names = [str(n) for n in names]
+    size = sbc_mod.squad_size(ch)
+    if len(names) != size:
+        # SBCSquad only submits a full squad
+        raise ServiceError(f'Sélection incomplète ({len(names)}/{size}).')
+    need: Dict[str, int] = {}
+    for n in names:
+        need[n] = need.get(n, 0) + 1
+    for n, cnt in need.items():
+        if p.owned.get(n, 0) - cnt < 1:
+            raise ServiceError(f'Utilise uniquement tes doublons (pas assez de {n}).')
+    ok, msg = sbc_mod.validate_selection(names, ch)
+    if not ok:
+        raise ServiceError(msg)
+    for n, cnt in need.items():
+        p.owned[n] -= cnt
+    pack, count = ch.reward_pack
+    rewards = [c.name for c in generate_pack(pack, count)]
+    _add_cards(p, rewards)
+    p.sbc_completed.add(ch.id)
+    _event(p, 'sbc_completed', 1)
+    specials = []
+    for ids, special, _check in sbc_mod.BUNDLES:
+        if special not in p.bundles_granted and all(cid in p.sbc_completed for cid in ids):
+            p.bundles_granted.add(special)
+            _add_cards(p, [special])
+            specials.append(special)
+    return {'rewards': rewards, 'specials': specials}
+
+
+def _op_daily_claim(p: Profile) -> Dict:
+    today = tz.today_str()
+    st = p.daily
+    if st.get('last_claim_date') == today:
+        raise ServiceError('Récompense du jour déjà réclamée.')
+    day = daily_rewards._advance_day(int(st.get('day_index', 0)), st.get('last_claim_date'))
+    rew = content.registry().daily_rewards[max(1, min(28, day)) - 1]
+    kind = rew.get('type')
+    if kind == 'xp':
+        p.xp += max(0, int(rew.get('amount', 0)))
+    elif kind == 'coins':
+        p.coins += max(0, int(rew.get('amount', 0)))
+    elif kind == 'player' and rew.get('name'):
+        _add_cards(p, [str(rew['name'])])
+    st['day_index'] = min(28, day)
+    st['last_claim_date'] = today
+    return {'day': day, 'type': kind, 'amount': int(rew.get('amount', 0)), 'name': rew.get('name')}
+
+
+def _op_pass_claim(p: Profile, level: int, pass_id: str = 'launch') -> Dict:
+    rewards = season_pass.PASSES.get(pass_id)
+    if rewards is None or pass_id not in p.pass_start_xp:
+        raise ServiceError(f'Pass verrouillé: {pass_id}')
+    level = int(level)
+    reward = rewards.get(level)
+    if reward is None:
+        raise ServiceError(f'Pas de récompense au niveau {level}.')
+    claimed = p.pass_claimed.setdefault(pass_id, [])
+    if level in claimed:
+        raise ServiceError('Déjà réclamé.')
+    current = season_pass.get_xp_curve(pass_id).level(p.xp - p.pass_start_xp[pass_id])
+    if level > current:
+        raise ServiceError(f'Niveau {level} non atteint (niveau {current}).')
+    if reward.kind == 'card' and reward.name:
+        _add_cards(p, [reward.name])
+    elif reward.kind == 'coins':
+        p.coins += max(0, reward.amount)
+    elif reward.kind == 'xp':
+        p.xp += max(0, reward.amount)
+    elif reward.kind == 'unlock':
+        if reward.unlock_pass_id in season_pass.PASSES:
+            p.pass_start_xp.setdefault(reward.unlock_pass_id, p.xp)
+        if reward.unlock_feature:
+            p.features[reward.unlock_feature] = True
+    claimed.append(level)
+    claimed.sort()
+    return {'kind': reward.kind, 'amount': reward.amount, 'name': reward.name}
+
+
+def _op_defi_events(p: Profile) -> Dict:
+    return {'events': dict(p.defi_events)}
+
+
+OPS: Dict[str, Callable] = {
+    'profile.get': _op_profile_get,
+    'profile.rename': _op_profile_rename,
+    'collection.get': _op_collection_get,
+    'packs.open': _op_packs_open,
+    'sbc.list': _op_sbc_list,
+    'sbc.submit': _op_sbc_submit,
+    'daily.claim': _op_daily_claim,
+    'pass.claim': _op_pass_claim,
+    'defi.events': _op_defi_events,
+}
+_MUTATING = {'profile.rename', 'packs.open', 'sbc.submit', 'daily.claim', 'pass.claim'}
+
+
+# ---- profile store ---- #
+
+def _write_file(path: Path, data: Dict) -> None:
+    with path.open('w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+
+
+def _write_versioned(path: Path, data: Dict, written: Dict[str, int], guard: threading.Lock) -> bool:
+    """Write a profile snapshot unless a newer version of it already landed.
+
+    Each write goes through its own tmp file; the version check and the
+    replace happen under guard, so concurrent writes of one profile (periodic
+    flush, eviction) can finish in any order without an older one winning.
+    """
+    pid, ver = str(data['id']), int(data.get('version', 0))
+    if written.get(pid, -1) >= ver:
+        return False
+    tmp = path.with_name(f'{path.stem}.{ver}.{threading.get_ident()}.tmp')
+    _write_file(tmp, data)
+    with guard:
+        if written.get(pid, -1) >= ver:
+            tmp.unlink()
+            return False
+        os.replace(tmp, path)
+        written[pid] = ver
+    return True
+
+
+def _read_file(path: Path) -> Optional[Dict]:
+    try:
+        with path.open('r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+class ProfileStore:
+    """Hot profiles in memory, dirty ones persisted by a write-behind task."""
+
+    def __init__(self, root: Path = PROFILES_DIR, max_hot: int = MAX_HOT, flush_interval: float = FLUSH_INTERVAL):
+        self.root = Path(root)
+        self.max_hot = max(1, int(max_hot))
+        self.flush_interval = flush_interval
+        self._hot: 'OrderedDict[str, Profile]' = OrderedDict()
+        self._dirty: Set[str] = set()
+        self._inflight: Dict[str, Tuple[Profile, int]] = {}  # pid -> (profile, running writes)
+        self._pending: Set[asyncio.Task] = set()
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._users: Dict[str, int] = {}  # pid -> requests holding or waiting for its lock
+        self._written: Dict[str, int] = {}  # pid -> last version on disk (writer threads)
+        self._write_guard = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.writes = 0
+        self.loads = 0
+
+    def lock(self, pid: str) -> asyncio.Lock:
+        lk = self._locks.get(pid)
+        if lk is None:
+            lk = self._locks[pid] = asyncio.Lock()
+        return lk
+
+    @contextlib.asynccontextmanager
+    async def hold(self, pid: str) -> AsyncIterator[None]:
+        """Hold the profile lock. Counted from before the wait, so eviction never
+        drops a lock a woken waiter is about to use."""
+        self._users[pid] = self._users.get(pid, 0) + 1
+        try:
+            async with self.lock(pid):
+                yield
+        finally:
+            n = self._users[pid] - 1
+            if n:
+                self._users[pid] = n
+            else:
+                del self._users[pid]
+
+    async def get(self, pid: str) -> Profile:
+        """Profile by id, loading or creating it; call with the profile lock held."""
+        p = self._hot.get(pid)
+        if p is not None:
+            self._hot.move_to_end(pid)
+            return p
+        running = self._inflight.get(pid)
+        if running is not None:
+            # evicted while its write runs: the file may still be older than this
+            p = running[0]
+            self._hot[pid] = p
+            self._dirty.add(pid)
+            self._evict()
+            return p
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(None, _read_file, self.root / f'{pid}.json')
+        self.loads += 1
+        p = Profile.from_dict(data) if isinstance(data, dict) else Profile(id=pid)
+        self._hot[pid] = p
+        self._evict()
+        return p
+
+    def mark_dirty(self, p: Profile) -> None:
+        p.version += 1
+        self._dirty.add(p.id)
+
+    def _evict(self) -> None:
+        while len(self._hot) > self.max_hot:
+            pid, p = next(iter(self._hot.items()))
+            if pid in self._users:
+                self._hot.move_to_end(pid)  # in use: keep it hot a little longer
+                if all(k in self._users for k in self._hot):
+                    return
+                continue
+            del self._hot[pid]
+            self._locks.pop(pid, None)  # no holder and no waiter (see hold)
+            if pid in self._dirty:
+                # written in the background; get() takes it back if asked meanwhile
+                self._dirty.discard(pid)
+                task = asyncio.ensure_future(self._write([p]))
+                self._pending.add(task)
+                task.add_done_callback(self._pending.discard)
+
+    async def _write(self, profiles: List[Profile]) -> None:
+        """Persist profiles; until the write lands get() serves them from memory."""
+        if not profiles:
+            return
+        # snapshot on the loop thread so writes never see a half-applied op
+        snaps = [p.to_dict() for p in profiles]
+        for p in profiles:
+            n = self._inflight.get(p.id, (p, 0))[1]
+            self._inflight[p.id] = (p, n + 1)
+        try:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._write_all, snaps)
+        finally:
+            for p in profiles:
+                q, n = self._inflight[p.id]
+                if n > 1:
+                    self._inflight[p.id] = (q, n - 1)
+                else:
+                    del self._inflight[p.id]
+
+    def _write_all(self, snapshots: List[Dict]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        for d in snapshots:
+            try:
+                if _write_versioned(self.root / f"{d['id']}.json", d, self._written, self._write_guard):
+                    self.writes += 1
+            except Exception:
+                pass
+
+    async def flush(self) -> int:
+        """Write every dirty profile now; returns how many were written."""
+        profiles = [self._hot[pid] for pid in self._dirty if pid in self._hot]
+        self._dirty.clear()
+        await self._write(profiles)
+        return len(profiles)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                pass
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._pending:
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
+        await self.flush()
+
+    def stats(self) -> Dict:
+        return {'hot': len(self._hot), 'dirty': len(self._dirty), 'loads': self.loads, 'writes': self.writes}
+
+
+# ---- service ---- #
+
+class GameService:
+    def __init__(self, store: Optional[ProfileStore] = None):
+        self.store = store or ProfileStore()
+        self.requests = 0
+
+    async def call(self, pid: str, op: str, args: Optional[Dict] = None):
+        """Run one operation for a profile (serialized per profile)."""
+        if not isinstance(pid, str) or not _PROFILE_ID.match(pid):
+            raise ServiceError('Profil invalide.')
+        fn = OPS.get(op)
+        if fn is None:
+            if op == 'service.stats':
+                return self.store.stats()
+            raise ServiceError(f'Opération inconnue: {op}')
+        self.requests += 1
+        async with self.store.hold(pid):
+            p = await self.store.get(pid)
+            try:
+                result = fn(p, **(args or {}))
+            except TypeError as e:
+                raise ServiceError(f'Arguments invalides: {e}')
+            if op in _MUTATING:
+                self.store.mark_dirty(p)
+            return result
+
+    async def _reply(self, writer: asyncio.StreamWriter, req) -> None:
+        rid = req.get('id') if isinstance(req, dict) else None
+        try:
+            if not isinstance(req, dict):
+                raise ServiceError('Requête invalide.')
+            result = await self.call(req.get('profile'), req.get('op'), req.get('args'))
+            out = {'id': rid, 'ok': True, 'result': result}
+        except ServiceError as e:
+            out = {'id': rid, 'ok': False, 'error': str(e)}
+        except Exception as e:
+            out = {'id': rid, 'ok': False, 'error': f'Erreur interne: {e!r}'}
+        writer.write((json.dumps(out, ensure_ascii=False) + '\n').encode('utf-8'))
+        await writer.drain()
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        pending: Set[asyncio.Task] = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    req = json.loads(line)
+                except ValueError:
+                    req = None
+                t = asyncio.ensure_future(self._reply(writer, req))
+                pending.add(t)
+                t.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = HOST, port: int = PORT) -> asyncio.AbstractServer:
+        self.store.start()
+        return await asyncio.start_server(self.handle_client, host, port, limit=1 << 20)
+
+    async def close(self) -> None:
+        await self.store.stop()
+
+
+# ---- client ---- #
+
+class GameClient:
+    """Local client for the line protocol; calls can be pipelined freely."""
+
+    def __init__(self):
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._next = 0
+        self._waiting: Dict[int, asyncio.Future] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def connect(self, host: str = HOST, port: int = PORT) -> 'GameClient':
+        self._reader, self._writer = await asyncio.open_connection(host, port, limit=1 << 20)
+        self._task = asyncio.ensure_future(self._read_loop())
+        return self
+
+    async def _read_loop(self) -> None:
+        try:
+            while True:
+                line = await self._reader.readline()
+                if not line:
+                    break
+                msg = json.loads(line)
+                fut = self._waiting.pop(msg.get('id'), None)
+                if fut is not None and not fut.done():
+                    fut.set_result(msg)
+        finally:
+            for fut in self._waiting.values():
+                if not fut.done():
+                    fut.set_exception(ConnectionError('connexion fermée'))
+            self._waiting.clear()
+
+    async def call(self, profile: str, op: str, **args):
+        self._next += 1
+        rid = self._next
+        fut = asyncio.get_running_loop().create_future()
+        self._waiting[rid] = fut
+        req = {'id': rid, 'profile': profile, 'op': op, 'args': args}
+        self._writer.write((json.dumps(req, ensure_ascii=False) + '\n').encode('utf-8'))
+        await self._writer.drain()
+        msg = await fut
+        if not msg.get('ok'):
+            raise ServiceError(msg.get('error', ''))
+        return msg.get('result')
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    import argparse
+    ap = argparse.ArgumentParser(description='Minefut headless game service')
+    ap.add_argument('--host', default=HOST)
+    ap.add_argument('--port', type=int, default=PORT)
+    ap.add_argument('--root', default=str(PROFILES_DIR), help='profile directory')
+    ap.add_argument('--max-hot', type=int, default=MAX_HOT)
+    args = ap.parse_args(argv)
+
+    async def run():
+        svc = GameService(ProfileStore(Path(args.root), args.max_hot))
+        server = await svc.serve(args.host, args.port)
+        print(f'Minefut service on {args.host}:{args.port} (profiles: {args.root})')
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await svc.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
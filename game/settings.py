@@ -10,6 +10,8 @@ DEFAULTS = {
     'fullscreen': False,
     'volume': 80,
     'effects_quality': 'medium',  # low | medium | high
+    'effects_auto': True,  # let the frame-time governor pick effects_quality
+    'render_scale': 'auto',  # auto | 1.0 | 0.5 (full-screen effect layers)
     'show_fps': False,
     'language': 'fr',
 }
@@ -32,6 +34,10 @@ def load_settings() -> dict:
     # normalize values
     if data.get('effects_quality') not in ('low', 'medium', 'high'):
         data['effects_quality'] = DEFAULTS['effects_quality']
+    if not isinstance(data.get('effects_auto'), bool):
+        data['effects_auto'] = DEFAULTS['effects_auto']
+    if data.get('render_scale') not in ('auto', 1.0, 0.5):
+        data['render_scale'] = DEFAULTS['render_scale']
     if not isinstance(data.get('width'), int) or not isinstance(data.get('height'), int):
         data['width'], data['height'] = DEFAULTS['width'], DEFAULTS['height']
     return _merge(DEFAULTS, data)
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import List, Tuple
+
+# Startup trace.
+# Run with MINEFUT_STARTUP_TRACE=1 (or --startup-trace) to print the time to
+# first frame broken down by phase; screen modules imported later on first
+# push are reported as they load. Phases are marked by main.py and App.
+# BUDGET_MS is the cold-start target.
+
+BUDGET_MS = 1000.0
+
+ENABLED = os.environ.get('MINEFUT_STARTUP_TRACE', '') not in ('', '0') or '--startup-trace' in sys.argv
+
+_T0 = time.perf_counter()
+_marks: List[Tuple[str, float]] = []
+_done = False
+
+
+def mark(phase: str) -> None:
+    """End of a startup phase (no-op once the first frame is out)."""
+    if ENABLED and not _done:
+        _marks.append((phase, time.perf_counter()))
+
+
+@contextmanager
+def timed(label: str):
+    t = time.perf_counter()
+    try:
+        yield
+    finally:
+        if ENABLED:
+            if _done:
+                print(f"[startup] {label}: {(time.perf_counter() - t) * 1000:.1f} ms")
+            else:
+                mark(label)
+
+
+def first_frame() -> None:
+    """Call after the first display flip; prints the report once."""
+    global _done
+    if _done:
+        return
+    mark('first frame')
+    _done = True
+    if ENABLED:
+        print(report())
+
+
+def report() -> str:
+    lines = []
+    prev = _T0
+    for phase, t in _marks:
+        lines.append(f"[startup] {phase:<28} {(t - prev) * 1000:7.1f} ms")
+        prev = t
+    total = (prev - _T0) * 1000
+    verdict = 'ok' if total <= BUDGET_MS else f'over budget ({BUDGET_MS:.0f} ms)'
+    lines.append(f"[startup] {'time to first frame':<28} {total:7.1f} ms  {verdict}")
+    return '\n'.join(lines)
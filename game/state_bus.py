@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Publish/subscribe bus for save-state changes.
+# Save modules emit a topic after every change; screens either subscribe or wrap
+# derived values in Cached so they are recomputed only after a relevant emit,
+# instead of polling the save files from draw().
+
+WALLET = 'wallet'
+XP = 'xp'
+COLLECTION = 'collection'
+PLAYERS = 'players'
+SEASON_PASS = 'season_pass'
+DEFI = 'defi'
+DAILY = 'daily'  # daily reward claimed, or a new day/cycle started
+
+_subscribers: Dict[str, List[Callable[[str, Any], None]]] = {}
+_versions: Dict[str, int] = {}
+
+
+def subscribe(topic: str, fn: Callable[[str, Any], None]) -> None:
+    """Call fn(topic, payload) after each emit on topic."""
+    subs = _subscribers.setdefault(topic, [])
+    if fn not in subs:
+        subs.append(fn)
+
+
+def unsubscribe(topic: str, fn: Callable[[str, Any], None]) -> None:
+    try:
+        _subscribers.get(topic, []).remove(fn)
+    except ValueError:
+        pass
+
+
+def emit(topic: str, payload: Any = None) -> None:
+    """Signal that the state behind topic changed."""
+    _versions[topic] = _versions.get(topic, 0) + 1
+    for fn in list(_subscribers.get(topic, ())):
+        try:
+            fn(topic, payload)
+        except Exception:
+            pass
+
+
+def version(topic: str) -> int:
+    return _versions.get(topic, 0)
+
+
+def versions(*topics: str) -> Tuple[int, ...]:
+    return tuple(_versions.get(t, 0) for t in topics)
+
+
+class Cached:
+    """A derived value recomputed only after one of its topics was emitted."""
+
+    __slots__ = ('_compute', '_topics', '_key', '_value')
+
+    def __init__(self, compute: Callable[[], Any], *topics: str, default: Any = None):
+        self._compute = compute
+        self._topics = topics
+        self._key: Optional[Tuple[int, ...]] = None
+        self._value = default
+
+    def get(self) -> Any:
+        key = versions(*self._topics)
+        if key != self._key:
+            try:
+                self._value = self._compute()
+            except Exception:
+                pass  # keep the last good value
+            self._key = key
+        return self._value
+
+    def invalidate(self) -> None:
+        self._key = None
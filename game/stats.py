@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+from . import db as game_db
+from . import ids
+from . import state_bus
+
+# Collection statistics kept up to date incrementally.
+# Catalog entries are grouped by canonical rarity (ids.canonical_rarity_of).
+# When the collection emits its changed base names (db.mark_collection_changed
+# payload) only the entries of those bases are re-counted; any other write
+# (reset, unknown change) or a catalog rebuild triggers one full recount.
+# Readers get O(1) aggregates.
+
+# canonical rarities that are plain tiers; every other group is a promo
+BASE_TIERS = ('or non rare', 'or rare')
+
+_gen = -1  # ids generation the aggregates were built for
+_stale = True
+_counts: Dict[str, int] = {}  # base name -> owned count
+_base_cards: Dict[str, List[int]] = {}  # base name -> catalog ids
+_base_rating: Dict[str, int] = {}  # base name -> best rating among its entries
+_group_total: Dict[str, int] = {}
+_group_owned: Dict[str, int] = {}
+_owned_total = 0
+_dup_total = 0  # copies beyond the first, over catalog bases
+_fodder_mass = 0  # sum of rating * spare copies
+
+
+def _on_collection(topic: str, changes) -> None:
+    global _stale
+    if _stale or _gen != ids.generation():
+        _stale = True
+        return
+    if not isinstance(changes, dict):
+        _stale = True
+        return
+    for base, new in changes.items():
+        _apply(base, int(new))
+
+
+state_bus.subscribe(state_bus.COLLECTION, _on_collection)
+
+
+def _apply(base: str, new: int) -> None:
+    global _owned_total, _dup_total, _fodder_mass
+    old = _counts.get(base, 0)
+    if new == old:
+        return
+    _counts[base] = new
+    cids = _base_cards.get(base)
+    if not cids:
+        return  # not in the catalog: nothing to aggregate
+    if (old > 0) != (new > 0):
+        d = 1 if new > 0 else -1
+        for cid in cids:
+            g = ids.rarity_label(ids.canonical_rarity_of(cid))
+            _group_owned[g] = _group_owned.get(g, 0) + d
+            _owned_total += d
+    spare = max(0, new - 1) - max(0, old - 1)
+    _dup_total += spare
+    _fodder_mass += spare * _base_rating.get(base, 0)
+
+
+def _rebuild() -> None:
+    global _gen, _stale, _owned_total, _dup_total, _fodder_mass
+    _base_cards.clear()
+    _base_rating.clear()
+    _group_total.clear()
+    _group_owned.clear()
+    _counts.clear()
+    _owned_total = _dup_total = _fodder_mass = 0
+    for cid in range(ids.count()):
+        base = ids.base_of(cid)
+        _base_cards.setdefault(base, []).append(cid)
+        _base_rating[base] = max(_base_rating.get(base, 0), ids.rating_of(cid))
+        g = ids.rarity_label(ids.canonical_rarity_of(cid))
+        _group_total[g] = _group_total.get(g, 0) + 1
+    _gen = ids.generation()
+    _stale = False
+    for base, n in game_db.load_collection().items():
+        _apply(base, int(n))
+
+
+def _ensure() -> None:
+    if _stale or _gen != ids.generation():
+        _rebuild()
+
+
+def invalidate() -> None:
+    global _stale
+    _stale = True
+
+
+# ---- aggregates ---- #
+
+def completion() -> Tuple[int, int]:
+    """(owned catalog entries, total catalog entries)."""
+    _ensure()
+    return _owned_total, ids.count()
+
+
+def completion_pct() -> int:
+    owned, total = completion()
+    return int(owned * 100 / total) if total else 0
+
+
+def group_completion(group: str) -> Tuple[int, int]:
+    _ensure()
+    g = ids.fold(group)
+    return _group_owned.get(g, 0), _group_total.get(g, 0)
+
+
+def groups(promos: Optional[bool] = None) -> List[Tuple[str, int, int]]:
+    """[(group, owned, total)] ordered by size; promos=True/False filters promo groups."""
+    _ensure()
+    out = []
+    for g, total in _group_total.items():
+        is_promo = g not in BASE_TIERS
+        if promos is None or promos == is_promo:
+            out.append((g, _group_owned.get(g, 0), total))
+    out.sort(key=lambda t: (-t[2], t[0]))
+    return out
+
+
+def duplicates() -> int:
+    """Copies available for SBCs (everything beyond the first of each card)."""
+    _ensure()
+    return _dup_total
+
+
+def fodder_rating() -> int:
+    """Total rating mass of the spare copies."""
+    _ensure()
+    return _fodder_mass
+
+
+def owned(base: str) -> int:
+    _ensure()
+    return _counts.get(base, 0)
@@ -1,33 +1,33 @@
-import json
-from pathlib import Path
 from typing import Dict
 
-_WALLET_PATH = Path(__file__).resolve().parents[1] / 'data' / 'wallet.json'
+from . import savefile
+from . import state_bus
+
 _DEFAULT = {"minecoins": 500}
 
 
-def _read() -> Dict:
-    if not _WALLET_PATH.exists():
-        return dict(_DEFAULT)
-    try:
-        with _WALLET_PATH.open('r', encoding='utf-8') as f:
-            data = json.load(f)
-        if not isinstance(data, dict):
-            return dict(_DEFAULT)
-        if 'minecoins' not in data or not isinstance(data['minecoins'], int):
-            data['minecoins'] = _DEFAULT['minecoins']
-        return data
-    except Exception:
+def _migrate_v1(data) -> Dict:
+    # legacy wallet.json: any shape, minecoins possibly missing
+    if not isinstance(data, dict):
         return dict(_DEFAULT)
+    if 'minecoins' not in data or not isinstance(data['minecoins'], int):
+        data['minecoins'] = _DEFAULT['minecoins']
+    return data
+
+
+savefile.register('wallet', _DEFAULT, [_migrate_v1])
+
+
+def _read() -> Dict:
+    return savefile.load('wallet')
 
 
 def _write(data: Dict) -> None:
     try:
-        _WALLET_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with _WALLET_PATH.open('w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        savefile.save('wallet', data)
     except Exception:
         pass
+    state_bus.emit(state_bus.WALLET, data.get('minecoins'))
 
 
 def get_balance() -> int:
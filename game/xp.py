@@ -1,33 +1,64 @@
-import json
-from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
+
+from . import savefile
+from . import state_bus
 
-_PROFILE_PATH = Path(__file__).resolve().parents[1] / 'data' / 'profile.json'
 _DEFAULT = {"xp": 0}
 
+# Bumped on every write so XP-derived values can be memoized
+_version = 0
+# Profile is read once and kept in memory; writes go through _write
+_cache: Optional[Dict] = None
+
+
+def version() -> int:
+    return _version
+
+
+def mark_changed() -> None:
+    global _version
+    _version += 1
+    state_bus.emit(state_bus.XP)
+
+
+def reload() -> None:
+    """Drop the cached profile (e.g. after the save files were reset)."""
+    global _cache
+    _cache = None
+    mark_changed()
+
 
 def _read() -> Dict:
-    if not _PROFILE_PATH.exists():
-        return dict(_DEFAULT)
-    try:
-        with _PROFILE_PATH.open('r', encoding='utf-8') as f:
-            data = json.load(f)
-        if not isinstance(data, dict):
-            return dict(_DEFAULT)
-        if 'xp' not in data or not isinstance(data['xp'], int):
-            data['xp'] = _DEFAULT['xp']
-        return data
-    except Exception:
+    global _cache
+    if _cache is None:
+        _cache = _read_file()
+    return dict(_cache)
+
+
+def _migrate_v1(data) -> Dict:
+    # legacy profile.json: any shape, xp possibly missing
+    if not isinstance(data, dict):
         return dict(_DEFAULT)
+    if 'xp' not in data or not isinstance(data['xp'], int):
+        data['xp'] = _DEFAULT['xp']
+    return data
+
+
+savefile.register('profile', _DEFAULT, [_migrate_v1])
+
+
+def _read_file() -> Dict:
+    return savefile.load('profile')
 
 
 def _write(data: Dict) -> None:
+    global _cache
+    _cache = dict(data)
     try:
-        _PROFILE_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with _PROFILE_PATH.open('w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        savefile.save('profile', data)
     except Exception:
         pass
+    mark_changed()
 
 
 def get_xp() -> int:
@@ -1,4 +1,24 @@
 import sys
+from game import startup
+
+if __name__ == '__main__':
+    # Prefer the new revamped app if enabled; print which path is used for clarity.
+    # Dispatched before the legacy imports and window setup below so the
+    # revamp doesn't pay for them.
+    from game.settings import load_settings
+    s = load_settings()
+    if s.get('ui_revamp', True):
+        try:
+            from game.app import run_app
+            startup.mark('imports')
+            print('[Minefut] Launching revamp UI…')
+            run_app()
+            sys.exit(0)
+        except Exception as e:
+            print('[Minefut] Failed to launch revamp UI, falling back to legacy:', e)
+    else:
+        print('[Minefut] ui_revamp=false → using legacy UI')
+
 import random
 import unicodedata
 import unicodedata
@@ -7,6 +27,9 @@ from game.cards import generate_pack, Card
 from game import db as game_db
 from game import settings as game_settings
 from game import wallet
+from game.particles import ParticlePool
+from game import quality as game_quality
+from game import card_faces
 from pathlib import Path
 import json
 from typing import Optional
@@ -22,6 +45,7 @@ clock = pygame.time.Clock()
 font = pygame.font.SysFont(None, 24)
 large_font = pygame.font.SysFont(None, 36)
 small_font = pygame.font.SysFont(None, 18)
+startup.mark('legacy window')
 
 OPENING = False
 cards = []
@@ -47,10 +71,10 @@ def launch_revamp_sbc():
     Falls back silently if something goes wrong.
     """
     try:
-        from game.app import App, SBC
+        from game.app import App
         print('[Minefut] Launching revamp UI (SBC)…')
         app = App()
-        app.push(SBC(app))
+        app.push('SBC')
         app.run()  # Note: exits process on quit
     except Exception as e:
         print('[Minefut] Failed to launch revamp SBC:', e)
@@ -373,13 +397,38 @@ def get_effects_quality() -> str:
 
 
 def get_quality_factor() -> float:
-    q = get_effects_quality()
-    return 0.6 if q == 'low' else 1.5 if q == 'high' else 1.0
+    return game_quality.preset(get_effects_quality())['factor']
 
 
 def get_beams_count() -> int:
-    q = get_effects_quality()
-    return 4 if q == 'low' else 10 if q == 'high' else 6
+    return game_quality.preset(get_effects_quality())['beams']
+
+
+def get_glow_passes() -> int:
+    return game_quality.preset(get_effects_quality())['glow_passes']
+
+
+def get_smooth_scaling() -> bool:
+    return game_quality.preset(get_effects_quality())['smooth']
+
+
+QUALITY_GOV = game_quality.QualityGovernor(CURRENT_SETTINGS.get('effects_quality', 'medium'), target_ms=1000 / FPS)
+
+
+def tune_effects_quality(frame_ms: float):
+    """Feed one animated frame's work time to the governor (auto mode only)."""
+    if not CURRENT_SETTINGS.get('effects_auto', True):
+        return
+    new_q = QUALITY_GOV.sample(frame_ms)
+    if new_q is None:
+        return
+    CURRENT_SETTINGS['effects_quality'] = new_q
+    try:
+        game_settings.save_settings(CURRENT_SETTINGS)
+    except Exception:
+        pass
+    if PACK_ANIM is not None and not PACK_ANIM.finished:
+        PACK_ANIM.apply_quality()
 
 
 def circle_crop_image(image_surf: pygame.Surface, size: int) -> pygame.Surface:
@@ -394,26 +443,72 @@ def circle_crop_image(image_surf: pygame.Surface, size: int) -> pygame.Surface:
     return result
 
 
-class LightParticle:
-    def __init__(self):
-        import random as _r
-        self.x = _r.uniform(WIDTH * 0.2, WIDTH * 0.8)
-        self.y = HEIGHT + _r.uniform(0, HEIGHT * 0.4)
-        self.vy = -_r.uniform(200, 480)
-        self.size = _r.uniform(2, 5)
-        self.alpha = _r.uniform(140, 220)
-        self.color = (255, 255, _r.randint(120, 220))
+# -------- Pack animation effect layers (built once per resolution/palette) -------- #
+EFFECT_CACHE: dict = {}
 
-    def update(self, dt: float):
-        self.y += self.vy * dt
-        self.alpha = max(0, self.alpha - 90 * dt)
 
-    def draw(self, surf: pygame.Surface):
-        if self.alpha <= 0:
-            return
-        s = pygame.Surface((self.size*2, self.size*2), pygame.SRCALPHA)
-        pygame.draw.circle(s, (self.color[0], self.color[1], self.color[2], int(self.alpha)), (int(self.size), int(self.size)), int(self.size))
-        surf.blit(s, (self.x, self.y), special_flags=pygame.BLEND_PREMULTIPLIED)
+def _fx_gradient(w: int, h: int) -> pygame.Surface:
+    """Vertical tunnel gradient, drawn line by line only once per resolution."""
+    key = ('grad', w, h)
+    s = EFFECT_CACHE.get(key)
+    if s is None:
+        s = pygame.Surface((w, h))
+        for y in range(h):
+            a = int(40 + 60 * (y / h))
+            pygame.draw.line(s, (10, 10, 20 + a//2), (0, y), (w, y))
+        try:
+            s = s.convert()
+        except Exception:
+            pass
+        EFFECT_CACHE[key] = s
+    return s
+
+
+def _fx_rect_sprite(color: tuple, w: int, h: int) -> pygame.Surface:
+    """Solid RGBA sprite (beams, door rims)."""
+    key = ('rect', color, w, h)
+    s = EFFECT_CACHE.get(key)
+    if s is None:
+        s = pygame.Surface((w, h), pygame.SRCALPHA)
+        s.fill(color)
+        EFFECT_CACHE[key] = s
+    return s
+
+
+def _fx_glow_rings(palette: tuple) -> list:
+    """Radial glow rings as [(radius, surface)], outermost first."""
+    key = ('rings', palette)
+    rings = EFFECT_CACHE.get(key)
+    if rings is None:
+        rings = []
+        for r in range(240, 20, -40):
+            g = pygame.Surface((r*2, r*2), pygame.SRCALPHA)
+            alpha = int(18 * (r / 240))
+            pygame.draw.circle(g, (*palette, alpha), (r, r), r)
+            rings.append((r, g))
+        EFFECT_CACHE[key] = rings
+    return rings
+
+
+def _fx_layer(name: str, w: int, h: int, alpha: bool = True) -> pygame.Surface:
+    """Persistent full-screen overlay reused across frames (caller fills it)."""
+    key = ('layer', name, w, h, alpha)
+    s = EFFECT_CACHE.get(key)
+    if s is None:
+        s = pygame.Surface((w, h), pygame.SRCALPHA) if alpha else pygame.Surface((w, h))
+        EFFECT_CACHE[key] = s
+    return s
+
+
+def _fx_solid(color: tuple, w: int, h: int) -> pygame.Surface:
+    """Opaque full-screen color; faded with set_alpha instead of a per-frame RGBA fill."""
+    key = ('solid', color, w, h)
+    s = EFFECT_CACHE.get(key)
+    if s is None:
+        s = pygame.Surface((w, h))
+        s.fill(color)
+        EFFECT_CACHE[key] = s
+    return s
 
 
 class PackAnimation:
@@ -423,7 +518,8 @@ class PackAnimation:
         self.elapsed = 0.0
         self.finished = False
         self.stage = 'intro'  # intro -> tunnel -> doors -> walkout/reveal -> fanout -> done
-        self.particles: list[LightParticle] = []
+        # rising light particles and reveal confetti (flat-array pools)
+        self.particles = ParticlePool('dot', fade=90, blend=pygame.BLEND_PREMULTIPLIED)
         self.flash_alpha = 0
         self.door_progress = 0.0  # 0 closed, 1 open
         self.last_door_progress = 0.0
@@ -454,11 +550,17 @@ class PackAnimation:
         # rarity palette for effects
         top_rarity = getattr(self.top_card, 'rarity', 'Common') if self.top_card else 'Common'
         self.palette = get_rarity_color(top_rarity)
-        self.confetti = []
+        self.confetti = ParticlePool('rect', gravity=300, fade=60, blend=pygame.BLEND_PREMULTIPLIED)
         self._confetti_spawned = False
         # quality settings
+        self.apply_quality()
+
+    def apply_quality(self):
+        """(Re)read the effects level; called again when the governor changes it."""
         self.q_factor = get_quality_factor()
         self.beams = get_beams_count()
+        self.glow_passes = get_glow_passes()
+        self.smooth = get_smooth_scaling()
         self.particle_rate = min(0.45, 0.18 * self.q_factor)
 
     def skip(self):
@@ -472,12 +574,9 @@ class PackAnimation:
         self.elapsed += dt
         # spawn particles during intro/tunnel/doors
         if self.stage in ('intro', 'tunnel', 'doors'):
-            from random import random
-            if random() < self.particle_rate:
-                self.particles.append(LightParticle())
-        for p in self.particles:
-            p.update(dt)
-        self.particles = [p for p in self.particles if p.alpha > 1 and p.y > -40]
+            if random.random() < self.particle_rate:
+                self.spawn_light()
+        self.particles.update(dt, min_alpha=1, top=-40)
 
         if self.stage == 'intro':
             # quick flash-in
@@ -538,9 +637,7 @@ class PackAnimation:
         elif self.stage == 'done':
             self.finished = True
         # update confetti
-        for c in self.confetti:
-            c.update(dt)
-        self.confetti = [c for c in self.confetti if c.alpha > 5 and c.y < HEIGHT + 60]
+        self.confetti.update(dt, min_alpha=5, bottom=HEIGHT + 60)
         # decay impact flash and shake
         if self.impact_flash > 0:
             self.impact_flash = max(0, self.impact_flash - int(300 * dt))
@@ -562,30 +659,39 @@ class PackAnimation:
         else:
             count = base
         count = max(10, int(count * self.q_factor))
+        base_color = self.palette
+        # color variations around base (quantized so sprites are shared)
+        jitter = lambda v: max(0, min(255, int(v + random.uniform(-40, 40)) // 8 * 8))
         for _ in range(count):
-            self.confetti.append(Confetti(self.palette))
+            self.confetti.spawn(
+                random.uniform(WIDTH * 0.2, WIDTH * 0.8), HEIGHT//2 - 60,
+                random.uniform(-120, 120), random.uniform(-50, -200),
+                alpha=200, size=int(random.uniform(4, 8)),
+                color=(jitter(base_color[0]), jitter(base_color[1]), jitter(base_color[2])),
+                angle=random.uniform(0, 360), spin=random.uniform(-360, 360),
+            )
+
+    def spawn_light(self):
+        self.particles.spawn(
+            random.uniform(WIDTH * 0.2, WIDTH * 0.8), HEIGHT + random.uniform(0, HEIGHT * 0.4),
+            0.0, -random.uniform(200, 480),
+            alpha=random.uniform(140, 220), size=int(random.uniform(2, 5)),
+            color=(255, 255, random.randint(120, 220) // 8 * 8),
+        )
 
     def draw_background(self, surf: pygame.Surface):
-        # gradient background
-        grad = pygame.Surface((WIDTH, HEIGHT))
-        for y in range(HEIGHT):
-            a = int(40 + 60 * (y / HEIGHT))
-            color = (10, 10, 20 + a//2)
-            pygame.draw.line(grad, color, (0, y), (WIDTH, y))
-        surf.blit(grad, (0, 0))
+        # gradient background (cached per resolution)
+        surf.blit(_fx_gradient(WIDTH, HEIGHT), (0, 0))
         # moving light beams in tunnel stage
         if self.stage in ('tunnel', 'doors'):
             t = pygame.time.get_ticks() / 1000.0
+            beam = _fx_rect_sprite((*self.palette, 50), 16, HEIGHT)
             for i in range(self.beams):
                 phase = (t * 0.8 + i * 0.3) % 1.0
                 x = int(WIDTH * (0.1 + 0.8 * phase))
-                beam = pygame.Surface((16, HEIGHT), pygame.SRCALPHA)
-                beam_col = (*self.palette, 50)
-                pygame.draw.rect(beam, beam_col, (0, 0, 16, HEIGHT))
                 surf.blit(beam, (x, 0))
         # particles
-        for p in self.particles:
-            p.draw(surf)
+        self.particles.draw(surf)
         # doors (two dark panels opening)
         if self.stage in ('doors', 'walkout', 'reveal', 'fanout', 'done'):
             prog = self.door_progress
@@ -596,29 +702,25 @@ class PackAnimation:
             pygame.draw.rect(surf, (15, 15, 18), left_rect, border_radius=8)
             pygame.draw.rect(surf, (15, 15, 18), right_rect, border_radius=8)
             # door rim glow
-            glow = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            rim_col = (*self.palette, 64)
-            pygame.draw.rect(glow, rim_col, (WIDTH//2 - gap - 8, HEIGHT//2 - 220, 8, 440))
-            pygame.draw.rect(glow, rim_col, (WIDTH//2 + gap, HEIGHT//2 - 220, 8, 440))
-            surf.blit(glow, (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
+            rim = _fx_rect_sprite((*self.palette, 64), 8, 440)
+            surf.blit(rim, (WIDTH//2 - gap - 8, HEIGHT//2 - 220), special_flags=pygame.BLEND_PREMULTIPLIED)
+            surf.blit(rim, (WIDTH//2 + gap, HEIGHT//2 - 220), special_flags=pygame.BLEND_PREMULTIPLIED)
 
         # radial center glow tinted by rarity during reveal/fanout
         if self.stage in ('walkout', 'reveal', 'fanout') and self.top_card:
             cx, cy = WIDTH//2, HEIGHT//2 + 40
-            for r in range(240, 20, -40):
-                g = pygame.Surface((r*2, r*2), pygame.SRCALPHA)
-                alpha = int(18 * (r / 240))
-                pygame.draw.circle(g, (*self.palette, alpha), (r, r), r)
+            # fewer passes on lower quality: the largest rings cost the most fill
+            for r, g in _fx_glow_rings(self.palette)[-self.glow_passes:]:
                 surf.blit(g, (cx - r, cy - r), special_flags=pygame.BLEND_PREMULTIPLIED)
 
         # intro white flash fade
         if self.stage == 'intro' and self.flash_alpha > 0:
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((255, 255, 255, int(self.flash_alpha)))
+            overlay = _fx_solid((255, 255, 255), WIDTH, HEIGHT)
+            overlay.set_alpha(int(self.flash_alpha))
             surf.blit(overlay, (0, 0))
         # impact flash tinted by rarity
         if self.impact_flash > 0:
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+            overlay = _fx_layer('impact', WIDTH, HEIGHT)
             overlay.fill((*self.palette, int(self.impact_flash)))
             surf.blit(overlay, (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
 
@@ -632,10 +734,13 @@ class PackAnimation:
             amp = self.shake_amp * k
             dx = int(math.sin(t * 40.0) * amp)
             dy = int(math.cos(t * 42.0) * amp)
-        # draw background onto temp surface, then blit with offset
-        bg = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        self.draw_background(bg)
-        surf.blit(bg, (dx, dy))
+        # background: straight onto the target, or via a persistent layer when shaking
+        if dx or dy:
+            bg = _fx_layer('background', WIDTH, HEIGHT, alpha=False)
+            self.draw_background(bg)
+            surf.blit(bg, (dx, dy))
+        else:
+            self.draw_background(surf)
         # Walkout silhouette
         if self.stage == 'walkout' and self.top_card:
             t = min(1.0, self.elapsed / 1.0)
@@ -664,7 +769,8 @@ class PackAnimation:
                     self.top_card.x, self.top_card.y = 0, 0
                     draw_card_scaled(self.top_card, card_surf, (tmp_w, tmp_h))
                     self.top_card.x, self.top_card.y = saved_x, saved_y
-                    scaled_surf = pygame.transform.smoothscale(card_surf, (int(tmp_w*scale), int(tmp_h*scale)))
+                    scaler = pygame.transform.smoothscale if self.smooth else pygame.transform.scale
+                    scaled_surf = scaler(card_surf, (int(tmp_w*scale), int(tmp_h*scale)))
                     surf.blit(scaled_surf, (WIDTH//2 - scaled_surf.get_width()//2 + dx, HEIGHT//2 - scaled_surf.get_height()//2 + dy))
             else:
                 # fallback if no image path found
@@ -674,7 +780,8 @@ class PackAnimation:
                 self.top_card.x, self.top_card.y = 0, 0
                 draw_card_scaled(self.top_card, card_surf, (tmp_w, tmp_h))
                 self.top_card.x, self.top_card.y = saved_x, saved_y
-                scaled_surf = pygame.transform.smoothscale(card_surf, (int(tmp_w*scale), int(tmp_h*scale)))
+                scaler = pygame.transform.smoothscale if self.smooth else pygame.transform.scale
+                scaled_surf = scaler(card_surf, (int(tmp_w*scale), int(tmp_h*scale)))
                 surf.blit(scaled_surf, (WIDTH//2 - scaled_surf.get_width()//2 + dx, HEIGHT//2 - scaled_surf.get_height()//2 + dy))
         # Fanout: draw all cards in their positions
         if self.stage in ('fanout', 'done'):
@@ -698,47 +805,20 @@ class PackAnimation:
                     DRAW_OFFSET = (dx, dy)
                     draw_card(c)
                     DRAW_OFFSET = prev_off
-        # draw confetti on a temp surface then blit with offset
-        conf_layer = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        for cf in self.confetti:
-            cf.draw(conf_layer)
-        surf.blit(conf_layer, (dx, dy), special_flags=pygame.BLEND_PREMULTIPLIED)
+        # draw confetti straight onto the target with the shake offset
+        self.confetti.draw(surf, (dx, dy))
         hint = small_font.render('[Echap] pour passer', True, (200, 200, 200))
         surf.blit(hint, (20, HEIGHT - 40))
 
 
-class Confetti:
-    def __init__(self, base_color: tuple[int, int, int]):
-        import random as _r
-        self.x = _r.uniform(WIDTH * 0.2, WIDTH * 0.8)
-        self.y = HEIGHT//2 - 60
-        self.vx = _r.uniform(-120, 120)
-        self.vy = _r.uniform(-50, -200)
-        self.size = _r.uniform(4, 8)
-        # color variations around base
-        jitter = lambda v: max(0, min(255, int(v + _r.uniform(-40, 40))))
-        self.color = (jitter(base_color[0]), jitter(base_color[1]), jitter(base_color[2]))
-        self.alpha = 200
-        self.spin = _r.uniform(-360, 360)
-        self.angle = _r.uniform(0, 360)
-
-    def update(self, dt: float):
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.vy += 300 * dt  # gravity
-        self.angle += self.spin * dt
-        self.alpha = max(0, self.alpha - 60 * dt)
-
-    def draw(self, surf: pygame.Surface):
-        s = pygame.Surface((self.size, self.size*2), pygame.SRCALPHA)
-        s.fill((*self.color, int(self.alpha)))
-        rs = pygame.transform.rotate(s, self.angle)
-        surf.blit(rs, (self.x, self.y), special_flags=pygame.BLEND_PREMULTIPLIED)
-
-
 def draw_card_scaled(card: Card, target_surf: pygame.Surface, size: tuple[int, int]):
     """Draw a card into target_surf with given size (w,h) at top-left."""
     w, h = size
+    face = card_faces.face(('scaled', card_faces.card_key(card)), (w, h), lambda s: _render_card_scaled(card, s, w, h))
+    target_surf.blit(face, (0, 0))
+
+
+def _render_card_scaled(card: Card, target_surf: pygame.Surface, w: int, h: int):
     pygame.draw.rect(target_surf, card.bg_color, (0, 0, w, h), border_radius=16)
     pygame.draw.rect(target_surf, (0, 0, 0), (0, 0, w, h), 2, border_radius=16)
     rarity_color = get_rarity_color(card.rarity)
@@ -818,6 +898,7 @@ def reload_avatar_mapping(clear_cache: bool = True) -> int:
     AVATAR_MAP = load_avatar_mapping() or {}
     if clear_cache:
         AVATAR_CACHE.clear()
+        card_faces.invalidate()
     count = apply_avatar_mapping_to_db(AVATAR_MAP)
     LAST_RELOAD_MSG = f"Images mises à jour: {count}"
     LAST_RELOAD_TIME = time.time()
@@ -840,6 +921,7 @@ def start_opening():
             pass
     # create cinematic animation controller
     PACK_ANIM = PackAnimation(cards)
+    QUALITY_GOV.reset_window()
 
 
 def update_animation(dt):
@@ -857,13 +939,17 @@ def draw_card(card: Card):
     w, h = 160, 220
     x = int(card.x + card.offset_x)
     y = int(card.y)
-    rect = pygame.Rect(x, y, w, h)
+    ox, oy = DRAW_OFFSET
+    # shadow + card face, composed once per card
+    face = card_faces.face(('card', card_faces.card_key(card)), (w + 4, h + 6), lambda s: _render_card_face(card, s, w, h))
+    screen.blit(face, (x + ox, y + oy))
 
+
+def _render_card_face(card: Card, face: pygame.Surface, w: int, h: int):
     # shadow
     shadow = pygame.Surface((w, h), pygame.SRCALPHA)
     pygame.draw.rect(shadow, (0, 0, 0, 60), shadow.get_rect(), border_radius=10)
-    ox, oy = DRAW_OFFSET
-    screen.blit(shadow, (x + 4 + ox, y + 6 + oy))
+    face.blit(shadow, (4, 6))
 
     # card background
     card_surf = pygame.Surface((w, h), pygame.SRCALPHA)
@@ -930,7 +1016,7 @@ def draw_card(card: Card):
     card_surf.blit(name_surf, (8, 108))
     card_surf.blit(rating_surf, (8, 132))
 
-    screen.blit(card_surf, (rect.x + ox, rect.y + oy))
+    face.blit(card_surf, (0, 0))
 
 
 def main():
@@ -941,6 +1027,9 @@ def main():
     running = True
     while running:
         dt = clock.tick(FPS) / 1000.0
+        if STATE == 'game' and PACK_ANIM is not None and not PACK_ANIM.finished:
+            # work time of the previous frame, without the tick() wait
+            tune_effects_quality(clock.get_rawtime())
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
@@ -1017,9 +1106,16 @@ def main():
                     # effects quality button
                     quality_rect = pygame.Rect(220, 260, 240, 48)
                     if quality_rect.collidepoint(event.pos):
+                        # auto -> low -> medium -> high -> auto
                         q = get_effects_quality()
-                        nxt = 'medium' if q == 'low' else 'high' if q == 'medium' else 'low'
-                        CURRENT_SETTINGS['effects_quality'] = nxt
+                        if CURRENT_SETTINGS.get('effects_auto', True):
+                            CURRENT_SETTINGS['effects_auto'] = False
+                            CURRENT_SETTINGS['effects_quality'] = 'low'
+                        elif q == 'high':
+                            CURRENT_SETTINGS['effects_auto'] = True
+                        else:
+                            CURRENT_SETTINGS['effects_quality'] = 'medium' if q == 'low' else 'high'
+                        QUALITY_GOV.level = get_effects_quality()
                         game_settings.save_settings(CURRENT_SETTINGS)
                 else:
                     # handle click on Continue button when animation finished
@@ -1246,6 +1342,8 @@ def main():
             pressed = hovered and pygame.mouse.get_pressed()[0]
             q = get_effects_quality()
             label = 'Qualité effets: ' + ('Bas' if q == 'low' else 'Élevé' if q == 'high' else 'Moyen')
+            if CURRENT_SETTINGS.get('effects_auto', True):
+                label += ' (auto)'
             draw_button_state(quality_rect, label, hovered, pressed)
             draw_wallet_chip()
 
@@ -1286,6 +1384,7 @@ def main():
             screen.blit(x_txt, (close_rect.x + close_rect.w//2 - x_txt.get_width()//2, close_rect.y + close_rect.h//2 - x_txt.get_height()//2))
 
         pygame.display.flip()
+        startup.first_frame()
 
     pygame.quit()
     sys.exit()
@@ -1297,18 +1396,5 @@ def change_state(new_state: str):
 
 
 if __name__ == '__main__':
-    # Prefer the new revamped app if enabled; print which path is used for clarity.
-    from game.settings import load_settings
-    s = load_settings()
-    if s.get('ui_revamp', True):
-        try:
-            from game.app import run_app
-            print('[Minefut] Launching revamp UI…')
-            run_app()
-            sys.exit(0)
-        except Exception as e:
-            print('[Minefut] Failed to launch revamp UI, falling back to legacy:', e)
-    else:
-        print('[Minefut] ui_revamp=false → using legacy UI')
     print('[Minefut] Launching legacy UI…')
     main()
@@ -0,0 +1,47 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from game import assets
+
+_PNG = b'\x89PNG\r\n\x1a\n' + b'\x00\x00\x00\rIHDR' + b'\x00\x00\x00\x02\x00\x00\x00\x03' + b'\x00' * 8
+
+
+class StaleManifestTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        (self.root / 'cards').mkdir()
+        (self.root / 'cards' / 'old.png').write_bytes(_PNG)
+        manifest = self.root / 'data' / 'asset_manifest.json'
+        for p in (mock.patch.object(assets, 'ROOT', self.root),
+                  mock.patch.object(assets, 'MANIFEST_FILE', manifest)):
+            p.start()
+            self.addCleanup(p.stop)
+        self.addCleanup(assets.reload)
+        assets.write_manifest(assets.scan())
+        assets.reload()
+
+    def test_image_added_after_the_manifest_resolves(self):
+        (self.root / 'cards' / 'new.png').write_bytes(_PNG)
+        self.assertEqual(assets.path('cards/new.png'), self.root / 'cards' / 'new.png')
+        self.assertEqual(assets.resolve('new.png', prefixes=('cards/',)), self.root / 'cards' / 'new.png')
+        self.assertEqual(assets.path('cards/old.png'), self.root / 'cards' / 'old.png')
+
+    def test_missing_image_is_probed_once(self):
+        with mock.patch.object(Path, 'is_file', return_value=False) as probe:
+            self.assertIsNone(assets.path('cards/none.png'))
+            self.assertIsNone(assets.path('cards/none.png'))
+        self.assertEqual(probe.call_count, 1)
+
+    def test_manifest_still_wins(self):
+        data = json.loads(assets.MANIFEST_FILE.read_text(encoding='utf-8'))
+        self.assertEqual([e['path'] for e in data['assets']], ['cards/old.png'])
+        self.assertEqual(assets.size('cards/old.png'), (2, 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from unittest import mock
+
+from game import draft, wallet
+
+
+class _Wallet:
+    """In-memory wallet so the tests never touch data/."""
+
+    def __init__(self, coins):
+        self.data = {'minecoins': coins}
+
+    def __enter__(self):
+        self._patches = [
+            mock.patch.object(wallet, '_read', lambda: dict(self.data)),
+            mock.patch.object(wallet, '_write', lambda d: self.data.update(d)),
+        ]
+        for p in self._patches:
+            p.start()
+        return self
+
+    def __exit__(self, *exc):
+        for p in self._patches:
+            p.stop()
+
+    @property
+    def coins(self):
+        return self.data['minecoins']
+
+
+class DraftEntryTest(unittest.TestCase):
+    def test_abandoned_run_costs_the_fee(self):
+        with _Wallet(1000) as w:
+            run = draft.start(seed=1)
+            self.assertIsNotNone(run)
+            run.pick(0)
+            del run  # left the screen mid-draft
+            self.assertEqual(w.coins, 1000 - draft.ENTRY_COST)
+
+    def test_start_refused_without_funds(self):
+        with _Wallet(draft.ENTRY_COST - 1) as w:
+            self.assertIsNone(draft.start(seed=1))
+            self.assertEqual(w.coins, draft.ENTRY_COST - 1)
+
+    def test_play_only_pays_the_reward(self):
+        with _Wallet(1000) as w:
+            run = draft.start(seed=2)
+            while not run.done:
+                run.pick(0)
+            res = run.play()
+            self.assertEqual(w.coins, 1000 - draft.ENTRY_COST + res.coins)
+            self.assertIs(run.play(), res)
+            self.assertEqual(w.coins, 1000 - draft.ENTRY_COST + res.coins)
+
+
+if __name__ == '__main__':
+    unittest.main()
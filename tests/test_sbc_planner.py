@@ -0,0 +1,43 @@
+import random
+import unittest
+from unittest import mock
+
+from game import sbc, sbc_planner
+
+
+def _pool(seed, n=86):
+    rng = random.Random(seed)
+    bases = rng.sample(sorted(sbc.get_catalog_index()), n)
+    return {b: rng.randint(2, 5) for b in bases}
+
+
+class PlannerTest(unittest.TestCase):
+    def setUp(self):
+        p = mock.patch.object(sbc, 'completed_ids', lambda: set())
+        p.start()
+        self.addCleanup(p.stop)
+
+    def test_squads_are_full(self):
+        p = sbc_planner.plan('count', owned=_pool(1), budget=0.2)
+        self.assertTrue(p.assignments)
+        for cid, names in p.assignments:
+            self.assertEqual(len(names), sbc.squad_size(sbc.get_challenge(cid)), cid)
+        self.assertEqual(sbc_planner.check(p, owned=_pool(1)), (True, 'OK'))
+
+    def test_short_squad_rejected(self):
+        ch = sbc.get_challenge('bronze_basic')
+        names = sorted(sbc.get_catalog_index(), key=lambda n: -int(sbc.get_catalog_index()[n].get('rating', 0)))
+        ok, _msg = sbc.validate_selection(names[:ch.requirement.min_count], ch)
+        self.assertFalse(ok)
+
+    def test_value_objective_never_worse(self):
+        for seed in (1, 5):
+            owned = _pool(seed)
+            by_count = sbc_planner.plan('count', owned=owned, budget=0.6)
+            by_value = sbc_planner.plan('value', owned=owned, budget=0.6)
+            self.assertGreaterEqual(by_value.value, by_count.value, seed)
+            self.assertGreaterEqual(by_count.completed, by_value.completed, seed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import asyncio
+import tempfile
+import unittest
+
+from game import sbc
+from game.service import GameService, ProfileStore, ServiceError
+
+
+def _best_names(n):
+    index = sbc.get_catalog_index()
+    return sorted(index, key=lambda name: -int(index[name].get('rating', 0)))[:n]
+
+
+class SBCSubmitTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.service = GameService(ProfileStore(root=tmp.name))
+
+    def _submit(self, names):
+        async def run():
+            p = await self.service.store.get('tester')
+            p.owned = {n: 2 for n in _best_names(sbc.SQUAD_SIZE)}
+            return await self.service.call('tester', 'sbc.submit', {'challenge': 'bronze_basic', 'names': names})
+        return asyncio.run(run())
+
+    def test_under_sized_squad_rejected(self):
+        names = _best_names(sbc.get_challenge('bronze_basic').requirement.min_count)
+        with self.assertRaises(ServiceError) as cm:
+            self._submit(names)
+        self.assertIn(f'/{sbc.SQUAD_SIZE}', str(cm.exception))
+
+    def test_full_squad_accepted(self):
+        res = self._submit(_best_names(sbc.SQUAD_SIZE))
+        self.assertTrue(res['rewards'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+# Regenerates data/asset_manifest.json (see game/assets.py).
+# Run after adding, renaming or replacing images under cards/, Fond/, assets/
+# or data/:  python tools/build_asset_manifest.py
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from game import assets  # noqa: E402
+
+
+def main():
+    entries = assets.scan(with_hash=True)
+    out = assets.write_manifest(entries)
+    total = sum(e['size'] for e in entries)
+    print(f"Wrote {out} with {len(entries)} assets ({total // 1024} KiB).")
+
+
+if __name__ == '__main__':
+    main()
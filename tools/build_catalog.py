@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+# Compiles data/players.json into data/players.cat (see game/catalog.py).
+# The game recompiles a stale catalog on its own; run this after editing
+# players.json by hand to ship the compiled file:  python tools/build_catalog.py
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from game import catalog  # noqa: E402
+
+
+def main():
+    t0 = time.perf_counter()
+    n = catalog.build()
+    ms = (time.perf_counter() - t0) * 1000
+    size = catalog.CATALOG_FILE.stat().st_size
+    print(f"Wrote {catalog.CATALOG_FILE} with {n} players ({size // 1024} KiB) in {ms:.1f} ms.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Load test for the headless service (game/service.py).
+# Starts a service in-process on a scratch profile directory (or connects to a
+# running one with --connect) and drives N simulated players over C client
+# connections: daily claim, pack openings, SBC list and profile reads.
+#   python tools/load_test.py --players 2000 --rounds 5
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from game import service  # noqa: E402
+
+
+async def _player(client: service.GameClient, pid: str, rounds: int, lat: list, errors: list) -> None:
+    rng = random.Random(pid)
+
+    async def call(op, **args):
+        t = time.perf_counter()
+        try:
+            await client.call(pid, op, **args)
+        except service.ServiceError as e:
+            errors.append(str(e))
+        lat.append(time.perf_counter() - t)
+
+    await call('daily.claim')
+    for _ in range(rounds):
+        await call('packs.open', pack='Pack Classique', n=rng.choice((1, 1, 2)))
+        await call('sbc.list')
+        await call('profile.get')
+
+
+def _pct(values, q):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))] * 1000
+
+
+async def run(args) -> None:
+    svc = server = None
+    port = args.port
+    if not args.connect:
+        root = Path(args.root or tempfile.mkdtemp(prefix='minefut_profiles_'))
+        svc = service.GameService(service.ProfileStore(root, args.max_hot))
+        server = await svc.serve(service.HOST, port)
+        print(f'service on port {port}, profiles in {root}')
+    clients = [await service.GameClient().connect(service.HOST, port) for _ in range(args.connections)]
+    lat: list = []
+    errors: list = []
+    t0 = time.perf_counter()
+    await asyncio.gather(*(
+        _player(clients[i % len(clients)], f'{args.prefix}{i}', args.rounds, lat, errors)
+        for i in range(args.players)
+    ))
+    dt = time.perf_counter() - t0
+    stats = await clients[0].call('x', 'service.stats')
+    for c in clients:
+        await c.close()
+    print(f'{len(lat)} requests from {args.players} players in {dt:.2f}s '
+          f'({len(lat) / dt:.0f} req/s), p50 {_pct(lat, 0.5):.1f} ms, p99 {_pct(lat, 0.99):.1f} ms, '
+          f'{len(errors)} rejected')
+    if svc is not None:
+        await svc.close()
+        server.close()
+        await server.wait_closed()
+        print('store', svc.store.stats())
+    else:
+        print('store', stats)
+
+
+def main():
+    ap = argparse.ArgumentParser(description='Minefut service load test')
+    ap.add_argument('--players', type=int, default=1000)
+    ap.add_argument('--rounds', type=int, default=5)
+    ap.add_argument('--connections', type=int, default=8)
+    ap.add_argument('--port', type=int, default=service.PORT)
+    ap.add_argument('--connect', action='store_true', help='use a service already running on --port')
+    ap.add_argument('--root', default='', help='profile directory (default: a temp dir)')
+    ap.add_argument('--max-hot', type=int, default=service.MAX_HOT)
+    ap.add_argument('--prefix', default='load')
+    asyncio.run(run(ap.parse_args()))
+
+
+if __name__ == '__main__':
+    main()